@@ -0,0 +1,4 @@
+"""Micro-benchmarks for the `Result`/`Option` hot paths.
+
+Run `python -m benchmarks --help` from the repository root.
+"""
@@ -0,0 +1,67 @@
+"""Command line entry point: `python -m benchmarks run|compare`."""
+import argparse
+import json
+import sys
+from typing import Any
+
+from benchmarks import harness
+
+
+def _print_record(name: str, record: dict[str, Any]) -> None:
+    print(f"{name:<48}{record['ns_per_op']:>12.1f} ns/op", file=sys.stderr)
+
+
+def _run(args: argparse.Namespace) -> int:
+    report = harness.run(args.filter, progress=None if args.quiet else _print_record)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        return _report_comparison(harness.load_report(args.baseline), report, args.threshold)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    return _report_comparison(harness.load_report(args.baseline), harness.load_report(args.current), args.threshold)
+
+
+def _report_comparison(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> int:
+    rows = harness.compare(baseline, current, threshold)
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else "ok"
+        print(
+            f"{row['name']:<48}{row['baseline_ns']:>12.1f}{row['current_ns']:>12.1f}{row['ratio']:>8.2f}x  {flag}",
+            file=sys.stderr,
+        )
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the suite and emit a JSON report")
+    run.add_argument("-k", "--filter", action="append", default=[], help="only run cases whose name contains this")
+    run.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    run.add_argument("--baseline", help="compare against this report after running")
+    run.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown fraction (default: 0.10)")
+    run.add_argument("-q", "--quiet", action="store_true", help="do not print per-case timings")
+    run.set_defaults(handler=_run)
+
+    cmp = sub.add_parser("compare", help="compare two JSON reports; exit 1 on regression")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown fraction (default: 0.10)")
+    cmp.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    code: int = args.handler(args)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
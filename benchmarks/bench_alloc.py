@@ -0,0 +1,75 @@
+"""Memory and construction-time cost of `Ok`, `Err` and `Option` against the old dataclass layout.
+
+Run with `python benchmarks/bench_alloc.py`.
+"""
+import gc
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rusty_utils import Err, Ok, Option  # noqa: E402
+
+T = TypeVar("T")
+
+N = 1_000_000
+
+
+# The representation used before `__slots__`: frozen dataclasses with a per-instance `__dict__`.
+@dataclass(frozen=True)
+class LegacyOk(Generic[T]):
+    value: T
+
+
+@dataclass(frozen=True)
+class LegacyErr(Generic[T]):
+    value: T
+
+
+@dataclass(frozen=True)
+class LegacyOption(Generic[T]):
+    value: T | None = None
+
+    def __init__(self, value: T | None = None):
+        object.__setattr__(self, 'value', value)
+
+
+def bytes_per_million(factory: Callable[[int], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    items = [factory(i) for i in range(N)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def seconds_per_million(factory: Callable[[int], Any]) -> float:
+    return min(timeit.repeat(lambda: factory(7), number=N, repeat=5))
+
+
+def main() -> None:
+    error = ValueError("boom")
+    cases: list[tuple[str, Callable[[int], Any], Callable[[int], Any]]] = [
+        ("Ok(i)", LegacyOk, Ok),
+        ("Ok(None)", lambda _: LegacyOk(None), lambda _: Ok(None)),
+        ("Err(e)", lambda _: LegacyErr(error), lambda _: Err(error)),
+        ("Option(i)", LegacyOption, Option),
+        ("Option()", lambda _: LegacyOption(), lambda _: Option()),
+    ]
+
+    print(f"{'case':<12}{'legacy MiB':>12}{'slotted MiB':>13}{'legacy s':>10}{'slotted s':>11}")
+    for name, legacy, current in cases:
+        legacy_mem = bytes_per_million(legacy) / 2 ** 20
+        current_mem = bytes_per_million(current) / 2 ** 20
+        legacy_time = seconds_per_million(legacy)
+        current_time = seconds_per_million(current)
+        print(f"{name:<12}{legacy_mem:>12.1f}{current_mem:>13.1f}{legacy_time:>10.3f}{current_time:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""`ResultArray` against a list of `Ok`/`Err` for 100k-element batch operations."""
+from typing import Callable
+
+from benchmarks.harness import case
+from rusty_utils import Err, Ok, Result, ResultArray
+
+N = 100_000
+
+_RESULTS: list[Result[int, Exception]] = [Ok(i) if i % 10 else Err(ValueError(i)) for i in range(N)]
+
+
+def _double(x: int) -> int:
+    return x * 2
+
+
+@case("array.map.list_of_results.100k", number=5)
+def list_map() -> Callable[[], object]:
+    return lambda: [r.map(_double) for r in _RESULTS]
+
+
+@case("array.map.result_array.100k", number=5)
+def array_map() -> Callable[[], object]:
+    arr = ResultArray.from_results(_RESULTS)
+    return lambda: arr.map(_double)
+
+
+@case("array.map_vectorized.result_array.100k", number=5)
+def array_map_vectorized() -> Callable[[], object]:
+    arr = ResultArray.from_results(_RESULTS)
+    return lambda: arr.map(lambda column: column * 2 if not isinstance(column, list) else [x * 2 for x in column],
+                           vectorized=True)
+
+
+@case("array.unwrap_or.list_of_results.100k", number=5)
+def list_unwrap_or() -> Callable[[], object]:
+    return lambda: [r.unwrap_or(0) for r in _RESULTS]
+
+
+@case("array.unwrap_or.result_array.100k", number=5)
+def array_unwrap_or() -> Callable[[], object]:
+    arr = ResultArray.from_results(_RESULTS)
+    return lambda: arr.unwrap_or(0)
+
+
+@case("array.count_ok.list_of_results.100k", number=5)
+def list_count() -> Callable[[], object]:
+    return lambda: sum(1 for r in _RESULTS if r.is_ok())
+
+
+@case("array.count_ok.result_array.100k", number=5)
+def array_count() -> Callable[[], object]:
+    arr = ResultArray.from_results(_RESULTS)
+    return arr.count_ok
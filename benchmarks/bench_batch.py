@@ -0,0 +1,86 @@
+"""100 concurrent single-key lookups against a fake database that charges a fixed 100us per round trip plus 1us
+per key: one round trip per key against `batch_loader` coalescing them. Run the module to print the round-trip
+counts; the timings follow from them."""
+import asyncio
+import threading
+import time
+from typing import Callable
+
+from benchmarks.harness import case
+from rusty_utils import Catch, Result
+from rusty_utils.batch import batch_loader
+
+N = 100
+THREADS = 16
+
+
+class FakeDB:
+    def __init__(self) -> None:
+        self.round_trips = 0
+
+    def fetch(self, keys: list[int]) -> dict[int, int]:
+        self.round_trips += 1
+        end = time.perf_counter() + 100e-6 + 1e-6 * len(keys)
+        while time.perf_counter() < end:
+            pass
+        return {k: k * 2 for k in keys}
+
+
+def _async_per_key(db: FakeDB) -> Callable[[], object]:
+    @Catch(KeyError)
+    async def load(key: int) -> int:
+        return db.fetch([key])[key]
+
+    async def main() -> list[Result[int, KeyError]]:
+        return await asyncio.gather(*(load(i) for i in range(N)))
+
+    return lambda: asyncio.run(main())
+
+
+def _async_batched(db: FakeDB) -> Callable[[], object]:
+    @batch_loader(max_batch_size=N)
+    async def load(keys: list[int]) -> dict[int, int]:
+        return db.fetch(keys)
+
+    async def main() -> list[Result[int, BaseException]]:
+        return await asyncio.gather(*(load(i) for i in range(N)))
+
+    return lambda: asyncio.run(main())
+
+
+def _threads(load: Callable[[int], object]) -> Callable[[], object]:
+    def run() -> None:
+        threads = [threading.Thread(target=lambda i=i: [load(i * N + j) for j in range(N // THREADS)])
+                   for i in range(THREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    return run
+
+
+def _threads_per_key(db: FakeDB) -> Callable[[], object]:
+    return _threads(Catch(KeyError)(lambda key: db.fetch([key])[key]))
+
+
+def _threads_batched(db: FakeDB) -> Callable[[], object]:
+    return _threads(batch_loader(max_batch_size=THREADS, window=0.001)(db.fetch))
+
+
+_CASES = {
+    "async.per_key": _async_per_key,
+    "async.batched": _async_batched,
+    "threads.per_key": _threads_per_key,
+    "threads.batched": _threads_batched,
+}
+
+for _name, _make in _CASES.items():
+    case(f"batch.{_name}.{N}", number=20)(lambda make=_make: make(FakeDB()))
+
+
+if __name__ == "__main__":
+    for name, make in _CASES.items():
+        db = FakeDB()
+        make(db)()
+        print(f"{name:<16} {db.round_trips:>4} round trips")
@@ -0,0 +1,78 @@
+"""Bulk consumption of 10M-element streams of `Result`s and `Option`s, against hand-written `is_ok()` loops.
+
+The sources are lazy `itertools.repeat` streams over shared instances, so the timings measure the bulk
+functions themselves rather than the construction of ten million wrappers.
+"""
+from collections import deque
+from itertools import chain, repeat
+from typing import Callable, Iterator
+
+from benchmarks.harness import case
+from rusty_utils import Err, Ok, Option, Result, collect, collect_options, filter_ok, filter_some, partition
+
+N = 10_000_000
+
+_OK: Result[int, ValueError] = Ok(1)
+_ERR: Result[int, ValueError] = Err(ValueError("boom"))
+
+
+def _all_ok() -> Iterator[Result[int, ValueError]]:
+    return repeat(_OK, N)
+
+
+def _alternating() -> Iterator[Result[int, ValueError]]:
+    return chain.from_iterable(repeat((_OK, _ERR), N // 2))
+
+
+@case("bulk.collect.10m", number=1, repeat=3)
+def bulk_collect() -> Callable[[], object]:
+    return lambda: collect(_all_ok())
+
+
+@case("bulk.collect.loop_is_ok.10m", number=1, repeat=3)
+def loop_collect() -> Callable[[], object]:
+    def run() -> object:
+        values = []
+        for r in _all_ok():
+            if r.is_err():
+                return r
+            values.append(r.unwrap())
+        return Ok(values)
+
+    return run
+
+
+@case("bulk.partition.10m", number=1, repeat=3)
+def bulk_partition() -> Callable[[], object]:
+    return lambda: partition(_alternating())
+
+
+@case("bulk.partition.loop_is_ok.10m", number=1, repeat=3)
+def loop_partition() -> Callable[[], object]:
+    def run() -> object:
+        oks, errs = [], []
+        for r in _alternating():
+            if r.is_ok():
+                oks.append(r.unwrap())
+            else:
+                errs.append(r.unwrap_err())
+        return oks, errs
+
+    return run
+
+
+@case("bulk.filter_ok.10m", number=1, repeat=3)
+def bulk_filter_ok() -> Callable[[], object]:
+    return lambda: deque(filter_ok(_alternating()), maxlen=0)
+
+
+@case("bulk.collect_options.10m", number=1, repeat=3)
+def bulk_collect_options() -> Callable[[], object]:
+    some = Option(1)
+    return lambda: collect_options(repeat(some, N))
+
+
+@case("bulk.filter_some.10m", number=1, repeat=3)
+def bulk_filter_some() -> Callable[[], object]:
+    pair = (Option(1), Option())
+    return lambda: deque(filter_some(chain.from_iterable(repeat(pair, N // 2))), maxlen=0)
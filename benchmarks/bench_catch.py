@@ -0,0 +1,129 @@
+"""Call overhead of `Catch` and `unwrap_or_raise` on the Ok and Err paths, against raw `try/except`, and
+with instrumentation (`metrics=`) enabled."""
+from typing import Callable
+
+from benchmarks.harness import case
+from rusty_utils import Catch, Result
+
+
+def _good() -> int:
+    return 1
+
+
+def _bad() -> int:
+    raise ValueError("boom")
+
+
+@case("catch.ok.decorated")
+def catch_ok() -> Callable[[], object]:
+    return Catch(ValueError)(_good)
+
+
+@case("catch.err.decorated")
+def catch_err() -> Callable[[], object]:
+    return Catch(ValueError)(_bad)
+
+
+def _raw(f: Callable[[], int]) -> Callable[[], object]:
+    def run() -> object:
+        try:
+            return f()
+        except ValueError as e:
+            return e
+
+    return run
+
+
+@case("catch.ok.raw_try")
+def raw_ok() -> Callable[[], object]:
+    return _raw(_good)
+
+
+@case("catch.err.raw_try")
+def raw_err() -> Callable[[], object]:
+    return _raw(_bad)
+
+
+def _propagate(f: Callable[[], int]) -> Callable[[], object]:
+    inner = Catch(ValueError)(f)
+
+    @Catch(ValueError)
+    def outer() -> int:
+        return inner().unwrap_or_raise() + 1
+
+    return outer
+
+
+@case("catch.ok.unwrap_or_raise")
+def propagate_ok() -> Callable[[], object]:
+    return _propagate(_good)
+
+
+@case("catch.err.unwrap_or_raise")
+def propagate_err() -> Callable[[], object]:
+    return _propagate(_bad)
+
+
+@case("catch.err.direct_call")
+def direct_err() -> Callable[[], object]:
+    def run() -> Result[int, ValueError]:
+        return Catch(ValueError, func=_bad)
+
+    return run
+
+
+@case("catch.err.traceback_drop")
+def catch_err_drop() -> Callable[[], object]:
+    return Catch(ValueError, traceback="drop")(_bad)
+
+
+@case("catch.err.traceback_summary")
+def catch_err_summary() -> Callable[[], object]:
+    return Catch(ValueError, traceback="summary")(_bad)
+
+
+def _noop_sink() -> object:
+    from rusty_utils.metrics import CallbackSink
+    return CallbackSink(lambda event: None)
+
+
+@case("catch.ok.metrics")
+def catch_ok_metrics() -> Callable[[], object]:
+    from rusty_utils.metrics import Metrics
+    return Catch(ValueError, metrics=Metrics())(_good)
+
+
+@case("catch.err.metrics")
+def catch_err_metrics() -> Callable[[], object]:
+    from rusty_utils.metrics import Metrics
+    return Catch(ValueError, metrics=Metrics())(_bad)
+
+
+@case("catch.ok.metrics_callback")
+def catch_ok_callback() -> Callable[[], object]:
+    return Catch(ValueError, metrics=_noop_sink())(_good)  # type: ignore[arg-type]
+
+
+@case("catch.ok.with_block")
+def with_ok() -> Callable[[], object]:
+    def run() -> object:
+        with Catch(ValueError) as slot:
+            slot.value = _good()
+        return slot.result
+
+    return run
+
+
+@case("catch.err.with_block")
+def with_err() -> Callable[[], object]:
+    def run() -> object:
+        with Catch(ValueError) as slot:
+            slot.value = _bad()
+        return slot.result
+
+    return run
+
+
+@case("catch.ok.direct_call_args")
+def direct_args_ok() -> Callable[[], object]:
+    return lambda: Catch(ValueError, func=int, args=("1",))
@@ -0,0 +1,59 @@
+"""5- and 20-step combinator chains on `Result` and `Option`, against plain calls and `Optional` checks."""
+from typing import Callable, Optional
+
+from benchmarks.harness import case
+from rusty_utils import Err, Ok, Option, Result
+
+
+def _inc(x: int) -> int:
+    return x + 1
+
+
+def _chain_result(steps: int, start: Result[int, Exception]) -> Callable[[], object]:
+    def run() -> object:
+        r = start
+        for _ in range(steps):
+            r = r.map(_inc)
+        return r
+
+    return run
+
+
+def _chain_raw(steps: int) -> Callable[[], object]:
+    def run() -> object:
+        x = 0
+        for _ in range(steps):
+            x = _inc(x)
+        return x
+
+    return run
+
+
+def _chain_option(steps: int, start: Option[int]) -> Callable[[], object]:
+    def run() -> object:
+        o = start
+        for _ in range(steps):
+            o = o.map(_inc)
+        return o
+
+    return run
+
+
+def _chain_optional(steps: int, start: Optional[int]) -> Callable[[], object]:
+    def run() -> object:
+        x = start
+        for _ in range(steps):
+            x = _inc(x) if x is not None else None
+        return x
+
+    return run
+
+
+for _steps in (5, 20):
+    case(f"chain.result_ok.map{_steps}")(lambda s=_steps: _chain_result(s, Ok(0)))
+    case(f"chain.result_err.map{_steps}")(lambda s=_steps: _chain_result(s, Err(ValueError("boom"))))
+    case(f"chain.raw.call{_steps}")(lambda s=_steps: _chain_raw(s))
+    case(f"chain.option_some.map{_steps}")(lambda s=_steps: _chain_option(s, Option(0)))
+    case(f"chain.option_none.map{_steps}")(lambda s=_steps: _chain_option(s, Option()))
+    case(f"chain.optional_some.check{_steps}")(lambda s=_steps: _chain_optional(s, 0))
+    case(f"chain.optional_none.check{_steps}")(lambda s=_steps: _chain_optional(s, None))
@@ -0,0 +1,36 @@
+"""Construction of `Ok`, `Err` and `Option`, against plain tuples as the floor."""
+from typing import Callable
+
+from benchmarks.harness import case
+from rusty_utils import Err, Ok, Option
+
+
+@case("construction.ok")
+def ok() -> Callable[[], object]:
+    return lambda: Ok(1)
+
+
+@case("construction.ok_none")
+def ok_none() -> Callable[[], object]:
+    return lambda: Ok(None)
+
+
+@case("construction.err")
+def err() -> Callable[[], object]:
+    error = ValueError("boom")
+    return lambda: Err(error)
+
+
+@case("construction.option_some")
+def option_some() -> Callable[[], object]:
+    return lambda: Option(1)
+
+
+@case("construction.option_none")
+def option_none() -> Callable[[], object]:
+    return lambda: Option()
+
+
+@case("construction.raw_tuple")
+def raw_tuple() -> Callable[[], object]:
+    return lambda: (True, 1)
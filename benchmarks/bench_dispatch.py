@@ -0,0 +1,40 @@
+"""Handling an `Err` whose type is last in a list of 8 handlers: an `isinstance` chain, `match_err` with a plain dict
+(one MRO walk per call) and with a reusable `ErrorDispatcher` (one cached lookup per call)."""
+from typing import Any, Callable
+
+from benchmarks.harness import case
+from rusty_utils import Err, ErrorDispatcher, Ok
+
+
+class _Last(KeyError):
+    pass
+
+
+_TYPES: list[type[BaseException]] = [
+    TimeoutError, ConnectionError, PermissionError, FileNotFoundError, ValueError, TypeError, IndexError, _Last,
+]
+_HANDLERS: dict[type[BaseException], Callable[[Any], Any]] = {t: Ok for t in _TYPES}
+_ERR = Err(_Last())
+
+
+@case("dispatch.isinstance_chain")
+def isinstance_chain() -> Callable[[], object]:
+    def run() -> object:
+        e = _ERR.value
+        for t in _TYPES:
+            if isinstance(e, t):
+                return _HANDLERS[t](e)
+        return _ERR
+
+    return run
+
+
+@case("dispatch.match_err.dict")
+def match_err_dict() -> Callable[[], object]:
+    return lambda: _ERR.match_err(_HANDLERS)
+
+
+@case("dispatch.match_err.dispatcher")
+def match_err_dispatcher() -> Callable[[], object]:
+    dispatcher = ErrorDispatcher(_HANDLERS)
+    return lambda: _ERR.match_err(dispatcher)
@@ -0,0 +1,69 @@
+"""A 3-step fallible chain written with `do` (early return by `yield`) against `unwrap_or_raise` inside an outer
+`Catch`, at 0%, 50% and 90% failure rates. The failing step builds a fresh exception per call in both styles."""
+from itertools import cycle
+from typing import Any, Callable, Generator
+
+from benchmarks.harness import case
+from rusty_utils import Catch, Err, Ok, Result
+from rusty_utils.do import do, do_async
+
+
+def _chain(failure_percent: int) -> tuple[Callable[[], object], Callable[[], object]]:
+    pattern = cycle([True] * failure_percent + [False] * (100 - failure_percent))
+
+    def step(x: int) -> Result[int, ValueError]:
+        return Err(ValueError(x)) if next(pattern) else Ok(x + 1)
+
+    @do
+    def with_do() -> Generator[Result[int, ValueError], int, int]:
+        a = yield step(0)
+        b = yield Ok(a + 1)
+        c = yield Ok(b + 1)
+        return c
+
+    @Catch(ValueError)
+    def with_raise() -> int:
+        a = step(0).unwrap_or_raise()
+        b = Ok(a + 1).unwrap_or_raise()
+        return Ok(b + 1).unwrap_or_raise()
+
+    return with_do, with_raise
+
+
+def _async_chain(failure_percent: int) -> tuple[Callable[[], object], Callable[[], object]]:
+    pattern = cycle([True] * failure_percent + [False] * (100 - failure_percent))
+
+    async def step(x: int) -> Result[int, ValueError]:
+        return Err(ValueError(x)) if next(pattern) else Ok(x + 1)
+
+    @do_async
+    def with_do() -> Generator[Any, Any, int]:
+        a = yield step(0)
+        b = yield Ok(a + 1)
+        return b
+
+    @Catch(ValueError)
+    async def with_raise() -> int:
+        a = (await step(0)).unwrap_or_raise()
+        return Ok(a + 1).unwrap_or_raise()
+
+    def drive(f: Callable[[], Any]) -> Callable[[], object]:
+        def run() -> object:
+            coro = f()
+            try:
+                coro.send(None)
+            except StopIteration as stop:
+                return stop.value
+            raise RuntimeError("benchmark coroutine suspended")
+
+        return run
+
+    return drive(with_do), drive(with_raise)
+
+
+for _rate in (0, 50, 90):
+    case(f"do.sync.fail{_rate}.yield")(lambda r=_rate: _chain(r)[0])
+    case(f"do.sync.fail{_rate}.unwrap_or_raise")(lambda r=_rate: _chain(r)[1])
+    case(f"do.async.fail{_rate}.yield")(lambda r=_rate: _async_chain(r)[0])
+    case(f"do.async.fail{_rate}.unwrap_or_raise")(lambda r=_rate: _async_chain(r)[1])
+
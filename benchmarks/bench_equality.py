@@ -0,0 +1,36 @@
+"""`Err.__eq__` with short and large exception messages."""
+from typing import Callable
+
+from benchmarks.harness import case
+from rusty_utils import Err
+
+
+@case("equality.err.short")
+def err_short() -> Callable[[], object]:
+    a, b = Err(ValueError("boom")), Err(ValueError("boom"))
+    return lambda: a == b
+
+
+@case("equality.err.large_message")
+def err_large() -> Callable[[], object]:
+    message = "x" * 10_000
+    a, b = Err(ValueError(message)), Err(ValueError(message))
+    return lambda: a == b
+
+
+@case("equality.err.different_type")
+def err_different_type() -> Callable[[], object]:
+    a, b = Err(ValueError("boom")), Err(KeyError("boom"))
+    return lambda: a == b
+
+
+@case("equality.err.multi_arg")
+def err_multi_arg() -> Callable[[], object]:
+    payload = {"id": 1, "fields": list(range(50))}
+    a, b = Err(ValueError("bad record", payload)), Err(ValueError("bad record", dict(payload)))
+    return lambda: a == b
+
+
+@case("equality.err.dedup_10k")
+def err_dedup() -> Callable[[], object]:
+    return lambda: len(set(Err(ValueError(f"record {i % 100} failed")) for i in range(10_000)))
@@ -0,0 +1,23 @@
+"""Cold import time of `rusty_utils` in a fresh interpreter, against an empty interpreter start."""
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.harness import case
+
+_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+def _spawn(code: str) -> Callable[[], object]:
+    return lambda: subprocess.run([sys.executable, "-S", "-c", code], cwd=_ROOT, check=True)
+
+
+@case("import.rusty_utils", number=10, repeat=3)
+def import_package() -> Callable[[], object]:
+    return _spawn("import rusty_utils")
+
+
+@case("import.interpreter_baseline", number=10, repeat=3)
+def interpreter_baseline() -> Callable[[], object]:
+    return _spawn("pass")
@@ -0,0 +1,34 @@
+"""A 6-stage `Iter` chain over 10k items against the same chain written as nested generator expressions."""
+from typing import Callable
+
+from benchmarks.harness import case
+from rusty_utils import Iter, Nothing, Option, Some
+
+_N = 10_000
+
+
+def _inc(x: int) -> int:
+    return x + 1
+
+
+def _even(x: int) -> Option[int]:
+    return Some(x) if x % 2 == 0 else Nothing()
+
+
+@case("iter.fused.6_stages", number=20)
+def fused() -> Callable[[], object]:
+    chain = Iter(range(_N)).map(_inc).map(_inc).filter_map(_even).map(_inc).map(_inc).take_while(lambda x: x >= 0)
+    return lambda: sum(chain)
+
+
+@case("iter.generators.6_stages", number=20)
+def generators() -> Callable[[], object]:
+    def run() -> object:
+        a = (_inc(x) for x in range(_N))
+        b = (_inc(x) for x in a)
+        c = (o.value for o in (_even(x) for x in b) if o.__class__ is not Nothing)
+        d = (_inc(x) for x in c)
+        e = (_inc(x) for x in d)
+        return sum(x for x in e if x >= 0)
+
+    return run
@@ -0,0 +1,53 @@
+"""Encoding an API response of 10k records whose fields are `Result`s and `Option`s: a recursive `default=`
+hook for `json.dumps` (the usual hand-written approach) against `json_codec.dumps`, plus decoding."""
+import json
+from typing import Any, Callable
+
+from benchmarks.harness import case
+from rusty_utils import Err, Nothing, Ok, Option, Some
+from rusty_utils import json_codec
+
+N = 10_000
+
+_RESPONSE = {"items": [
+    {"id": i, "price": Ok(i * 1.5) if i % 10 else Err(ValueError(f"no price for {i}")),
+     "tags": ["a", "b"], "discount": Some(5) if i % 4 == 0 else Nothing()}
+    for i in range(N)
+]}
+
+
+def _walk(obj: Any) -> Any:
+    if isinstance(obj, Ok):
+        return {"$ok": _walk(obj.value)}
+    if isinstance(obj, Err):
+        return {"$err": _walk(obj.value)}
+    if isinstance(obj, Option):
+        return {"$none": None} if obj.is_none() else {"$some": _walk(obj.value)}
+    if isinstance(obj, BaseException):
+        return {"$exception": {"type": type(obj).__name__, "message": str(obj), "args": list(obj.args)}}
+    if isinstance(obj, dict):
+        return {k: _walk(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_walk(v) for v in obj]
+    return obj
+
+
+@case("json.dumps.recursive_default.10k", number=5)
+def recursive_default() -> Callable[[], object]:
+    return lambda: json.dumps(_RESPONSE, default=_walk)
+
+
+@case("json.dumps.prewalk.10k", number=5)
+def prewalk() -> Callable[[], object]:
+    return lambda: json.dumps(_walk(_RESPONSE))
+
+
+@case("json.dumps.json_codec.10k", number=5)
+def codec_dumps() -> Callable[[], object]:
+    return lambda: json_codec.dumps(_RESPONSE)
+
+
+@case("json.loads.json_codec.10k", number=5)
+def codec_loads() -> Callable[[], object]:
+    data = json_codec.dumps(_RESPONSE)
+    return lambda: json_codec.loads(data)
@@ -0,0 +1,80 @@
+"""`Some`/`Nothing` combinators and `match` dispatch against the previous single-class `Option`, which tested
+`self.value is not None` in every method."""
+from typing import Any, Callable, Generic, TypeVar
+
+from benchmarks.harness import case
+from rusty_utils import Nothing, Option, Some
+
+T = TypeVar("T")
+
+
+# The previous `Option`, reduced to the benchmarked methods: same slotted, `__new__`-built layout.
+class LegacyOption(Generic[T]):
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+
+    value: T | None
+
+    def __new__(cls, value: T | None = None) -> "LegacyOption[T]":
+        if value is None and cls is LegacyOption:
+            return _LEGACY_NONE
+        self = object.__new__(cls)
+        _set_legacy_value(self, value)
+        return self
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(name)
+
+    def map(self, f: Callable[[T], Any]) -> "LegacyOption[Any]":
+        return LegacyOption(f(self.value)) if self.value is not None else _LEGACY_NONE
+
+    def and_then(self, f: Callable[[T], "LegacyOption[Any]"]) -> "LegacyOption[Any]":
+        return f(self.value) if self.value is not None else _LEGACY_NONE
+
+    def unwrap_or(self, default: T) -> T:
+        return self.value if self.value is not None else default
+
+    def is_some(self) -> bool:
+        return self.value is not None
+
+
+_set_legacy_value = LegacyOption.value.__set__  # type: ignore[attr-defined]
+_LEGACY_NONE: LegacyOption[Any] = object.__new__(LegacyOption)
+_set_legacy_value(_LEGACY_NONE, None)
+
+
+def _inc(x: int) -> int:
+    return x + 1
+
+
+_VARIANTS: dict[str, tuple[Any, Any, Callable[[Any], Any]]] = {
+    "variant": (Some(1), Nothing(), Some),
+    "legacy": (LegacyOption(1), _LEGACY_NONE, LegacyOption),
+}
+
+
+def _match_variant(o: Option[int]) -> int:
+    match o:
+        case Some(v):
+            return v
+        case _:
+            return 0
+
+
+def _match_legacy(o: LegacyOption[int]) -> int:
+    match o:
+        case LegacyOption(v) if v is not None:
+            return v
+        case _:
+            return 0
+
+
+for _impl, (_some, _none, _wrap) in _VARIANTS.items():
+    for _state, _opt in (("some", _some), ("none", _none)):
+        case(f"option.{_state}.map.{_impl}")(lambda o=_opt: lambda: o.map(_inc))
+        case(f"option.{_state}.and_then.{_impl}")(lambda o=_opt, w=_wrap: lambda: o.and_then(w))
+        case(f"option.{_state}.unwrap_or.{_impl}")(lambda o=_opt: lambda: o.unwrap_or(0))
+        case(f"option.{_state}.is_some.{_impl}")(lambda o=_opt: o.is_some)
+
+    _match = _match_variant if _impl == "variant" else _match_legacy
+    case(f"option.match.{_impl}")(lambda m=_match, s=_some, n=_none: lambda: (m(s), m(n)))
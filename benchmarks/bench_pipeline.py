@@ -0,0 +1,39 @@
+"""A 4-stage `map/map/and_then/map_err` chain: method calls per `Result` against a compiled `Pipeline`."""
+from typing import Callable
+
+from benchmarks.harness import case
+from rusty_utils import Err, Ok, Pipeline, Result
+
+
+def _inc(x: int) -> int:
+    return x + 1
+
+
+def _check(x: int) -> Result[int, Exception]:
+    return Ok(x) if x >= 0 else Err(ValueError(x))
+
+
+def _wrap(e: Exception) -> Exception:
+    return RuntimeError(e)
+
+
+_BATCH: list[Result[int, Exception]] = [Ok(i) for i in range(1_000)]
+_PIPELINE = Pipeline().map(_inc).map(_inc).and_then(_check).map_err(_wrap)
+
+
+@case("pipeline.method_chain.batch1000")
+def method_chain() -> Callable[[], object]:
+    return lambda: [r.map(_inc).map(_inc).and_then(_check).map_err(_wrap) for r in _BATCH]
+
+
+@case("pipeline.compiled.batch1000")
+def compiled() -> Callable[[], object]:
+    run = _PIPELINE.compile()
+    return lambda: [run(r) for r in _BATCH]
+
+
+@case("pipeline.compiled_values.batch1000")
+def compiled_values() -> Callable[[], object]:
+    values = list(range(1_000))
+    apply = _PIPELINE.apply
+    return lambda: [apply(v) for v in values]
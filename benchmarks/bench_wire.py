@@ -0,0 +1,40 @@
+"""Serialize/deserialize throughput for 100k `Result`s: plain `pickle` of the list against `wire`."""
+import pickle
+from typing import Callable
+
+from benchmarks.harness import case
+from rusty_utils import Err, Ok, Result
+from rusty_utils import wire
+
+N = 100_000
+
+_BATCH: list[Result[object, Exception]] = [
+    Ok(i) if i % 10 else Err(ValueError(f"record {i} is invalid")) for i in range(N)
+]
+
+
+@case("wire.dumps.pickle.100k", number=3)
+def pickle_dumps() -> Callable[[], object]:
+    return lambda: pickle.dumps(_BATCH, pickle.HIGHEST_PROTOCOL)
+
+
+@case("wire.dumps.wire.100k", number=3)
+def wire_dumps() -> Callable[[], object]:
+    return lambda: wire.dumps_many(_BATCH)
+
+
+@case("wire.loads.pickle.100k", number=3)
+def pickle_loads() -> Callable[[], object]:
+    data = pickle.dumps(_BATCH, pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(data)
+
+
+@case("wire.loads.wire.100k", number=3)
+def wire_loads() -> Callable[[], object]:
+    data = wire.dumps_many(_BATCH)
+    return lambda: wire.loads_many(data)
+
+
+if __name__ == "__main__":
+    print(f"pickle: {len(pickle.dumps(_BATCH, pickle.HIGHEST_PROTOCOL)):>10} bytes")
+    print(f"wire:   {len(wire.dumps_many(_BATCH)):>10} bytes")
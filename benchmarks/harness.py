@@ -0,0 +1,133 @@
+"""Case registry, runner and comparison logic for the benchmark suite."""
+import importlib
+import json
+import platform
+import sys
+import timeit
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+# Modules that register cases, imported in order by `load_cases`.
+CASE_MODULES = [
+    "benchmarks.bench_construction",
+    "benchmarks.bench_chains",
+    "benchmarks.bench_catch",
+    "benchmarks.bench_equality",
+    "benchmarks.bench_bulk",
+    "benchmarks.bench_pipeline",
+    "benchmarks.bench_array",
+    "benchmarks.bench_wire",
+    "benchmarks.bench_json",
+    "benchmarks.bench_option",
+    "benchmarks.bench_iter",
+    "benchmarks.bench_do",
+    "benchmarks.bench_dispatch",
+    "benchmarks.bench_batch",
+    "benchmarks.bench_import",
+]
+
+
+@dataclass(frozen=True)
+class Case:
+    """A registered benchmark.
+
+    Attributes:
+        name (str): Dotted identifier, e.g. `catch.ok.decorated`.
+        setup (Callable[[], Callable[[], object]]): Builds the zero-argument callable to time.
+        number (int | None): Calls per repeat, or `None` to calibrate automatically.
+        repeat (int): Number of timed repeats; the fastest one is reported.
+    """
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    number: int | None = None
+    repeat: int = 5
+
+
+_REGISTRY: dict[str, Case] = {}
+
+
+def case(name: str, *, number: int | None = None, repeat: int = 5) -> Callable[
+    [Callable[[], Callable[[], object]]], Callable[[], Callable[[], object]]
+]:
+    """Register a setup function whose return value is the callable to be timed."""
+
+    def register(setup: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+        if name in _REGISTRY:
+            raise ValueError(f"duplicate benchmark case {name!r}")
+        _REGISTRY[name] = Case(name, setup, number, repeat)
+        return setup
+
+    return register
+
+
+def load_cases(patterns: Iterable[str] = ()) -> list[Case]:
+    """Import every case module and return the cases whose name contains any of `patterns`."""
+    for module in CASE_MODULES:
+        importlib.import_module(module)
+    patterns = list(patterns)
+    return [c for name, c in _REGISTRY.items() if not patterns or any(p in name for p in patterns)]
+
+
+def run_case(c: Case) -> dict[str, Any]:
+    """Time a single case and return its machine-readable record (nanoseconds per call)."""
+    stmt = c.setup()
+    timer = timeit.Timer(stmt)
+    number = c.number or max(timer.autorange()[0], 1)
+    timings = timer.repeat(repeat=c.repeat, number=number)
+    per_call = [t / number * 1e9 for t in timings]
+    return {
+        "ns_per_op": min(per_call),
+        "mean_ns_per_op": sum(per_call) / len(per_call),
+        "number": number,
+        "repeat": c.repeat,
+    }
+
+
+def run(patterns: Iterable[str] = (), progress: Callable[[str, dict[str, Any]], None] | None = None) -> dict[str, Any]:
+    """Run the selected cases and return a JSON-serialisable report."""
+    results: dict[str, Any] = {}
+    for c in load_cases(patterns):
+        record = run_case(c)
+        results[c.name] = record
+        if progress is not None:
+            progress(c.name, record)
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def load_report(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        report: dict[str, Any] = json.load(f)
+    return report
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[dict[str, Any]]:
+    """Compare two reports case by case.
+
+    Args:
+        baseline (dict): Report produced by an earlier `run`.
+        current (dict): Report to check against the baseline.
+        threshold (float): Allowed slowdown as a fraction, e.g. `0.1` for 10%.
+
+    Returns:
+        list[dict]: One row per case present in both reports, with `ratio` and `regressed` keys.
+    """
+    rows = []
+    for name, record in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["ns_per_op"]
+        after = record["ns_per_op"]
+        ratio = after / before if before else float("inf")
+        rows.append({
+            "name": name,
+            "baseline_ns": before,
+            "current_ns": after,
+            "ratio": ratio,
+            "regressed": ratio > 1 + threshold,
+        })
+    return rows
@@ -1,7 +1,65 @@
-from rusty_utils.common import UnwrapError
-from rusty_utils.option import Option
-from rusty_utils.result import Result, Ok, Err, Catch
+from typing import TYPE_CHECKING, Any
+
+from rusty_utils.common import UnwrapError, RemoteError, TracebackSummary, ErrorDispatcher
+from rusty_utils.option import Option, Some, Nothing, collect_options, filter_some
+from rusty_utils.result import Result, Ok, Err, Catch, Catcher, collect, partition, filter_ok, filter_err
+
+if TYPE_CHECKING:
+    from rusty_utils.pipeline import Pipeline
+    from rusty_utils.array import ResultArray, OptionArray
+    from rusty_utils.parallel import map_results
+    from rusty_utils.cache import cached, CacheInfo
+    from rusty_utils.policy import Retry, Hedge, RetryBudget, Attempts, CircuitBreaker, CircuitOpenError
+    from rusty_utils.iter import Iter
+    from rusty_utils.do import do, do_async
+    from rusty_utils.gather import gather_results, stream_results
+    from rusty_utils.batch import batch_loader
 
 __all__ = [
-    "UnwrapError", "Result", "Option", "Ok", "Err", "Catch"
+    "UnwrapError", "RemoteError", "TracebackSummary", "ErrorDispatcher",
+    "Result", "Option", "Some", "Nothing", "Ok", "Err", "Catch", "Catcher",
+    "collect", "partition", "filter_ok", "filter_err", "collect_options", "filter_some",
+    "Pipeline", "ResultArray", "OptionArray", "map_results", "cached", "CacheInfo",
+    "Retry", "Hedge", "RetryBudget", "Attempts", "CircuitBreaker", "CircuitOpenError",
+    "Iter", "do", "do_async",
+    "gather_results", "stream_results", "batch_loader",
 ]
+
+# Everything beyond the core types is imported on first access, so `import rusty_utils` does not pull in
+# `concurrent.futures`, `asyncio` or `inspect` for programs that never use those helpers.
+_LAZY = {
+    "Pipeline": "rusty_utils.pipeline",
+    "ResultArray": "rusty_utils.array",
+    "OptionArray": "rusty_utils.array",
+    "map_results": "rusty_utils.parallel",
+    "cached": "rusty_utils.cache",
+    "CacheInfo": "rusty_utils.cache",
+    "Retry": "rusty_utils.policy",
+    "Hedge": "rusty_utils.policy",
+    "RetryBudget": "rusty_utils.policy",
+    "Attempts": "rusty_utils.policy",
+    "CircuitBreaker": "rusty_utils.policy",
+    "CircuitOpenError": "rusty_utils.policy",
+    "Iter": "rusty_utils.iter",
+    "do": "rusty_utils.do",
+    "do_async": "rusty_utils.do",
+    "gather_results": "rusty_utils.gather",
+    "stream_results": "rusty_utils.gather",
+    "batch_loader": "rusty_utils.batch",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
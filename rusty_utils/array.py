@@ -0,0 +1,310 @@
+from itertools import compress
+from typing import Any, Callable, Generic, Iterable, Iterator, Sequence, TypeVar
+
+from rusty_utils.option import Option, Some, Nothing
+from rusty_utils.result import Result, Ok, Err
+
+T = TypeVar("T")
+U = TypeVar("U")
+E = TypeVar("E", bound=BaseException)
+F = TypeVar("F", bound=BaseException)
+
+_NUMERIC = (int, float, bool)
+_numpy: Any = None
+
+
+def _np() -> Any:
+    """Import NumPy on first use, returning `None` if it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            _numpy = False
+        else:
+            _numpy = numpy
+    return _numpy or None
+
+
+def _column(values: list[Any], mask: Any) -> Any:
+    """Store a value column as a NumPy array when every present value is an `int`, every one a `float` or every
+    one a `bool`, otherwise as a list.
+
+    Mixed numeric types stay a list so that `Ok(1)` does not come back as `Ok(1.0)`. Lanes outside `mask` hold
+    `None` in `values`; in a NumPy column they are filled with zero.
+    """
+    np = _np()
+    if np is None or not values:
+        return values
+    present = list(compress(values, mask))
+    kinds = set(map(type, present))
+    if len(kinds) != 1 or kinds.pop() not in _NUMERIC:
+        return values
+    try:
+        column = np.asarray(present)
+        if column.dtype.kind not in "biuf":
+            return values
+        out = np.zeros(len(values), dtype=column.dtype)
+        out[np.asarray(mask, dtype=bool)] = column
+    except (OverflowError, ValueError):
+        return values
+    return out
+
+
+def _mask(flags: Iterable[bool]) -> Any:
+    np = _np()
+    if np is None:
+        return bytearray(flags)
+    return np.fromiter(flags, dtype=bool)
+
+
+def _is_numpy(column: Any) -> bool:
+    return not isinstance(column, (list, bytearray))
+
+
+def _item(column: Any, index: int) -> Any:
+    """Read one lane, converting a NumPy scalar to the Python value `tolist()` would give."""
+    value = column[index]
+    return value.item() if _is_numpy(column) else value
+
+
+class OptionArray(Generic[T]):
+    """
+    A columnar batch of `Option`s: a some-mask plus one value column.
+
+    The mask is a NumPy `bool` array (or a `bytearray` without NumPy) and the value column is a NumPy array
+    when every present value is numeric (empty lanes hold `0`), otherwise a list (empty lanes hold `None`).
+    No per-item `Option` objects are kept.
+    """
+
+    __slots__ = ("_mask", "_values")
+
+    def __init__(self, mask: Any, values: Any) -> None:
+        """Wrap existing columns. Prefer `from_options` or `from_optionals`."""
+        if len(mask) != len(values):
+            raise ValueError("mask and value columns must have the same length")
+        self._mask = mask
+        self._values = values
+
+    @classmethod
+    def from_options(cls, options: Iterable[Option[T]]) -> "OptionArray[T]":
+        """Build an `OptionArray` from `Option`s. `Some(None)` is kept as a present lane."""
+        options = list(options)
+        mask = _mask(o.__class__ is not Nothing for o in options)
+        return cls(mask, _column([o.value for o in options], mask))
+
+    @classmethod
+    def from_optionals(cls, values: Iterable[T | None]) -> "OptionArray[T]":
+        """Build an `OptionArray` from plain values, where `None` marks an empty lane."""
+        column = list(values)
+        mask = _mask(v is not None for v in column)
+        return cls(mask, _column(column, mask))
+
+    def to_options(self) -> list[Option[T]]:
+        """Convert back to a list of `Option`s."""
+        return list(self)
+
+    def __iter__(self) -> Iterator[Option[T]]:
+        values = self._values.tolist() if _is_numpy(self._values) else self._values
+        nothing: Option[T] = Nothing()
+        return (Some(v) if m else nothing for m, v in zip(self._mask, values))
+
+    def __len__(self) -> int:
+        return len(self._mask)
+
+    def __getitem__(self, index: int) -> Option[T]:
+        return Some(_item(self._values, index)) if self._mask[index] else Nothing()
+
+    def __repr__(self) -> str:
+        return f"OptionArray({self.to_options()!r})"
+
+    @property
+    def mask(self) -> Any:
+        """The some-mask: a NumPy `bool` array, or a `bytearray` of `0`/`1` without NumPy."""
+        return self._mask
+
+    @property
+    def values(self) -> Any:
+        """The raw value column, including placeholder entries in empty lanes."""
+        return self._values
+
+    def count_some(self) -> int:
+        """Number of non-empty lanes."""
+        return int(self._mask.sum()) if _is_numpy(self._mask) else sum(self._mask)
+
+    def count_none(self) -> int:
+        """Number of empty lanes."""
+        return len(self) - self.count_some()
+
+    def somes(self) -> Any:
+        """The values of the non-empty lanes, as a NumPy array or a list."""
+        if _is_numpy(self._values):
+            return self._values[self._mask]
+        return list(compress(self._values, self._mask))
+
+    def unwrap_or(self, default: T) -> Any:
+        """The value column with empty lanes filled by `default`."""
+        if _is_numpy(self._values):
+            return _np().where(self._mask, self._values, default)
+        return [v if m else default for m, v in zip(self._mask, self._values)]
+
+    def map(self, f: Callable[[Any], Any], vectorized: bool = False) -> "OptionArray[Any]":
+        """
+        Apply `f` to the non-empty lanes only.
+
+        Args:
+            f (`Callable`): Called per value, or once with the whole column of present values if `vectorized`.
+            vectorized (bool): Pass the present values as one NumPy array (or list) and expect a column back.
+
+        Returns:
+            `OptionArray`: A new array with the same mask.
+        """
+        return OptionArray(self._mask, _map_lanes(self._mask, self._values, f, vectorized))
+
+    def select(self, mask: Any) -> "OptionArray[T]":
+        """Keep only the lanes where `mask` is true."""
+        return OptionArray(_select(self._mask, mask), _select(self._values, mask))
+
+
+class ResultArray(Generic[T, E]):
+    """
+    A columnar batch of `Result`s: an ok-mask, an ok-value column and an error column.
+
+    Storage follows `OptionArray`: a NumPy `bool` mask (or `bytearray`), a NumPy value column when every
+    `Ok` value is numeric (otherwise a list), and a list of errors holding `None` in `Ok` lanes.
+    """
+
+    __slots__ = ("_mask", "_values", "_errors")
+
+    def __init__(self, mask: Any, values: Any, errors: list[E | None]) -> None:
+        """Wrap existing columns. Prefer `from_results`."""
+        if not len(mask) == len(values) == len(errors):
+            raise ValueError("mask, value and error columns must have the same length")
+        self._mask = mask
+        self._values = values
+        self._errors = errors
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result[T, E]]) -> "ResultArray[T, E]":
+        """Build a `ResultArray` from `Ok`/`Err` values."""
+        flags: list[bool] = []
+        values: list[Any] = []
+        errors: list[Any] = []
+        for r in results:
+            if r.__class__ is not Ok and isinstance(r, Err):
+                flags.append(False)
+                values.append(None)
+                errors.append(r.value)
+            else:
+                flags.append(True)
+                values.append(r.value)
+                errors.append(None)
+        mask = _mask(flags)
+        return cls(mask, _column(values, mask), errors)
+
+    def to_results(self) -> list[Result[T, E]]:
+        """Convert back to a list of `Ok`/`Err` values."""
+        return list(self)
+
+    def __iter__(self) -> Iterator[Result[T, E]]:
+        values = self._values.tolist() if _is_numpy(self._values) else self._values
+        errors: list[Any] = self._errors  # `None` in the `Ok` lanes, which the mask skips.
+        return (Ok(v) if m else Err(e) for m, v, e in zip(self._mask, values, errors))
+
+    def __len__(self) -> int:
+        return len(self._mask)
+
+    def __getitem__(self, index: int) -> Result[T, E]:
+        if self._mask[index]:
+            return Ok(_item(self._values, index))
+        return Err(self._errors[index])  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return f"ResultArray({self.to_results()!r})"
+
+    @property
+    def mask(self) -> Any:
+        """The ok-mask: a NumPy `bool` array, or a `bytearray` of `0`/`1` without NumPy."""
+        return self._mask
+
+    @property
+    def values(self) -> Any:
+        """The raw ok-value column, including placeholder entries in `Err` lanes."""
+        return self._values
+
+    def count_ok(self) -> int:
+        """Number of `Ok` lanes."""
+        return int(self._mask.sum()) if _is_numpy(self._mask) else sum(self._mask)
+
+    def count_err(self) -> int:
+        """Number of `Err` lanes."""
+        return len(self) - self.count_ok()
+
+    def oks(self) -> Any:
+        """The `Ok` values, as a NumPy array or a list."""
+        if _is_numpy(self._values):
+            return self._values[self._mask]
+        return list(compress(self._values, self._mask))
+
+    def errs(self) -> list[E]:
+        """The `Err` values, in order."""
+        return [e for m, e in zip(self._mask, self._errors) if not m]  # type: ignore[misc]
+
+    def unwrap_or(self, default: T) -> Any:
+        """The ok-value column with `Err` lanes filled by `default`."""
+        if _is_numpy(self._values):
+            return _np().where(self._mask, self._values, default)
+        return [v if m else default for m, v in zip(self._mask, self._values)]
+
+    def map(self, f: Callable[[Any], Any], vectorized: bool = False) -> "ResultArray[Any, E]":
+        """
+        Apply `f` to the `Ok` lanes only; `Err` lanes are carried over untouched.
+
+        Args:
+            f (Callable): Called per value, or once with the whole column of `Ok` values if `vectorized`.
+            vectorized (bool): Pass the `Ok` values as one NumPy array (or list) and expect a column back.
+
+        Returns:
+            ResultArray: A new array with the same mask and errors.
+        """
+        return ResultArray(self._mask, _map_lanes(self._mask, self._values, f, vectorized), self._errors)
+
+    def map_err(self, f: Callable[[E], F]) -> "ResultArray[T, F]":
+        """Apply `f` to the `Err` lanes only."""
+        errors: list[Any] = self._errors
+        return ResultArray(self._mask, self._values, [e if m else f(e) for m, e in zip(self._mask, errors)])
+
+    def select(self, mask: Any) -> "ResultArray[T, E]":
+        """Keep only the lanes where `mask` is true."""
+        return ResultArray(_select(self._mask, mask), _select(self._values, mask), _select(self._errors, mask))
+
+
+def _select(column: Any, mask: Any) -> Any:
+    if _is_numpy(column):
+        return column[_np().asarray(mask, dtype=bool)]
+    selected = list(compress(column, mask))
+    return bytearray(selected) if isinstance(column, bytearray) else selected
+
+
+def _map_lanes(mask: Any, values: Any, f: Callable[[Any], Any], vectorized: bool) -> Any:
+    if vectorized and _is_numpy(values):
+        present = f(values[mask])
+        np = _np()
+        out = np.zeros(len(values), dtype=np.asarray(present).dtype)
+        out[mask] = present
+        return out
+
+    column = values.tolist() if _is_numpy(values) else list(values)
+    indices = list(compress(range(len(column)), mask))
+    if vectorized:
+        mapped: Sequence[Any] = f([column[i] for i in indices])
+        for i, v in zip(indices, mapped):
+            column[i] = v
+    else:
+        for i in indices:
+            column[i] = f(column[i])
+        if _is_numpy(values):
+            # Lanes outside the mask held numeric placeholders; keep them out of the type check.
+            for i in compress(range(len(column)), (not m for m in mask)):
+                column[i] = None
+    return _column(column, mask)
@@ -0,0 +1,269 @@
+"""Automatic batching of single-key lookups, after the DataLoader pattern.
+
+`@batch_loader()` turns a batch function (`keys -> mapping of key to value or exception`) into a loader whose
+per-key calls return `Result`s. Keys requested close together are coalesced into one call of the batch function
+and the outcome is split back into one `Ok` or `Err` per caller.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Generic, Hashable, Iterable, Mapping, NamedTuple, TypeVar, Union
+
+from rusty_utils.result import Result, Ok, Err, _COROUTINE, _kind
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFn = Callable[[list[K]], Mapping[K, Union[V, BaseException]]]
+AsyncBatchFn = Callable[[list[K]], Awaitable[Mapping[K, Union[V, BaseException]]]]
+
+
+class BatchStats(NamedTuple):
+    """
+    Counters of a loader.
+
+    Attributes:
+        loads (int): Per-key calls.
+        keys (int): Keys sent to the batch function; duplicate keys within a batch are sent once.
+        batches (int): Calls of the batch function, i.e. round trips.
+    """
+    loads: int
+    keys: int
+    batches: int
+
+
+def _split(keys: Iterable[K], outcome: Mapping[K, Any] | BaseException) -> dict[K, Result[Any, BaseException]]:
+    """One `Result` per key from what the batch function returned or raised."""
+    if isinstance(outcome, BaseException):
+        err: Result[Any, BaseException] = Err(outcome)
+        return {key: err for key in keys}
+    results: dict[K, Result[Any, BaseException]] = {}
+    for key in keys:
+        try:
+            value = outcome[key]
+        except KeyError as e:
+            results[key] = Err(e)
+            continue
+        results[key] = Err(value) if isinstance(value, BaseException) else Ok(value)
+    return results
+
+
+class _Batch:
+    """Keys collected by a sync loader, and the event its callers wait on."""
+
+    __slots__ = ("keys", "full", "done", "results", "error")
+
+    def __init__(self) -> None:
+        self.keys: dict[Any, None] = {}
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results: dict[Any, Result[Any, BaseException]] = {}
+        self.error: BaseException | None = None
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesces calls from concurrent threads into batches; see `batch_loader`.
+
+    The first call opens a batch and waits up to `window` seconds for other threads to add keys, or until
+    `max_batch_size` keys are collected, then runs the batch function for everyone. A single thread calling in
+    a loop pays the window on every call and gains nothing; use `load_many` there.
+    """
+
+    __slots__ = ("fn", "max_batch_size", "window", "catch", "_lock", "_open", "_loads", "_keys", "_batches")
+
+    def __init__(
+            self, fn: BatchFn[K, V], max_batch_size: int, window: float, catch: tuple[type[BaseException], ...]
+    ) -> None:
+        self.fn = fn
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.catch = catch
+        self._lock = threading.Lock()
+        self._open: _Batch | None = None
+        self._loads = self._keys = self._batches = 0
+
+    def _fetch(self, keys: list[K]) -> dict[K, Result[V, BaseException]]:
+        with self._lock:
+            self._keys += len(keys)
+            self._batches += 1
+        try:
+            outcome: Any = self.fn(keys)
+        except self.catch as e:
+            outcome = e
+        return _split(keys, outcome)
+
+    def __call__(self, key: K) -> Result[V, BaseException]:
+        """Load one key, returning `Ok(value)` or `Err` with the key's exception (`KeyError` if it is missing)."""
+        hash(key)  # An unhashable key must fail before it can leave a batch without a leader in `_open`.
+        with self._lock:
+            self._loads += 1
+            joined = self._open
+            batch = self._open = _Batch() if joined is None else joined
+            batch.keys[key] = None
+            if len(batch.keys) >= self.max_batch_size:
+                self._open = None
+                batch.full.set()
+        if joined is None:
+            return self._lead(batch, key)
+        batch.done.wait()
+        if batch.error is not None:
+            # A fresh exception per follower: threads re-raising the leader's one would race on its traceback.
+            raise RuntimeError("batch function failed") from batch.error
+        return batch.results[key]
+
+    def _lead(self, batch: _Batch, key: K) -> Result[V, BaseException]:
+        batch.full.wait(self.window)
+        with self._lock:
+            if self._open is batch:
+                self._open = None
+        try:
+            batch.results = self._fetch(list(batch.keys))
+        except BaseException as e:
+            batch.error = e
+            raise
+        finally:
+            batch.done.set()
+        return batch.results[key]
+
+    def load_many(self, keys: Iterable[K]) -> list[Result[V, BaseException]]:
+        """Load `keys` in batches of up to `max_batch_size` right away, without waiting for other threads."""
+        keys = list(keys)
+        with self._lock:
+            self._loads += len(keys)
+        unique = list(dict.fromkeys(keys))
+        results: dict[K, Result[V, BaseException]] = {}
+        for i in range(0, len(unique), self.max_batch_size):
+            results.update(self._fetch(unique[i:i + self.max_batch_size]))
+        return [results[key] for key in keys]
+
+    def stats(self) -> BatchStats:
+        with self._lock:
+            return BatchStats(self._loads, self._keys, self._batches)
+
+
+class AsyncBatchLoader(Generic[K, V]):
+    """
+    Coalesces the calls made during one event loop iteration into batches; see `batch_loader`.
+
+    The first call of an iteration schedules the batch with `loop.call_soon`, so every task that runs before
+    that callback adds its key to the same batch. A batch that reaches `max_batch_size` is sent at once.
+    """
+
+    __slots__ = ("fn", "max_batch_size", "catch", "_open", "_tasks", "_loads", "_keys", "_batches")
+
+    def __init__(self, fn: AsyncBatchFn[K, V], max_batch_size: int, catch: tuple[type[BaseException], ...]) -> None:
+        self.fn = fn
+        self.max_batch_size = max_batch_size
+        self.catch = catch
+        self._open: dict[K, asyncio.Future[Result[V, BaseException]]] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._loads = self._keys = self._batches = 0
+
+    def _dispatch(self, batch: dict[K, Any]) -> None:
+        # Called by `call_soon`, and earlier by `__call__` for a full batch; only the first call sends it.
+        if self._open is not batch:
+            return
+        self._open = None
+        task = asyncio.ensure_future(self._fetch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch: dict[K, Any]) -> None:
+        keys = list(batch)
+        self._keys += len(keys)
+        self._batches += 1
+        try:
+            try:
+                outcome: Any = await self.fn(keys)
+            except self.catch as e:
+                outcome = e
+            # Inside the outer `try`, so a return value `_split` cannot read fails the callers rather than
+            # leaving them waiting.
+            results = _split(keys, outcome)
+        except BaseException as e:
+            for future in batch.values():
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    future.exception()  # Mark retrieved so a cancelled caller does not log a warning.
+            return
+        for key, result in results.items():
+            future = batch[key]
+            if not future.done():
+                future.set_result(result)
+
+    async def __call__(self, key: K) -> Result[V, BaseException]:
+        """Load one key, returning `Ok(value)` or `Err` with the key's exception (`KeyError` if it is missing)."""
+        hash(key)  # An unhashable key must fail before it can open a batch that is sent empty.
+        self._loads += 1
+        loop = asyncio.get_running_loop()
+        batch = self._open
+        if batch is None:
+            batch = self._open = {}
+            loop.call_soon(self._dispatch, batch)
+        future = batch.get(key)
+        if future is None:
+            future = batch[key] = loop.create_future()
+            if len(batch) >= self.max_batch_size:
+                self._dispatch(batch)
+        # The shield keeps a cancelled caller from cancelling the result for other callers of the same key.
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[Result[V, BaseException]]:
+        """Load `keys`, coalesced with any other calls of the same iteration."""
+        return list(await asyncio.gather(*(self(key) for key in keys)))
+
+    def stats(self) -> BatchStats:
+        return BatchStats(self._loads, self._keys, self._batches)
+
+
+def batch_loader(
+        max_batch_size: int = 100,
+        window: float = 0.002,
+        catch: tuple[type[BaseException], ...] = (Exception,),
+) -> Callable[[Any], Any]:
+    """
+    Turn a batch function into a per-key loader that returns `Result`s.
+
+    The batch function takes a list of distinct keys and returns a mapping from key to value, or to an exception
+    for a key that failed. The loader is called with one key and returns `Ok(value)`, `Err(exception)`, or
+    `Err(KeyError(key))` when the mapping lacks the key. If the batch function raises one of `catch`, every key of
+    the batch gets that `Err`. Other exceptions propagate: a threaded loader raises them in the thread that ran
+    the batch and a `RuntimeError` chained from them in the others.
+
+    A coroutine batch function gives an `AsyncBatchLoader`, which coalesces the calls made in one event loop
+    iteration (for example by `asyncio.gather`). A plain one gives a thread-safe `BatchLoader`, which coalesces
+    calls from different threads arriving within `window` seconds. Either way a batch holds at most
+    `max_batch_size` keys, and `stats()` counts loads against round trips.
+
+    Example:
+        >>> @batch_loader(max_batch_size=500)
+        ... async def load_users(ids: list[int]) -> dict[int, User]:
+        ...     rows = await db.fetch("SELECT * FROM users WHERE id = ANY($1)", ids)
+        ...     return {row["id"]: User(**row) for row in rows}
+        >>> alice, bob = await asyncio.gather(load_users(1), load_users(2))  # one query
+
+    Args:
+        max_batch_size (int): Maximum number of keys per call of the batch function.
+        window (float): How long a threaded batch stays open for more keys, in seconds.
+        catch (tuple[type[BaseException], ...]): Exceptions of the batch function turned into per-key `Err`s.
+
+    Returns:
+        The decorator.
+    """
+    if max_batch_size < 1:
+        raise ValueError("max_batch_size must be at least 1")
+    if window < 0:
+        raise ValueError("window must be non-negative")
+    if not catch or not all(isinstance(e, type) and issubclass(e, BaseException) for e in catch):
+        raise TypeError("batch_loader requires at least one exception type in `catch`")
+
+    def decorator(fn: Any) -> Any:
+        if _kind(fn) == _COROUTINE:
+            return AsyncBatchLoader(fn, max_batch_size, catch)
+        return BatchLoader(fn, max_batch_size, window, catch)
+
+    return decorator
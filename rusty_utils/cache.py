@@ -0,0 +1,240 @@
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, NamedTuple, TypeVar, TYPE_CHECKING
+
+from rusty_utils.result import Err
+
+if TYPE_CHECKING:
+    import asyncio
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_KWARGS_MARK = object()
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `cached` function.
+
+    Attributes:
+        hits (int): Calls answered from the cache.
+        misses (int): Calls that ran the function.
+        joins (int): Calls that waited for an identical call already in flight instead of running the function.
+        evictions (int): Entries dropped to stay within `maxsize`.
+        expirations (int): Entries dropped because their TTL ran out.
+        currsize (int): Entries currently stored.
+        maxsize (int | None): The configured bound.
+    """
+    hits: int
+    misses: int
+    joins: int
+    evictions: int
+    expirations: int
+    currsize: int
+    maxsize: int | None
+
+
+class _Flight:
+    """One in-progress computation that concurrent callers for the same key wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+    def wait(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            # A fresh exception per follower: threads re-raising the leader's one would race on its traceback.
+            raise RuntimeError("cached call failed") from self.error
+        return self.result
+
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    if not kwargs:
+        key: Hashable = args[0] if len(args) == 1 and type(args[0]) in {int, str} else args
+        return key
+    return args + (_KWARGS_MARK,) + tuple(kwargs.items())
+
+
+def cached(
+        maxsize: int | None = 128,
+        ttl: float | None = None,
+        err_ttl: float | None = None,
+        no_cache: tuple[type[BaseException], ...] = (),
+        timer: Callable[[], float] = time.monotonic,
+) -> Callable[[F], F]:
+    """
+    A memoizing decorator for functions that return a `Result`, typically ones decorated with `Catch`.
+
+    `Ok` results are kept for `ttl` seconds and `Err` results for the separate `err_ttl` (negative caching).
+    Entries are evicted least-recently-used once there are more than `maxsize`. Concurrent calls with the
+    same arguments share a single computation (single flight) rather than each running the function. An
+    exception raised by the function itself is never cached. It propagates to the caller that ran the function
+    and to awaiting coroutines as is; threads that joined the call get a `RuntimeError` chained from it.
+
+    Works on both plain and coroutine functions. The wrapper gains `cache_info()` and `cache_clear()`.
+
+    Args:
+        maxsize (int | None): Maximum number of entries, or `None` for unbounded.
+        ttl (float | None): Lifetime of `Ok` entries in seconds, or `None` to keep them until evicted. A lifetime
+            of zero or less is not cached at all.
+        err_ttl (float | None): Lifetime of `Err` entries in seconds, or `None` to never cache `Err`s.
+        no_cache (tuple[type[BaseException], ...]): `Err`s holding one of these exception types are never cached.
+        timer (Callable[[], float]): Clock used for TTLs.
+
+    Returns:
+        The decorator.
+    """
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be at least 1 or None")
+
+    def lifetime(result: Any) -> float | None:
+        # A lifetime of zero or less is never stored.
+        if isinstance(result, Err):
+            if err_ttl is None or isinstance(result.value, no_cache):
+                return 0.0
+            return err_ttl
+        return ttl
+
+    def decorator(fn: F) -> F:
+        cache = _ResultCache(maxsize, lifetime, timer)
+        wrapper: Any
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await cache.call_async(fn, args, kwargs)
+
+            wrapper = async_wrapper
+        else:
+            @wraps(fn)
+            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return cache.call(fn, args, kwargs)
+
+            wrapper = sync_wrapper
+
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper  # type: ignore[no-any-return]
+
+    return decorator
+
+
+class _ResultCache:
+    """The LRU/TTL store and single-flight bookkeeping behind `cached`."""
+
+    def __init__(self, maxsize: int | None, lifetime: Callable[[Any], float | None], timer: Callable[[], float]):
+        self.maxsize = maxsize
+        self.lifetime = lifetime
+        self.timer = timer
+        self.lock = threading.Lock()
+        self.data: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self.flights: dict[Hashable, _Flight] = {}
+        self.tasks: dict[Hashable, asyncio.Task[Any]] = {}
+        self.hits = self.misses = self.joins = self.evictions = self.expirations = 0
+
+    def _lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """Return `(True, result)` on a live hit. Must be called with the lock held."""
+        entry = self.data.get(key)
+        if entry is None:
+            return False, None
+        result, expires = entry
+        if expires is not None and expires <= self.timer():
+            del self.data[key]
+            self.expirations += 1
+            return False, None
+        self.data.move_to_end(key)
+        self.hits += 1
+        return True, result
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        """Must be called with the lock held."""
+        lifetime = self.lifetime(result)
+        if lifetime is not None and lifetime <= 0:
+            return
+        self.data[key] = (result, None if lifetime is None else self.timer() + lifetime)
+        self.data.move_to_end(key)
+        if self.maxsize is not None and len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def call(self, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        key = _make_key(args, kwargs)
+        with self.lock:
+            hit, result = self._lookup(key)
+            if hit:
+                return result
+            joined = self.flights.get(key)
+            if joined is None:
+                flight = self.flights[key] = _Flight()
+                self.misses += 1
+            else:
+                self.joins += 1
+        if joined is not None:
+            return joined.wait()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            with self.lock:
+                del self.flights[key]
+            flight.error = e
+            flight.done.set()
+            raise
+        with self.lock:
+            del self.flights[key]
+            self._store(key, result)
+        flight.result = result
+        flight.done.set()
+        return result
+
+    async def call_async(self, fn: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        import asyncio
+
+        key = _make_key(args, kwargs)
+        with self.lock:
+            hit, result = self._lookup(key)
+            if hit:
+                return result
+            task = self.tasks.get(key)
+            if task is None:
+                # The computation runs as its own task, so a cancelled first caller does not cancel it for
+                # the callers that joined; the shield below keeps any caller from cancelling it.
+                task = self.tasks[key] = asyncio.ensure_future(self._fly(key, fn(*args, **kwargs)))
+                task.add_done_callback(_retrieve)
+                self.misses += 1
+            else:
+                self.joins += 1
+        return await asyncio.shield(task)
+
+    async def _fly(self, key: Hashable, call: Awaitable[Any]) -> Any:
+        try:
+            result = await call
+        except BaseException:
+            with self.lock:
+                del self.tasks[key]
+            raise
+        with self.lock:
+            del self.tasks[key]
+            self._store(key, result)
+        return result
+
+    def info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(
+                self.hits, self.misses, self.joins, self.evictions, self.expirations, len(self.data), self.maxsize
+            )
+
+    def clear(self) -> None:
+        with self.lock:
+            self.data.clear()
+            self.hits = self.misses = self.joins = self.evictions = self.expirations = 0
+
+
+def _retrieve(task: "asyncio.Task[Any]") -> None:
+    # Mark the outcome retrieved, so a flight whose callers were all cancelled does not log a warning.
+    if not task.cancelled():
+        task.exception()
@@ -1,3 +1,182 @@
+from typing import Any, Callable, Mapping, Union
+
+
 class UnwrapError(Exception):
     """Custom exception raised when an invalid 'unwrap' or 'unwrap_err' is called on a Result object."""
     pass
+
+
+class RemoteError(Exception):
+    """Stands in for a serialized exception whose type cannot be imported or rebuilt where it is decoded.
+
+    Attributes:
+        type_name (str): The original exception type as `module:qualname`.
+        args (tuple): The original exception arguments.
+        remote_traceback (str | None): The original formatted traceback, if it was encoded.
+    """
+
+    def __init__(self, type_name: str, args: tuple[Any, ...], remote_traceback: str | None = None):
+        super().__init__(*args)
+        self.type_name = type_name
+        self.remote_traceback = remote_traceback
+
+    def __str__(self) -> str:
+        return f"{self.type_name}{self.args!r}"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return RemoteError, (self.type_name, self.args, self.remote_traceback)
+
+
+def reduce_exception(exc: BaseException) -> tuple[type[BaseException], tuple[Any, ...], dict[str, Any] | None]:
+    """Split an exception into its type, `args` and instance `__dict__`, dropping the traceback and chain."""
+    state = exc.__dict__
+    return type(exc), exc.args, dict(state) if state else None
+
+
+def rebuild_exception(
+        cls: type[BaseException], args: tuple[Any, ...], state: dict[str, Any] | None = None
+) -> BaseException:
+    """Inverse of `reduce_exception`.
+
+    The instance is created with `cls.__new__`, which sets `args` without calling `__init__`, so exceptions
+    whose `__init__` signature differs from their `args` still round-trip.
+    """
+    try:
+        exc = cls.__new__(cls, *args)
+    except TypeError:
+        exc = cls(*args)
+    if state:
+        exc.__dict__.update(state)
+    return exc
+
+
+class TracebackSummary:
+    """A frame-free record of where an exception was raised, formatted only on demand.
+
+    Only `(filename, lineno, function name)` per frame is kept, so holding a summary does not keep the
+    failing call stack or its local variables alive. Source lines and the exception message are only
+    looked up when `format` is called.
+
+    Attributes:
+        exception (BaseException): The summarized exception.
+        frames (tuple[tuple[str, int, str], ...]): Filename, line number and function name, outermost first.
+    """
+
+    __slots__ = ("exception", "frames", "_text")
+
+    def __init__(self, exception: BaseException, frames: tuple[tuple[str, int, str], ...]):
+        self.exception = exception
+        self.frames = frames
+        self._text: str | None = None
+
+    @classmethod
+    def capture(cls, exc: BaseException) -> "TracebackSummary":
+        """Record the frames of `exc.__traceback__` without formatting them."""
+        frames = []
+        tb = exc.__traceback__
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            frames.append((code.co_filename, tb.tb_lineno, code.co_name))
+            tb = tb.tb_next
+        return cls(exc, tuple(frames))
+
+    def format(self) -> str:
+        """Format the summary like a standard traceback. The text is cached after the first call."""
+        if self._text is None:
+            from linecache import getline
+
+            lines = ["Traceback (most recent call last):\n"]
+            for filename, lineno, name in self.frames:
+                lines.append(f'  File "{filename}", line {lineno}, in {name}\n')
+                source = getline(filename, lineno).strip()
+                if source:
+                    lines.append(f"    {source}\n")
+            exc_type = type(self.exception).__qualname__
+            message = str(self.exception)
+            lines.append(f"{exc_type}: {message}\n" if message else f"{exc_type}\n")
+            self._text = "".join(lines)
+        return self._text
+
+    def __str__(self) -> str:
+        return self.format()
+
+    def __repr__(self) -> str:
+        return f"TracebackSummary({type(self.exception).__qualname__}, {len(self.frames)} frames)"
+
+
+def release_traceback(exc: BaseException) -> None:
+    """Drop the traceback of `exc` and of every exception chained to it, releasing their frames."""
+    seen: set[int] = set()
+    pending: list[BaseException | None] = [exc]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        current.__traceback__ = None
+        pending.append(current.__cause__)
+        pending.append(current.__context__)
+
+
+class ErrorDispatcher:
+    """
+    A reusable mapping from exception types to handlers, resolved through each exception class's MRO.
+
+    The handler for a concrete exception class is looked up once, by walking its `__mro__` and taking the
+    first class that has a handler (so the most specific registered type wins, whatever the mapping's
+    order), and then cached. Every later error of that class costs a single dict lookup instead of a
+    linear `isinstance` scan.
+
+    Example:
+        >>> on_error = ErrorDispatcher({TimeoutError: retry_later, KeyError: lambda e: Ok(None)})
+        >>> results = [r.match_err(on_error) for r in results]
+
+    Args:
+        handlers (Mapping[type[BaseException], Callable[[Any], Any]]): Handler per exception type.
+    """
+
+    __slots__ = ("_handlers", "_cache")
+
+    def __init__(self, handlers: Mapping[type[BaseException], Callable[[Any], Any]]) -> None:
+        for cls in handlers:
+            if not (isinstance(cls, type) and issubclass(cls, BaseException)):
+                raise TypeError(f"handler keys must be exception types, not {cls!r}")
+        self._handlers = dict(handlers)
+        self._cache: dict[type, Callable[[Any], Any] | None] = {}
+
+    def resolve(self, cls: type) -> Callable[[Any], Any] | None:
+        """The handler for instances of `cls`, or `None` if no registered type is in its MRO."""
+        try:
+            return self._cache[cls]
+        except KeyError:
+            handler = _walk_mro(self._handlers, cls)
+            self._cache[cls] = handler
+            return handler
+
+    def __call__(self, error: BaseException) -> Any:
+        """Call the handler for `error`. Raises `error` itself if no handler matches."""
+        handler = self.resolve(error.__class__)
+        if handler is None:
+            raise error
+        return handler(error)
+
+    def __repr__(self) -> str:
+        return f"ErrorDispatcher({', '.join(cls.__name__ for cls in self._handlers)})"
+
+
+Handlers = Union[ErrorDispatcher, Mapping[type[BaseException], Callable[[Any], Any]]]
+
+
+def _walk_mro(handlers: Mapping[type, Callable[[Any], Any]], cls: type) -> Callable[[Any], Any] | None:
+    for klass in cls.__mro__:
+        handler = handlers.get(klass)
+        if handler is not None:
+            return handler
+    return None
+
+
+def resolve_handler(handlers: Handlers, cls: type) -> Callable[[Any], Any] | None:
+    """Find the handler for `cls` in an `ErrorDispatcher` (cached) or a plain mapping (one MRO walk)."""
+    if isinstance(handlers, ErrorDispatcher):
+        return handlers.resolve(cls)
+    return _walk_mro(handlers, cls)
@@ -0,0 +1,262 @@
+"""Streaming dead-letter routing for `Result`s.
+
+`DeadLetter.route(results)` passes `Ok` values downstream and hands each `Err` to a background thread that
+writes them to a sink in batches. The hand-off queue is bounded, so a slow sink slows the producer down
+instead of letting dead letters pile up in memory.
+"""
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Protocol, TypeVar
+
+from rusty_utils.result import Result, Ok, Err
+
+T = TypeVar("T")
+
+_STOP = object()
+
+
+class DeadLetterRecord(NamedTuple):
+    """
+    One `Err` routed to a dead-letter sink.
+
+    Attributes:
+        position (int): Position of the `Err` in the routed stream, counting `Ok`s too.
+        error (Any): The `Err` value, usually an exception.
+        timestamp (float): `time.time()` when the `Err` was routed.
+    """
+    position: int
+    error: Any
+    timestamp: float
+
+    def to_json(self) -> dict[str, Any]:
+        error = self.error
+        cls = type(error)
+        return {
+            "position": self.position,
+            "timestamp": self.timestamp,
+            "type": f"{cls.__module__}:{cls.__qualname__}",
+            "message": str(error),
+            "args": [repr(a) for a in error.args] if isinstance(error, BaseException) else [],
+        }
+
+
+class Sink(Protocol):
+    """Where a `DeadLetter` writes its records. `write` is only ever called from the writer thread."""
+
+    def write(self, records: list[DeadLetterRecord]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class RingSink:
+    """Keeps the last `capacity` records in memory."""
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self._records: deque[DeadLetterRecord] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def write(self, records: list[DeadLetterRecord]) -> None:
+        with self._lock:
+            self._records.extend(records)
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def records(self) -> list[DeadLetterRecord]:
+        """A copy of the retained records, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+
+class JsonLinesSink:
+    """Appends one JSON object per record to a file (see `DeadLetterRecord.to_json`), flushing per batch."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, records: list[DeadLetterRecord]) -> None:
+        self._file.write("".join(json.dumps(r.to_json()) + "\n" for r in records))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class BatchCallbackSink:
+    """Calls `callback` with each batch of records."""
+
+    def __init__(self, callback: Callable[[list[DeadLetterRecord]], Any]) -> None:
+        self._callback = callback
+
+    def write(self, records: list[DeadLetterRecord]) -> None:
+        self._callback(records)
+
+    def close(self) -> None:
+        pass
+
+
+class ErrorBudgetExceeded(Exception):
+    """Raised by `DeadLetter.route` when too many `Err`s were seen. Earlier dead letters are flushed first."""
+
+    def __init__(self, errors: int, seen: int) -> None:
+        super().__init__(f"error budget exceeded: {errors} errors in {seen} records")
+        self.errors = errors
+        self.seen = seen
+
+
+class DeadLetter:
+    """
+    A streaming stage that yields `Ok` values and routes `Err`s to a dead-letter sink.
+
+    Records are written by a background thread, started with the first dead letter, in batches of up to
+    `batch_size`, at least every `flush_interval` seconds while any are pending. At most `max_buffer` records
+    wait for the writer; beyond that the producer blocks. The stage raises `ErrorBudgetExceeded` once more
+    than `max_errors` `Err`s were seen, or once the share of `Err`s exceeds `max_error_ratio` after at least
+    `min_records` records. An exception raised by the sink stops the writer and is re-raised in the producer.
+
+    Use it as a context manager (or call `close()`) so pending records are written and the thread joined.
+
+    Example:
+        >>> with DeadLetter(JsonLinesSink("rejects.jsonl"), max_error_ratio=0.05) as dead_letters:
+        ...     load(dead_letters.route(map(Catch(ValueError)(transform), records)))
+
+    Args:
+        sink (Sink): Where dead letters are written.
+        max_buffer (int): Maximum number of records waiting for the writer thread.
+        batch_size (int): Maximum number of records per `sink.write` call.
+        flush_interval (float): Longest time a record waits for its batch to fill, in seconds.
+        max_errors (int | None): Absolute error budget.
+        max_error_ratio (float | None): Relative error budget, between 0 and 1.
+        min_records (int): Records to see before `max_error_ratio` is enforced.
+    """
+
+    def __init__(
+            self,
+            sink: Sink,
+            max_buffer: int = 1024,
+            batch_size: int = 100,
+            flush_interval: float = 0.5,
+            max_errors: int | None = None,
+            max_error_ratio: float | None = None,
+            min_records: int = 100,
+    ) -> None:
+        if max_buffer < 1 or batch_size < 1:
+            raise ValueError("max_buffer and batch_size must be at least 1")
+        if max_error_ratio is not None and not 0 <= max_error_ratio <= 1:
+            raise ValueError("max_error_ratio must be between 0 and 1")
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_errors = max_errors
+        self.max_error_ratio = max_error_ratio
+        self.min_records = min_records
+        self.seen = 0
+        self.errors = 0
+        self._queue: queue.Queue[Any] = queue.Queue(max_buffer)
+        self._failure: BaseException | None = None
+        self._closed = False
+        self._writer: threading.Thread | None = None
+
+    def __enter__(self) -> "DeadLetter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def route(self, results: Iterable[Result[T, Any]]) -> Iterator[T]:
+        """
+        Yield the `Ok` values of `results` and send every `Err` to the sink.
+
+        Args:
+            results (Iterable[Result[T, Any]]): The stream to route; consumed lazily.
+
+        Returns:
+            Iterator[T]: The `Ok` values, as a generator.
+
+        Raises:
+            ErrorBudgetExceeded: When the error budget is exhausted.
+        """
+        for r in results:
+            position = self.seen
+            self.seen += 1
+            if r.__class__ is Ok or not isinstance(r, Err):
+                yield r.value
+                continue
+            self.errors += 1
+            self._put(DeadLetterRecord(position, r.value, time.time()))
+            if self._over_budget():
+                self.close()
+                raise ErrorBudgetExceeded(self.errors, self.seen)
+
+    def _over_budget(self) -> bool:
+        if self.max_errors is not None and self.errors > self.max_errors:
+            return True
+        return (
+                self.max_error_ratio is not None
+                and self.seen >= self.min_records
+                and self.errors > self.max_error_ratio * self.seen
+        )
+
+    def _put(self, item: Any) -> None:
+        if self._closed:
+            raise RuntimeError("DeadLetter is closed")
+        self._raise_failure()
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="rusty-utils-dead-letter", daemon=True)
+            self._writer.start()
+        # Never blocks for good: after a sink failure the writer keeps emptying the queue (see `_drain`).
+        self._queue.put(item)
+
+    def _raise_failure(self) -> None:
+        if self._failure is not None:
+            raise RuntimeError("dead-letter sink failed") from self._failure
+
+    def _write_loop(self) -> None:
+        batch: list[DeadLetterRecord] = []
+        deadline: float | None = None
+        stop = False
+        while not stop:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                stop = True
+            elif item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            if batch:
+                try:
+                    self.sink.write(batch)
+                except BaseException as e:
+                    self._failure = e
+                    if not stop:
+                        self._drain()
+                    return
+                batch = []
+            deadline = None
+
+    def _drain(self) -> None:
+        # Keep the producer from blocking on a full queue once records are no longer written, until `close`.
+        while self._queue.get() is not _STOP:
+            pass
+
+    def close(self) -> None:
+        """Write pending records, stop the writer thread and close the sink. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join()
+        self.sink.close()
+        self._raise_failure()
@@ -0,0 +1,120 @@
+"""Deadlines for blocking calls, used by `Catch(..., timeout=...)`.
+
+A call with a timeout runs on a shared worker pool while the caller waits for at most the remaining time. The
+deadline is an absolute `time.monotonic()` value carried in a context variable, which the worker inherits, so a
+nested timed `Catch` only gets what is left of its caller's budget. `deadline(seconds)` sets a budget for a
+block of code without running anything on the pool itself.
+
+Python cannot interrupt a running thread: a call that times out keeps its worker busy until it returns on its
+own. Pass `remaining()` on to socket or driver timeouts so abandoned calls finish soon after. The pool has the
+default `ThreadPoolExecutor` size, so hung calls cannot spawn threads without bound, but while they hold every
+worker later calls wait in its queue and time out without running. Give a service with many slow calls its own,
+larger pool with `set_shared_pool`.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import wraps
+from typing import Any, Callable, Iterator, ParamSpec, TypeVar
+
+T = TypeVar("T")
+P = ParamSpec("P")
+
+# The current deadline, and the deadline some caller up the stack is already waiting on, if any.
+_DEADLINE: ContextVar[float | None] = ContextVar("rusty_utils_deadline", default=None)
+_ENFORCED: ContextVar[float | None] = ContextVar("rusty_utils_enforced_deadline", default=None)
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+class _DeadlineExpired(TimeoutError):
+    """Raised by `call_with_timeout`, so that `Catch(timeout=...)` tells an expired deadline from a `TimeoutError`
+    raised by the call itself."""
+
+
+def shared_pool() -> ThreadPoolExecutor:
+    """The thread pool that timed calls and `Hedge` run on, created on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(thread_name_prefix="rusty-utils")
+    return _pool
+
+
+def set_shared_pool(pool: ThreadPoolExecutor) -> None:
+    """Run later timed calls and `Hedge` attempts on `pool`. The previous pool is not shut down."""
+    global _pool
+    with _pool_lock:
+        _pool = pool
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline (possibly negative), or `None` if there is none."""
+    limit = _DEADLINE.get()
+    return None if limit is None else limit - time.monotonic()
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Limit timed calls made inside the block to `seconds` from now, or to the enclosing deadline if that is sooner.
+
+    Example:
+        >>> with deadline(0.5):
+        ...     user = Catch(OSError, timeout=2.0, func=load_user, args=(42,))  # gets at most 0.5s
+    """
+    limit = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    token = _DEADLINE.set(limit if current is None else min(limit, current))
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def call_with_timeout(timeout: float, f: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Call `f` and return its value, or raise `TimeoutError` once `timeout` seconds or the current deadline pass.
+
+    The call runs on `shared_pool()` with the new deadline in its context. When the deadline is not tighter than
+    one a caller is already waiting on, as for a nested call without a shorter timeout of its own, `f` runs
+    inline instead, so nesting does not tie up one worker per level. Exceptions raised by `f` propagate.
+    """
+    now = time.monotonic()
+    limit = now + timeout
+    current = _DEADLINE.get()
+    if current is not None and current < limit:
+        limit = current
+    if limit <= now:
+        raise _DeadlineExpired(f"deadline exceeded before calling {getattr(f, '__qualname__', f)!r}")
+    enforced = _ENFORCED.get()
+    if enforced is not None and limit >= enforced:
+        token = _DEADLINE.set(limit)
+        try:
+            return f(*args, **kwargs)
+        finally:
+            _DEADLINE.reset(token)
+
+    context = copy_context()
+    context.run(_DEADLINE.set, limit)
+    context.run(_ENFORCED.set, limit)
+    run: Callable[..., T] = context.run
+    future = shared_pool().submit(run, f, *args, **kwargs)
+    wait((future,), limit - time.monotonic())
+    if not future.done():
+        future.cancel()
+        raise _DeadlineExpired(f"{getattr(f, '__qualname__', f)!r} did not finish within {limit - now:.3g}s")
+    return future.result()
+
+
+def with_timeout(timeout: float, f: Callable[P, T]) -> Callable[P, T]:
+    """Wrap `f` so that every call goes through `call_with_timeout`."""
+    @wraps(f)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        return call_with_timeout(timeout, f, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,110 @@
+"""Generator-based early return for `Result` chains, the exception-free counterpart of `unwrap_or_raise`.
+
+Inside a function decorated with `do`, `value = yield result` binds the `Ok` value of `result`, and an `Err`
+ends the function right there with that `Err` as its return value. Nothing is raised on the failure path;
+the generator is simply closed. The function's own `return` value is wrapped in `Ok`.
+
+Example:
+    >>> @do
+    ... def load(path: str) -> Generator[Result[Any, Exception], Any, Config]:
+    ...     text = yield read_file(path)
+    ...     data = yield parse_json(text)
+    ...     return Config(**data)
+    >>> load("app.json")  # Ok(Config(...)) or the first Err
+"""
+import inspect
+from functools import wraps
+from typing import Any, Callable, Coroutine, Generator, ParamSpec, TypeVar
+
+from rusty_utils.result import Result, Ok, Err
+
+T = TypeVar("T")
+E = TypeVar("E", bound=BaseException)
+P = ParamSpec("P")
+
+
+def do(f: Callable[P, Generator[Result[Any, E], Any, T]]) -> Callable[P, Result[T, E]]:
+    """
+    Turn a generator function that yields `Result`s into a function returning a `Result`.
+
+    Each `yield` of an `Ok` resumes the generator with its value; the first `Err` closes the generator
+    (running its `finally` blocks) and is returned. Exceptions raised inside the generator propagate; wrap
+    the decorated function in `Catch` to capture them as well.
+
+    Args:
+        f (Callable[P, Generator[Result[Any, E], Any, T]]): The generator function.
+
+    Returns:
+        Callable[P, Result[T, E]]: A function returning `Ok` of the generator's return value, or the first `Err`.
+    """
+    if not inspect.isgeneratorfunction(f):
+        raise TypeError("do requires a generator function; use `value = yield result` to bind Ok values")
+
+    @wraps(f)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Result[T, E]:
+        gen = f(*args, **kwargs)
+        send = gen.send
+        try:
+            r = next(gen)
+            while True:
+                if r.__class__ is not Ok and isinstance(r, Err):
+                    gen.close()
+                    return r
+                r = send(r.value)
+        except StopIteration as stop:
+            return Ok(stop.value)
+
+    return wrapper
+
+
+def do_async(
+        f: Callable[P, Generator[Any, Any, T]]
+) -> Callable[P, Coroutine[Any, Any, Result[T, Any]]]:
+    """
+    The asynchronous counterpart of `do`, returning a coroutine function.
+
+    `f` is still a plain generator function, because async generators cannot return a value. It may yield
+    `Result`s, or awaitables that the driver awaits: an awaitable resolving to a `Result` is unwrapped or
+    short-circuits like a yielded `Result`, and any other resolved value is sent back as is.
+
+    Example:
+        >>> @do_async
+        ... def profile(user_id: int):
+        ...     user = yield fetch_user(user_id)       # coroutine resolving to a Result
+        ...     avatar = yield fetch_avatar(user.url)  # short-circuits on Err
+        ...     return Profile(user, avatar)
+        >>> await profile(42)
+
+    Args:
+        f (Callable[P, Generator[Any, Any, T]]): The generator function.
+
+    Returns:
+        Callable[P, Coroutine[Any, Any, Result[T, E]]]: A coroutine function resolving to `Ok` of the
+        generator's return value, or the first `Err`.
+    """
+    if not inspect.isgeneratorfunction(f):
+        raise TypeError("do_async requires a plain generator function that yields Results or awaitables")
+
+    @wraps(f)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Result[T, Any]:
+        gen = f(*args, **kwargs)
+        send = gen.send
+        try:
+            r = next(gen)
+            while True:
+                cls = r.__class__
+                if cls is not Ok and cls is not Err and not isinstance(r, (Ok, Err)):
+                    resolved = await r
+                    cls = resolved.__class__
+                    if cls is not Ok and cls is not Err and not isinstance(resolved, (Ok, Err)):
+                        r = send(resolved)
+                        continue
+                    r = resolved
+                if cls is not Ok and isinstance(r, Err):
+                    gen.close()
+                    return r
+                r = send(r.value)
+        except StopIteration as stop:
+            return Ok(stop.value)
+
+    return wrapper
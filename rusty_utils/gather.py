@@ -0,0 +1,135 @@
+"""Bounded-concurrency counterparts of `asyncio.gather` and `asyncio.as_completed` that produce `Result`s.
+
+Every awaitable becomes exactly one `Ok` or `Err`, so call sites never have to sort values from the exceptions
+that `asyncio.gather(..., return_exceptions=True)` mixes into the same list.
+"""
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Iterable, Iterator, TypeVar
+
+from rusty_utils.result import Result, Ok, Err, Catch
+
+T = TypeVar("T")
+
+
+async def _await(aw: Awaitable[T], timeout: float | None) -> T:
+    if timeout is None:
+        return await aw
+    return await asyncio.wait_for(aw, timeout)
+
+
+def _check(limit: int | None, timeout: float | None, catch: tuple[type[BaseException], ...]) -> None:
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+    if timeout is not None and timeout < 0:
+        raise ValueError("timeout must be non-negative")
+    if not catch:
+        raise TypeError("at least one exception type is required in `catch`")
+
+
+def _discard(aw: Awaitable[Any]) -> None:
+    # Awaitables that were never scheduled: close coroutines so they do not warn, cancel futures we were handed.
+    if asyncio.iscoroutine(aw):
+        aw.close()
+    elif asyncio.isfuture(aw):
+        aw.cancel()
+
+
+async def _completed(
+        source: Iterator[tuple[int, Awaitable[T]]],
+        limit: int | None,
+        timeout: float | None,
+        catch: tuple[type[BaseException], ...],
+        fail_fast: bool,
+) -> AsyncIterator[tuple[int, Result[T, BaseException]]]:
+    """Yield `(index, result)` pairs in completion order, with at most `limit` awaitables running at once."""
+    run = Catch(*catch, *((TimeoutError,) if timeout is not None else ()))(_await)
+    pending: dict[asyncio.Future[Result[T, BaseException]], int] = {}
+    try:
+        while True:
+            while limit is None or len(pending) < limit:
+                item = next(source, None)
+                if item is None:
+                    break
+                pending[asyncio.ensure_future(run(item[1], timeout))] = item[0]
+            if not pending:
+                return
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                yield pending.pop(task), result
+                if fail_fast and result.__class__ is not Ok and isinstance(result, Err):
+                    return
+    finally:
+        for task in pending:
+            task.cancel()
+        # Wait for the cancellations, so the tasks have finished by the time the caller gets control back.
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def gather_results(
+        aws: Iterable[Awaitable[T]],
+        limit: int | None = None,
+        timeout: float | None = None,
+        catch: tuple[type[BaseException], ...] = (Exception,),
+        fail_fast: bool = False,
+) -> list[Result[T, BaseException]]:
+    """
+    Await `aws` with at most `limit` running at once and return their `Result`s in input order.
+
+    Each awaitable runs under `Catch(*catch)`. With a `timeout`, an awaitable that has not finished `timeout`
+    seconds after it *started* (not after the call) is cancelled and becomes `Err(TimeoutError())`; time spent
+    waiting for a free slot does not count. With `fail_fast`, the first `Err` to complete cancels everything still
+    running, and those awaitables, like the ones never started, become `Err(asyncio.CancelledError())`.
+
+    Example:
+        >>> results = await gather_results((fetch(url) for url in urls), limit=50, timeout=2.0)
+        >>> pages = [r.unwrap() for r in results if r.is_ok()]
+
+    Args:
+        aws (Iterable[Awaitable[T]]): Coroutines or futures. Coroutines are only scheduled once a slot is free.
+        limit (int | None): Maximum number of awaitables in flight. Unbounded if omitted.
+        timeout (float | None): Per-awaitable deadline, in seconds.
+        catch (tuple[type[BaseException], ...]): Exception types turned into `Err` instead of propagating.
+        fail_fast (bool): Stop at the first `Err`.
+
+    Returns:
+        list[Result[T, BaseException]]: One `Result` per awaitable, in input order.
+    """
+    _check(limit, timeout, catch)
+    aws = list(aws)
+    results: list[Result[T, BaseException] | None] = [None] * len(aws)
+    source = enumerate(aws)
+    async for index, result in _completed(source, limit, timeout, catch, fail_fast):
+        results[index] = result
+    for _, aw in source:
+        _discard(aw)
+    return [Err(asyncio.CancelledError()) if r is None else r for r in results]
+
+
+async def stream_results(
+        aws: Iterable[Awaitable[T]],
+        limit: int | None = None,
+        timeout: float | None = None,
+        catch: tuple[type[BaseException], ...] = (Exception,),
+        fail_fast: bool = False,
+) -> AsyncIterator[Result[T, BaseException]]:
+    """
+    Like `gather_results`, but yield each `Result` as soon as its awaitable completes.
+
+    `aws` is consumed lazily, so it may be an unbounded generator; memory stays at `limit` tasks. With
+    `fail_fast`, the stream ends after yielding the first `Err`. Leaving the `async for` early cancels the
+    running tasks once the generator is closed; use `contextlib.aclosing` to make that immediate.
+
+    Args:
+        aws (Iterable[Awaitable[T]]): Coroutines or futures.
+        limit (int | None): Maximum number of awaitables in flight. Unbounded if omitted.
+        timeout (float | None): Per-awaitable deadline, in seconds.
+        catch (tuple[type[BaseException], ...]): Exception types turned into `Err` instead of propagating.
+        fail_fast (bool): Stop at the first `Err`.
+
+    Returns:
+        AsyncIterator[Result[T, BaseException]]: The results in completion order, as an async generator.
+    """
+    _check(limit, timeout, catch)
+    async for _, result in _completed(enumerate(aws), limit, timeout, catch, fail_fast):
+        yield result
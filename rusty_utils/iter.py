@@ -0,0 +1,164 @@
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+from rusty_utils.option import Option, Nothing
+from rusty_utils.result import Result, Ok, Err
+
+T = TypeVar("T")
+U = TypeVar("U")
+A = TypeVar("A")
+E = TypeVar("E", bound=BaseException)
+
+_MAP = 0
+_FILTER_MAP = 1
+_FLAT_MAP = 2
+_TAKE_WHILE = 3
+_CHUNKS = 4
+
+_Stage = tuple[int, Any]
+
+
+class Iter(Generic[T]):
+    """
+    A lazy, Rust-style iterator adapter over any iterable.
+
+    Adapters only record a stage; nothing is pulled from the source until the `Iter` is iterated or consumed
+    by `collect`, `try_fold` or `find_map`. Adjacent element-wise stages (`map`, `filter_map`, `flat_map`,
+    `take_while`) are fused into a single generated generator, as `Pipeline` does for `Result` chains, so a
+    deep chain costs one generator frame rather than one per stage. `chunks` is the only stage that buffers,
+    and only `n` items, so an `Iter` streams in constant memory over unbounded sources.
+
+    Like `Pipeline`, an `Iter` is immutable: each adapter returns a new one. Iterating it twice iterates the
+    source twice, which only yields the same items again if the source is re-iterable.
+
+    Example:
+        >>> Iter(lines).map(str.strip).filter_map(parse_int).chunks(100).find_map(first_negative)
+    """
+
+    __slots__ = ("_source", "_stages", "_run")
+
+    def __init__(self, source: Iterable[T], stages: tuple[_Stage, ...] = ()) -> None:
+        self._source = source
+        self._stages = stages
+        self._run: Callable[[Iterator[Any]], Iterator[T]] | None = None
+
+    def _then(self, kind: int, arg: Any) -> "Iter[Any]":
+        return Iter(self._source, self._stages + ((kind, arg),))
+
+    def map(self, f: Callable[[T], U]) -> "Iter[U]":
+        """Transform each item with `f`."""
+        return self._then(_MAP, f)
+
+    def filter_map(self, f: Callable[[T], Option[U]]) -> "Iter[U]":
+        """Call `f` on each item, keeping the values of the `Some`s it returns and dropping `Nothing`s."""
+        return self._then(_FILTER_MAP, f)
+
+    def flat_map(self, f: Callable[[T], Iterable[U]]) -> "Iter[U]":
+        """Replace each item with the items of the iterable `f` returns."""
+        return self._then(_FLAT_MAP, f)
+
+    def take_while(self, predicate: Callable[[T], bool]) -> "Iter[T]":
+        """Stop at the first item for which `predicate` is false. The source is not pulled any further."""
+        return self._then(_TAKE_WHILE, predicate)
+
+    def chunks(self, n: int) -> "Iter[list[T]]":
+        """Group items into lists of `n`; the last list may be shorter."""
+        if n < 1:
+            raise ValueError("chunk size must be at least 1")
+        return self._then(_CHUNKS, n)
+
+    def __iter__(self) -> Iterator[T]:
+        if self._run is None:
+            self._run = _compile(self._stages)
+        return self._run(iter(self._source))
+
+    def collect(self) -> list[T]:
+        """Run the iterator to the end and return its items as a list."""
+        return list(self)
+
+    def try_fold(self, init: A, f: Callable[[A, T], Result[A, E]]) -> Result[A, E]:
+        """
+        Fold the items into an accumulator with a fallible function, stopping at the first `Err`.
+
+        Args:
+            init (A): The initial accumulator.
+            f (Callable[[A, T], Result[A, E]]): Takes the accumulator and an item and returns the next accumulator.
+
+        Returns:
+            Result[A, E]: `Ok` with the final accumulator, or the first `Err` returned by `f`.
+        """
+        acc: Any = init  # The class test below does not narrow `r`, as in `result.collect`.
+        for item in self:
+            r = f(acc, item)
+            if r.__class__ is not Ok and isinstance(r, Err):
+                return r
+            acc = r.value
+        return Ok(acc)
+
+    def find_map(self, f: Callable[[T], Option[U]]) -> Option[U]:
+        """Return the first `Some` that `f` returns, or `Nothing` if there is none. Stops pulling once found."""
+        for item in self:
+            o = f(item)
+            if o.__class__ is not Nothing:
+                return o
+        return Nothing()
+
+    def __repr__(self) -> str:
+        names = ("map", "filter_map", "flat_map", "take_while", "chunks")
+        stages = "".join(f".{names[kind]}({getattr(arg, '__name__', arg)!s})" for kind, arg in self._stages)
+        return f"Iter({self._source!r}){stages}"
+
+
+def _chunked(source: Iterator[T], n: int) -> Iterator[list[T]]:
+    while chunk := list(islice(source, n)):
+        yield chunk
+
+
+def _fuse(stages: list[_Stage]) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    # Element-wise stages are unrolled into the body of one generator. A `flat_map` opens a nested loop
+    # that the following stages are indented into, and `take_while` returns from the whole generator.
+    namespace: dict[str, Any] = {"Nothing": Nothing}
+    body = ["def run(source):", "    for v in source:"]
+    indent = "        "
+    for i, (kind, f) in enumerate(stages):
+        namespace[f"f{i}"] = f
+        if kind == _MAP:
+            body.append(f"{indent}v = f{i}(v)")
+        elif kind == _FILTER_MAP:
+            body.append(f"{indent}o = f{i}(v)")
+            body.append(f"{indent}if o.__class__ is Nothing:")
+            body.append(f"{indent}    continue")
+            body.append(f"{indent}v = o.value")
+        elif kind == _FLAT_MAP:
+            body.append(f"{indent}for v in f{i}(v):")
+            indent += "    "
+        elif kind == _TAKE_WHILE:
+            body.append(f"{indent}if not f{i}(v):")
+            body.append(f"{indent}    return")
+    body.append(f"{indent}yield v")
+    exec("\n".join(body), namespace)
+    return namespace["run"]  # type: ignore[no-any-return]
+
+
+def _compile(stages: tuple[_Stage, ...]) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    """Build the function that runs `stages` over an iterator: fused segments separated by `chunks`."""
+    steps: list[Callable[[Iterator[Any]], Iterator[Any]]] = []
+    segment: list[_Stage] = []
+    for kind, arg in stages:
+        if kind != _CHUNKS:
+            segment.append((kind, arg))
+            continue
+        if segment:
+            steps.append(_fuse(segment))
+            segment = []
+        steps.append(partial(_chunked, n=arg))
+    if segment:
+        steps.append(_fuse(segment))
+
+    def run(source: Iterator[Any]) -> Iterator[Any]:
+        for step in steps:
+            source = step(source)
+        return source
+
+    return run
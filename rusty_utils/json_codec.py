@@ -0,0 +1,207 @@
+"""JSON encoding for trees of `Ok`, `Err` and `Option` values, for API responses.
+
+Each value becomes a single-key object whose key is its tag:
+
+    Ok(v)           {"$ok": v}
+    Err(e)          {"$err": e}
+    Some(v)         {"$some": v}
+    Nothing()       {"$none": null}
+    an exception    {"$exception": {"type": "module:qualname", "message": str(exc), "args": [...]}}
+
+so `Err(ValueError("bad"))` is `{"$err": {"$exception": {"type": "builtins:ValueError", "message": "bad",
+"args": ["bad"]}}}`. The tags nest like the values do, and anything else is plain JSON. A plain object with
+exactly one of these keys is therefore decoded as a tagged value.
+
+Encoding runs on the C encoder of the standard `json` module; only the tagged values go through a Python hook,
+which does not recurse, so a tree costs about the same as the equivalent plain JSON. Decoding turns exceptions
+into `RemoteError` unless `import_errors` is set, since response bodies are often untrusted.
+"""
+import io
+import json
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from rusty_utils.common import RemoteError
+from rusty_utils.option import Some, Nothing
+from rusty_utils.result import Ok, Err
+
+_OK = "$ok"
+_ERR = "$err"
+_SOME = "$some"
+_NONE = "$none"
+_EXCEPTION = "$exception"
+
+_PLAIN = (str, int, float, bool, type(None))
+
+
+def _encode_exception(exc: BaseException) -> dict[str, Any]:
+    cls = type(exc)
+    return {_EXCEPTION: {
+        "type": f"{cls.__module__}:{cls.__qualname__}",
+        "message": str(exc),
+        "args": [a if isinstance(a, _PLAIN) else repr(a) for a in exc.args],
+    }}
+
+
+_ENCODERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    Ok: lambda o: {_OK: o.value},
+    Err: lambda o: {_ERR: o.value},
+    Some: lambda o: {_SOME: o.value},
+    Nothing: lambda o: {_NONE: None},
+}
+
+
+def _hook(default: Callable[[Any], Any] | None) -> Callable[[Any], Any]:
+    encoders = _ENCODERS
+
+    def encode(obj: Any) -> Any:
+        f = encoders.get(obj.__class__)
+        if f is not None:
+            return f(obj)
+        if isinstance(obj, BaseException):
+            return _encode_exception(obj)
+        for cls in type(obj).__mro__[1:]:
+            if cls in encoders:
+                return encoders[cls](obj)
+        if default is not None:
+            return default(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    return encode
+
+
+def _make_encoder(default: Callable[[Any], Any] | None) -> json.JSONEncoder:
+    # The cycle check costs about as much as encoding itself once a `default` hook is involved, so it is off and
+    # `_encode` turns the `RecursionError` of a self-referencing (or too deep) tree into a `ValueError`.
+    return json.JSONEncoder(default=_hook(default), separators=(",", ":"), check_circular=False)
+
+
+_ENCODER = _make_encoder(None)
+
+
+def _encoder(default: Callable[[Any], Any] | None) -> Callable[[Any], str]:
+    encode = (_ENCODER if default is None else _make_encoder(default)).encode
+
+    def _encode(obj: Any) -> str:
+        try:
+            return encode(obj)
+        except RecursionError:
+            raise ValueError("circular reference or nesting too deep") from None
+
+    return _encode
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """
+    Encode a tree that may contain `Ok`, `Err`, `Option` and exceptions as compact JSON.
+
+    Args:
+        obj (Any): The value to encode.
+        default (Callable[[Any], Any] | None): Called for other objects JSON cannot encode, as for `json.dumps`.
+
+    Returns:
+        str: The JSON document.
+    """
+    return _encoder(default)(obj)
+
+
+def iterencode_many(
+        items: Iterable[Any], chunk_size: int = 1000, default: Callable[[Any], Any] | None = None
+) -> Iterator[str]:
+    """
+    Encode `items` as one JSON array, yielding it in pieces of about `chunk_size` items each.
+
+    `items` is consumed lazily, so only one chunk is held in memory at a time. Each chunk is encoded in a
+    single C-level `encode` call, which is much faster than `json.JSONEncoder.iterencode`.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    encode = _encoder(default)
+    source = iter(items)
+    separator = "["
+    while chunk := list(islice(source, chunk_size)):
+        yield separator + encode(chunk)[1:-1]
+        separator = ","
+    yield "[]" if separator == "[" else "]"
+
+
+def dump_many(
+        items: Iterable[Any],
+        fp: IO[str] | IO[bytes],
+        chunk_size: int = 1000,
+        default: Callable[[Any], Any] | None = None,
+) -> None:
+    """
+    Stream `items` to `fp` as one JSON array without building the whole document in memory.
+
+    Args:
+        items (Iterable[Any]): The values to encode, typically `Result`s; consumed lazily.
+        fp (IO[str] | IO[bytes]): A text or binary writer, such as an open file or `socket.makefile("wb")`.
+            Binary writers receive UTF-8.
+        chunk_size (int): Items encoded per `fp.write` call.
+        default (Callable[[Any], Any] | None): Called for other objects JSON cannot encode.
+    """
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+    write: Callable[[Any], Any] = fp.write
+    for piece in iterencode_many(items, chunk_size, default):
+        write(piece.encode() if binary else piece)
+
+
+def _decode_exception(payload: Any, import_errors: bool) -> BaseException:
+    if not isinstance(payload, dict) or not isinstance(payload.get("type"), str):
+        raise ValueError(f"malformed {_EXCEPTION} payload: {payload!r}")
+    type_name = payload["type"]
+    args = payload.get("args", [])
+    if not isinstance(args, list):
+        raise ValueError(f"malformed {_EXCEPTION} args: {args!r}")
+    args = tuple(args)
+    if import_errors:
+        from rusty_utils.wire import decode_error
+
+        return decode_error((type_name, args, None, None))
+    return RemoteError(type_name, args)
+
+
+def _object_hook(import_errors: bool) -> Callable[[dict[str, Any]], Any]:
+    def decode(obj: dict[str, Any]) -> Any:
+        if len(obj) != 1:
+            return obj
+        (tag, value), = obj.items()
+        if tag == _OK:
+            return Ok(value)
+        if tag == _ERR:
+            return Err(value)
+        if tag == _SOME:
+            return Some(value)
+        if tag == _NONE:
+            return Nothing()
+        if tag == _EXCEPTION:
+            return _decode_exception(value, import_errors)
+        return obj
+
+    return decode
+
+
+_DECODER = json.JSONDecoder(object_hook=_object_hook(False))
+_IMPORTING_DECODER = json.JSONDecoder(object_hook=_object_hook(True))
+
+
+def loads(s: str | bytes, import_errors: bool = False) -> Any:
+    """
+    Decode a document produced by `dumps` or `dump_many`, restoring the tagged values.
+
+    Args:
+        s (str | bytes): The JSON document.
+        import_errors (bool): Import the encoded exception types and rebuild them from their `args`. Otherwise,
+            and for types that cannot be imported or rebuilt, errors decode as `RemoteError`. Importing runs
+            module code named by the document, so only enable it for trusted input.
+
+    Returns:
+        Any: The decoded tree.
+
+    Raises:
+        ValueError: If the document is not valid JSON or holds a malformed `$exception` object.
+    """
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode()
+    return (_IMPORTING_DECODER if import_errors else _DECODER).decode(s)
@@ -0,0 +1,190 @@
+"""Opt-in instrumentation for `Catch`.
+
+Pass a sink as `Catch(..., metrics=sink)` and every call of the wrapped function reports its outcome and
+duration to `sink.record(function, error, seconds)`, where `error` is the caught exception or `None` for
+an `Ok`. Exceptions that `Catch` does not catch propagate unrecorded. Without `metrics`, `Catch` builds
+exactly the same wrapper as before, so disabled instrumentation costs nothing per call.
+"""
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, NamedTuple, Protocol
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Sink(Protocol):
+    """Anything `Catch(..., metrics=...)` can report to."""
+
+    def record(self, function: str, error: BaseException | None, seconds: float) -> None: ...
+
+
+class CallEvent(NamedTuple):
+    """One call of an instrumented function, as passed to a `CallbackSink`."""
+    function: str
+    error: BaseException | None
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class CallbackSink:
+    """Forwards each call to `callback` as a `CallEvent`. The callback runs on the caller's thread."""
+
+    __slots__ = ("callback",)
+
+    def __init__(self, callback: Callable[[CallEvent], Any]) -> None:
+        self.callback = callback
+
+    def record(self, function: str, error: BaseException | None, seconds: float) -> None:
+        self.callback(CallEvent(function, error, seconds))
+
+
+class FunctionStats:
+    """
+    Aggregated calls of one function.
+
+    Attributes:
+        ok (int): Calls that returned `Ok`.
+        err (int): Calls that returned `Err`.
+        errors (dict[str, int]): `Err` counts keyed by exception type name.
+        buckets (list[int]): Call counts per latency bucket (not cumulative); the last entry counts calls
+            slower than every bound.
+        total_seconds (float): Sum of all call durations.
+    """
+
+    __slots__ = ("ok", "err", "errors", "buckets", "total_seconds")
+
+    def __init__(self, n_buckets: int) -> None:
+        self.ok = 0
+        self.err = 0
+        self.errors: dict[str, int] = {}
+        self.buckets = [0] * (n_buckets + 1)
+        self.total_seconds = 0.0
+
+    @property
+    def count(self) -> int:
+        return self.ok + self.err
+
+    def copy(self) -> "FunctionStats":
+        stats = FunctionStats(len(self.buckets) - 1)
+        stats.ok, stats.err, stats.total_seconds = self.ok, self.err, self.total_seconds
+        stats.errors = dict(self.errors)
+        stats.buckets = list(self.buckets)
+        return stats
+
+    def __repr__(self) -> str:
+        return (
+            f"FunctionStats(ok={self.ok}, err={self.err}, errors={self.errors!r}, "
+            f"total_seconds={self.total_seconds})"
+        )
+
+
+class Metrics:
+    """
+    A thread-safe sink that keeps per-function `Ok`/`Err` counters, per-exception-type counts and a
+    latency histogram, and exports them in the Prometheus text format.
+
+    Example:
+        >>> metrics = Metrics()
+        >>> @Catch(IOError, metrics=metrics)
+        ... def load(path): ...
+        >>> metrics.write_prometheus("/var/lib/node_exporter/app.prom")
+
+    Args:
+        buckets (tuple[float, ...]): Upper bounds of the latency buckets, in seconds, ascending.
+        namespace (str): Prefix of the exported metric names.
+        callback (Callable[[CallEvent], Any] | None): Also forward every call to this callback.
+    """
+
+    def __init__(
+            self,
+            buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+            namespace: str = "rusty_utils",
+            callback: Callable[[CallEvent], Any] | None = None,
+    ) -> None:
+        if list(buckets) != sorted(buckets):
+            raise ValueError("buckets must be ascending")
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self.callback = callback
+        self._stats: dict[str, FunctionStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, function: str, error: BaseException | None, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.get(function)
+            if stats is None:
+                stats = self._stats[function] = FunctionStats(len(self.buckets))
+            if error is None:
+                stats.ok += 1
+            else:
+                stats.err += 1
+                name = type(error).__qualname__
+                stats.errors[name] = stats.errors.get(name, 0) + 1
+            stats.buckets[bisect_left(self.buckets, seconds)] += 1
+            stats.total_seconds += seconds
+        if self.callback is not None:
+            self.callback(CallEvent(function, error, seconds))
+
+    def snapshot(self) -> dict[str, FunctionStats]:
+        """A consistent copy of the statistics of every function seen so far."""
+        with self._lock:
+            return {name: stats.copy() for name, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_prometheus(self) -> str:
+        """Render the statistics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        calls = f"{self.namespace}_catch_calls_total"
+        errors = f"{self.namespace}_catch_errors_total"
+        duration = f"{self.namespace}_catch_duration_seconds"
+        lines = [
+            f"# HELP {calls} Calls of Catch-wrapped functions by outcome.",
+            f"# TYPE {calls} counter",
+        ]
+        for name, stats in snapshot.items():
+            fn = _label(name)
+            lines.append(f'{calls}{{function="{fn}",outcome="ok"}} {stats.ok}')
+            lines.append(f'{calls}{{function="{fn}",outcome="err"}} {stats.err}')
+        lines += [f"# HELP {errors} Err results by exception type.", f"# TYPE {errors} counter"]
+        for name, stats in snapshot.items():
+            fn = _label(name)
+            for exc, n in stats.errors.items():
+                lines.append(f'{errors}{{function="{fn}",exception="{_label(exc)}"}} {n}')
+        lines += [f"# HELP {duration} Call latency of Catch-wrapped functions.", f"# TYPE {duration} histogram"]
+        for name, stats in snapshot.items():
+            fn = _label(name)
+            cumulative = 0
+            for bound, n in zip(self.buckets, stats.buckets):
+                cumulative += n
+                lines.append(f'{duration}_bucket{{function="{fn}",le="{bound!r}"}} {cumulative}')
+            lines.append(f'{duration}_bucket{{function="{fn}",le="+Inf"}} {stats.count}')
+            lines.append(f'{duration}_sum{{function="{fn}"}} {stats.total_seconds!r}')
+            lines.append(f'{duration}_count{{function="{fn}"}} {stats.count}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | os.PathLike[str]) -> None:
+        """Write `to_prometheus()` to `path` atomically, as expected by the node exporter's textfile collector."""
+        text = self.to_prometheus()
+        directory = os.path.dirname(os.fspath(path)) or "."
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            # `mkstemp` creates the file as 0600, which would hide it from an exporter running as another user.
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
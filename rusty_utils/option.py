@@ -1,41 +1,62 @@
-from dataclasses import dataclass
-from typing import TypeVar, Callable, Generic, TYPE_CHECKING
+from typing import Any, Iterable, Iterator, TypeVar, Callable, Generic, TYPE_CHECKING, cast
 
-from rusty_utils import result
 from rusty_utils.common import UnwrapError
 
 if TYPE_CHECKING:
-    from rusty_utils.result import Result, Ok, Err
+    from rusty_utils.result import Result
 
 T = TypeVar('T')
 U = TypeVar('U')
 E = TypeVar('E', bound=Exception)
 
 
-@dataclass(frozen=True)
 class Option(Generic[T]):
-    """A class that expands the built-in `Optional` type, representing a value that may or may not be present (`Some` or `None`).
+    """A class that expands the built-in `Optional` type, representing a value that may or may not be present.
+
+    `Option` is the common base of its two variants, `Some` (a present value, which may itself be `None`)
+    and `Nothing` (no value), much as `Ok` and `Err` make up `Result`. The base class implements every method
+    in terms of `is_some` and `unwrap`; each variant overrides them all directly, without testing which variant
+    it is. Calling `Option(value)` is a factory: it returns
+    `Nothing()` for `None` and `Some(value)` otherwise.
+
+    Instances are immutable and slotted. `Nothing()` is a single shared instance.
 
     Attributes:
-        value (`T | None`): The value stored in the `Option` or `None` if no value is present.
+        value (`T | None`): The value stored in the `Option`, or `None` for `Nothing`.
     """
-    value: T | None = None
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
 
-    def __init__(self, value: T | None = None):
-        """Initialize the `Option` class with an optional value.
+    value: T | None
+
+    def __new__(cls, value: T | None = None) -> "Option[T]":
+        """Create an `Option` holding an optional value.
 
         Args:
             value (`T | None`): The value to be stored in the `Option`, or `None` if absent.
-        """
-        object.__setattr__(self, 'value', value)
-
-    def __repr__(self) -> str:
-        """String representation of the `Option` instance.
 
         Returns:
-            str: `"None"` if no value is present, otherwise `"Some(value)"`.
+            `Option[T]`: `Some(value)`, or the shared `Nothing()` if `value` is `None`.
         """
-        return "None" if self.value is None else f"Some({self.value})"
+        if value is None:
+            return _NONE
+        self = _new_object(Some)
+        _set_value(self, value)
+        return self
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to field {name!r} of an immutable `Option`")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r} of an immutable `Option`")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.value is other.value or bool(self.value == other.value)  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self.value)
 
     def is_some(self) -> bool:
         """Check if the `Option` contains a value.
@@ -43,7 +64,7 @@ class Option(Generic[T]):
         Returns:
             bool: `True` if the `Option` contains a value, `False` otherwise.
         """
-        return self.value is not None
+        return self is not _NONE
 
     def is_none(self) -> bool:
         """Check if the `Option` contains no value.
@@ -51,7 +72,7 @@ class Option(Generic[T]):
         Returns:
             bool: `True` if the `Option` contains no value, `False` otherwise.
         """
-        return self.value is None
+        return self is _NONE
 
     def is_some_and(self, f: Callable[[T], bool]) -> bool:
         """Check if the `Option` contains a value and the predicate returns `True`.
@@ -62,7 +83,7 @@ class Option(Generic[T]):
         Returns:
             bool: `True` if the `Option` contains a value and the predicate is `True`, `False` otherwise.
         """
-        return self.is_some() and f(self.value) # type: ignore
+        return self.is_some() and f(self.unwrap())
 
     def expect(self, message: str) -> T:
         """Return the contained value or raise a `ValueError` with the provided message if `None`.
@@ -76,10 +97,9 @@ class Option(Generic[T]):
         Raises:
             `ValueError`: If the `Option` contains no value.
         """
-        if self.value is not None:
-            return self.value
-        else:
+        if self.is_none():
             raise ValueError(message)
+        return self.unwrap()
 
     def unwrap(self) -> T:
         """Return the contained value or raise an `UnwrapError` if `None`.
@@ -90,10 +110,9 @@ class Option(Generic[T]):
         Raises:
             `UnwrapError`: If the `Option` contains no value.
         """
-        if self.value is not None:
-            return self.value
-        else:
+        if self.is_none():
             raise UnwrapError("Option is None")
+        return cast(T, self.value)
 
     def unwrap_or(self, default: T) -> T:
         """Return the contained value or the provided default if `None`.
@@ -104,7 +123,7 @@ class Option(Generic[T]):
         Returns:
             `T`: The contained value or the default.
         """
-        return self.value if self.value is not None else default
+        return self.unwrap() if self.is_some() else default
 
     def unwrap_or_else(self, f: Callable[[], T]) -> T:
         """Return the contained value or the result of the provided function if `None`.
@@ -115,7 +134,7 @@ class Option(Generic[T]):
         Returns:
             `T`: The contained value or the result of the function.
         """
-        return self.value if self.value is not None else f()
+        return self.unwrap() if self.is_some() else f()
 
     def map(self, f: Callable[[T], U]) -> 'Option[U]':
         """Apply a function to the contained value and return a new `Option` containing the result.
@@ -126,7 +145,7 @@ class Option(Generic[T]):
         Returns:
             `Option[U]`: A new `Option` with the result of the function or `None` if the original `Option` was `None`.
         """
-        return Option(f(self.value)) if self.value is not None else Option()
+        return Option(f(self.unwrap())) if self.is_some() else _NONE
 
     def map_or(self, default: U, f: Callable[[T], U]) -> U:
         """Apply a function to the contained value or return the provided default if `None`.
@@ -138,7 +157,7 @@ class Option(Generic[T]):
         Returns:
             `U`: The result of the function or the default value.
         """
-        return f(self.value) if self.value is not None else default
+        return f(self.unwrap()) if self.is_some() else default
 
     def map_or_else(self, default_f: Callable[[], U], f: Callable[[T], U]) -> U:
         """Apply a function to the contained value or return the result of a default function if `None`.
@@ -150,7 +169,7 @@ class Option(Generic[T]):
         Returns:
             `U`: The result of the function or the result of the default function.
         """
-        return f(self.value) if self.value is not None else default_f()
+        return f(self.unwrap()) if self.is_some() else default_f()
 
     def inspect(self, f: Callable[[T], None]) -> 'Option[T]':
         """Call a function with the contained value for side effects and return the `Option` unchanged.
@@ -161,8 +180,8 @@ class Option(Generic[T]):
         Returns:
             `Option[T]`: The original `Option`.
         """
-        if self.value is not None:
-            f(self.value)
+        if self.is_some():
+            f(self.unwrap())
         return self
 
     def ok_or(self, err: E) -> "Result[T, E]":
@@ -174,7 +193,7 @@ class Option(Generic[T]):
         Returns:
             `Result[T, E]`: `Ok` with the value if `Some`, `Err` with the error if `None`.
         """
-        return result.Ok(self.value) if self.value is not None else result.Err(err)
+        return Ok(self.unwrap()) if self.is_some() else Err(err)
 
     def ok_or_else(self, err_f: Callable[[], E]) -> "Result[T, E]":
         """Convert the `Option` to a `Result`, returning `Ok(value)` if `Some`, or `Err` from a function if `None`.
@@ -185,7 +204,7 @@ class Option(Generic[T]):
         Returns:
             `Result[T, E]`: `Ok` with the value if `Some`, `Err` with the result of the function if `None`.
         """
-        return result.Ok(self.value) if self.value is not None else result.Err(err_f())
+        return Ok(self.unwrap()) if self.is_some() else Err(err_f())
 
     def and_(self, opt_b: 'Option[U]') -> 'Option[U]':
         """Return the second `Option` if the first is `Some`, otherwise return `None`.
@@ -196,7 +215,7 @@ class Option(Generic[T]):
         Returns:
             `Option[U]`: The second `Option` if the first is `Some`, otherwise `None`.
         """
-        return opt_b if self.value is not None else Option()
+        return opt_b if self.is_some() else _NONE
 
     def and_then(self, f: Callable[[T], 'Option[U]']) -> 'Option[U]':
         """Call a function if the `Option` is `Some` and return its result, otherwise return `None`.
@@ -207,7 +226,7 @@ class Option(Generic[T]):
         Returns:
             `Option[U]`: The result of the function if `Some`, otherwise `None`.
         """
-        return f(self.value) if self.value is not None else Option()
+        return f(self.unwrap()) if self.is_some() else _NONE
 
     def or_(self, opt_b: 'Option[T]') -> 'Option[T]':
         """Return the first `Option` if it's `Some`, otherwise return the second `Option`.
@@ -218,7 +237,7 @@ class Option(Generic[T]):
         Returns:
             `Option[T]`: The first `Option` if it's `Some`, otherwise the second `Option`.
         """
-        return self if self.value is not None else opt_b
+        return self if self.is_some() else opt_b
 
     def or_else(self, f: Callable[[], 'Option[T]']) -> 'Option[T]':
         """Return the first `Option` if it's `Some`, otherwise return the result of a function.
@@ -229,7 +248,7 @@ class Option(Generic[T]):
         Returns:
             `Option[T]`: The first `Option` if it's `Some`, otherwise the result of the function.
         """
-        return self if self.value is not None else f()
+        return self if self.is_some() else f()
 
     def xor(self, opt_b: 'Option[T]') -> 'Option[T]':
         """Return `Some` if exactly one of the options is `Some`, otherwise return `None`.
@@ -240,9 +259,196 @@ class Option(Generic[T]):
         Returns:
             `Option[T]`: `Some` if exactly one of the options is `Some`, otherwise `None`.
         """
-        if self.is_some() and opt_b.is_none():
-            return self
-        elif self.is_none() and opt_b.is_some():
+        if self.is_none():
             return opt_b
-        else:
-            return Option()
+        return self if opt_b.is_none() else _NONE
+
+
+class Some(Option[T]):
+    """The `Option` variant holding a value. Unlike `Option(value)`, `Some(None)` is a present `None`."""
+    __slots__ = ()
+    __match_args__ = ("value",)
+
+    value: T
+
+    def __new__(cls, value: T) -> "Some[T]":
+        self = _new_object(cls)
+        _set_value(self, value)
+        return self
+
+    def __reduce__(self) -> tuple[type["Some[T]"], tuple[T]]:
+        return self.__class__, (self.value,)
+
+    def __repr__(self) -> str:
+        return f"Some({self.value})"
+
+    def is_some(self) -> bool:
+        return True
+
+    def is_none(self) -> bool:
+        return False
+
+    def is_some_and(self, f: Callable[[T], bool]) -> bool:
+        return f(self.value)
+
+    def expect(self, message: str) -> T:
+        return self.value
+
+    def unwrap(self) -> T:
+        return self.value
+
+    def unwrap_or(self, default: T) -> T:
+        return self.value
+
+    def unwrap_or_else(self, f: Callable[[], T]) -> T:
+        return self.value
+
+    def map(self, f: Callable[[T], U]) -> "Option[U]":
+        # Like the `Option(...)` factory, a `None` result becomes `Nothing`.
+        return Option(f(self.value))
+
+    def map_or(self, default: U, f: Callable[[T], U]) -> U:
+        return f(self.value)
+
+    def map_or_else(self, default_f: Callable[[], U], f: Callable[[T], U]) -> U:
+        return f(self.value)
+
+    def inspect(self, f: Callable[[T], None]) -> "Option[T]":
+        f(self.value)
+        return self
+
+    def ok_or(self, err: E) -> "Result[T, E]":
+        return Ok(self.value)
+
+    def ok_or_else(self, err_f: Callable[[], E]) -> "Result[T, E]":
+        return Ok(self.value)
+
+    def and_(self, opt_b: "Option[U]") -> "Option[U]":
+        return opt_b
+
+    def and_then(self, f: Callable[[T], "Option[U]"]) -> "Option[U]":
+        return f(self.value)
+
+    def or_(self, opt_b: "Option[T]") -> "Option[T]":
+        return self
+
+    def or_else(self, f: Callable[[], "Option[T]"]) -> "Option[T]":
+        return self
+
+    def xor(self, opt_b: "Option[T]") -> "Option[T]":
+        return self if opt_b is _NONE else _NONE
+
+
+class Nothing(Option[T]):
+    """The empty `Option` variant. `Nothing()` always returns the same shared instance."""
+    __slots__ = ()
+    __match_args__ = ()
+
+    value: None
+
+    def __new__(cls) -> "Nothing[T]":
+        return _NONE
+
+    def __reduce__(self) -> tuple[type["Nothing[T]"], tuple[()]]:
+        return Nothing, ()
+
+    def __repr__(self) -> str:
+        return "None"
+
+    def is_some(self) -> bool:
+        return False
+
+    def is_none(self) -> bool:
+        return True
+
+    def is_some_and(self, f: Callable[[T], bool]) -> bool:
+        return False
+
+    def expect(self, message: str) -> T:
+        raise ValueError(message)
+
+    def unwrap(self) -> T:
+        raise UnwrapError("Option is None")
+
+    def unwrap_or(self, default: T) -> T:
+        return default
+
+    def unwrap_or_else(self, f: Callable[[], T]) -> T:
+        return f()
+
+    def map(self, f: Callable[[T], U]) -> "Option[U]":
+        return self  # type: ignore[return-value]
+
+    def map_or(self, default: U, f: Callable[[T], U]) -> U:
+        return default
+
+    def map_or_else(self, default_f: Callable[[], U], f: Callable[[T], U]) -> U:
+        return default_f()
+
+    def inspect(self, f: Callable[[T], None]) -> "Option[T]":
+        return self
+
+    def ok_or(self, err: E) -> "Result[T, E]":
+        return Err(err)
+
+    def ok_or_else(self, err_f: Callable[[], E]) -> "Result[T, E]":
+        return Err(err_f())
+
+    def and_(self, opt_b: "Option[U]") -> "Option[U]":
+        return self  # type: ignore[return-value]
+
+    def and_then(self, f: Callable[[T], "Option[U]"]) -> "Option[U]":
+        return self  # type: ignore[return-value]
+
+    def or_(self, opt_b: "Option[T]") -> "Option[T]":
+        return opt_b
+
+    def or_else(self, f: Callable[[], "Option[T]"]) -> "Option[T]":
+        return f()
+
+    def xor(self, opt_b: "Option[T]") -> "Option[T]":
+        return opt_b
+
+
+def collect_options(options: Iterable[Option[T]]) -> Option[list[T]]:
+    """Collect the values of an iterable of `Option`s into `Some(list)`, or return `None` at the first empty `Option`.
+
+    The iterable is consumed lazily and is not pulled from past the first empty `Option`.
+
+    Args:
+        options (`Iterable[Option[T]]`): The `Option`s to collect.
+
+    Returns:
+        `Option[list[T]]`: All values in order, or `None` if any `Option` was empty.
+    """
+    values: list[T] = []
+    append = values.append
+    for o in options:
+        if o is _NONE:
+            return _NONE
+        append(o.value)  # type: ignore[arg-type]
+    return Some(values)
+
+
+def filter_some(options: Iterable[Option[T]]) -> Iterator[T]:
+    """Lazily yield the values of an iterable of `Option`s, skipping empty ones.
+
+    Args:
+        options (`Iterable[Option[T]]`): The `Option`s to filter.
+
+    Returns:
+        `Iterator[T]`: The contained values, in order.
+    """
+    return (o.value for o in options if o is not _NONE)  # type: ignore[misc]
+
+
+# The slot setter (shared by both variants) bypasses the immutable `__setattr__` without going through
+# `object.__setattr__`. As in `result`, the member descriptor is read from the class `__dict__`.
+_new_object = object.__new__
+_set_value: Callable[[Any, Any], None] = Option.__dict__["value"].__set__
+
+_NONE: "Nothing[Any]" = _new_object(Nothing)
+_set_value(_NONE, None)
+
+# Imported last to break the cycle with `result`, which imports `Option` at its own end.
+from rusty_utils.result import Ok, Err  # noqa: E402
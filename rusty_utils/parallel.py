@@ -0,0 +1,188 @@
+import os
+import pickle
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, Executor, Future, ProcessPoolExecutor, \
+    ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from rusty_utils.result import Result, Err, Catch
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+_Chunk = list[Result[Any, BaseException]]
+# What `_Submitter.collect` needs besides the future: the chunk's length and the `Err`s of its items that were
+# never sent because they cannot be pickled, by position.
+_Sent = tuple[int, dict[int, Result[Any, BaseException]]]
+
+
+def _run_chunk(fn: Callable[[T], U], chunk: list[T], catch: tuple[type[BaseException], ...]) -> _Chunk:
+    """Worker entry point for thread pools."""
+    caught = Catch(*catch)(fn)
+    return [caught(item) for item in chunk]
+
+
+def _run_pickled_chunk(payload: bytes) -> bytes:
+    """Worker entry point for process pools.
+
+    The chunk arrives and leaves pre-pickled, so a value that cannot cross the process boundary is caught
+    here (or on submission) and reported as an `Err` for its own item instead of failing the whole future.
+    """
+    fn, chunk, catch = pickle.loads(payload)
+    results = _run_chunk(fn, chunk, catch)
+    try:
+        return pickle.dumps(results)
+    except Exception:
+        return pickle.dumps([_picklable(r) for r in results])
+
+
+def _picklable(result: Result[Any, BaseException]) -> Result[Any, BaseException]:
+    try:
+        pickle.dumps(result)
+    except Exception as e:
+        return Err(pickle.PicklingError(f"cannot pickle {result!r}: {e}"))
+    return result
+
+
+def map_results(
+        fn: Callable[[T], U],
+        items: Iterable[T],
+        executor: Executor | None = None,
+        catch: tuple[type[BaseException], ...] = (Exception,),
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+        chunksize: int = 1,
+) -> Iterator[Result[U, BaseException]]:
+    """
+    Maps `fn` over `items` on an executor, yielding one `Result` per item.
+
+    Each call runs under `Catch(*catch)` on the worker. Items are submitted lazily with at most
+    `max_in_flight` chunks outstanding, so memory stays flat however long `items` is. A crashed pool
+    (`BrokenExecutor`) becomes an `Err` for every item of the affected chunks, and on process pools an
+    argument or result that cannot be pickled becomes a `PicklingError` `Err` for its item.
+
+    Args:
+        fn (Callable[[T], U]): The function to apply. Must be picklable for process pools.
+        items (Iterable[T]): The inputs; consumed lazily.
+        executor (Executor | None): The pool to run on. A private `ThreadPoolExecutor` is created and shut
+            down if omitted.
+        catch (tuple[type[BaseException], ...]): Exception types turned into `Err` instead of propagating.
+        ordered (bool): Yield in input order if `True`, otherwise as chunks complete.
+        max_in_flight (int | None): Maximum outstanding chunks. Defaults to twice the number of CPUs.
+        chunksize (int): Items per submission. Larger chunks amortise IPC cost on process pools.
+
+    Returns:
+        Iterator[Result[U, BaseException]]: The results, as a generator.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if not catch or not all(isinstance(e, type) and issubclass(e, BaseException) for e in catch):
+        raise TypeError("map_results requires at least one exception type in `catch`")
+    if max_in_flight is not None and max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    return _map_results(fn, items, executor, catch, ordered, max_in_flight, chunksize)
+
+
+def _map_results(
+        fn: Callable[[T], U],
+        items: Iterable[T],
+        executor: Executor | None,
+        catch: tuple[type[BaseException], ...],
+        ordered: bool,
+        max_in_flight: int | None,
+        chunksize: int,
+) -> Iterator[Result[U, BaseException]]:
+    pool = ThreadPoolExecutor() if executor is None else executor
+    if max_in_flight is None:
+        max_in_flight = 2 * (os.cpu_count() or 1)
+
+    source = iter(items)
+    chunks = iter(lambda: list(islice(source, chunksize)), [])
+    submitter = _Submitter(pool, fn, catch)
+    generate = _ordered if ordered else _as_completed
+    try:
+        yield from generate(submitter, chunks, max_in_flight)
+    finally:
+        if executor is None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+class _Submitter:
+    """Submits chunks to a pool and turns their futures back into per-item `Result`s."""
+
+    __slots__ = ("pool", "fn", "catch", "pickled")
+
+    def __init__(self, pool: Executor, fn: Callable[[Any], Any], catch: tuple[type[BaseException], ...]) -> None:
+        self.pool = pool
+        self.fn = fn
+        self.catch = catch
+        self.pickled = isinstance(pool, ProcessPoolExecutor)
+
+    def submit(self, chunk: list[Any]) -> tuple["Future[Any]", _Sent]:
+        future: Future[Any]
+        failed: dict[int, Result[Any, BaseException]] = {}
+        try:
+            if self.pickled:
+                payload, failed = self._dump(chunk)
+                future = self.pool.submit(_run_pickled_chunk, payload)
+            else:
+                future = self.pool.submit(_run_chunk, self.fn, chunk, self.catch)
+        except (BrokenExecutor, pickle.PicklingError) as e:
+            future = Future()
+            future.set_exception(e)
+        return future, (len(chunk), failed)
+
+    def _dump(self, chunk: list[Any]) -> tuple[bytes, dict[int, Result[Any, BaseException]]]:
+        try:
+            return pickle.dumps((self.fn, chunk, self.catch)), {}
+        except Exception as e:
+            error = e
+        # Only pickle the items one by one once the chunk has failed, so that just the culprits get an `Err`.
+        failed: dict[int, Result[Any, BaseException]] = {}
+        for i, item in enumerate(chunk):
+            try:
+                pickle.dumps(item)
+            except Exception as e:
+                failed[i] = Err(pickle.PicklingError(f"cannot pickle argument {item!r}: {e}"))
+        if not failed:
+            raise pickle.PicklingError(f"cannot pickle the call: {error}") from error
+        payload, _ = self._dump([item for i, item in enumerate(chunk) if i not in failed])
+        return payload, failed
+
+    def collect(self, future: "Future[Any]", sent: _Sent) -> _Chunk:
+        size, failed = sent
+        error = future.exception()
+        results: _Chunk
+        if error is None:
+            results = pickle.loads(future.result()) if self.pickled else future.result()
+        elif isinstance(error, (BrokenExecutor, pickle.PicklingError)) or isinstance(error, self.catch):
+            results = [Err(error)] * (size - len(failed))
+        else:
+            raise error
+        if not failed:
+            return results
+        sent_results = iter(results)
+        return [failed[i] if i in failed else next(sent_results) for i in range(size)]
+
+
+def _ordered(submitter: _Submitter, chunks: Iterator[list[Any]], max_in_flight: int) -> Iterator[Result[Any, Any]]:
+    pending = deque(submitter.submit(chunk) for chunk in islice(chunks, max_in_flight))
+    while pending:
+        future, sent = pending.popleft()
+        results = submitter.collect(future, sent)
+        pending.extend(submitter.submit(chunk) for chunk in islice(chunks, 1))
+        yield from results
+
+
+def _as_completed(submitter: _Submitter, chunks: Iterator[list[Any]], max_in_flight: int) -> Iterator[
+    Result[Any, Any]
+]:
+    pending = dict(submitter.submit(chunk) for chunk in islice(chunks, max_in_flight))
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            results = submitter.collect(future, pending.pop(future))
+            pending.update(submitter.submit(chunk) for chunk in islice(chunks, 1))
+            yield from results
@@ -0,0 +1,546 @@
+import asyncio
+import inspect
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import wraps
+from typing import Any, Awaitable, Callable, Generic, NamedTuple, TypeGuard, TypeVar
+
+from rusty_utils.deadline import shared_pool
+from rusty_utils.result import Result, Ok, Err
+
+T = TypeVar("T")
+E = TypeVar("E", bound=BaseException)
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Attempts(NamedTuple, Generic[T, E]):
+    """
+    The outcome of running a call under a `Retry` or `Hedge` policy.
+
+    Attributes:
+        result (Result[T, E]): The final `Result`: the first `Ok`, or the last `Err` if every attempt failed.
+        attempts (int): Number of calls started, including the first one.
+        errors (tuple[E, ...]): The `Err` values of the failed attempts, in the order they finished.
+        elapsed (float): Seconds from the first call to the final `Result`.
+    """
+    result: Result[T, E]
+    attempts: int
+    errors: tuple[E, ...]
+    elapsed: float
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of recent traffic, so a struggling dependency is not hit with a retry storm.
+
+    Over a sliding window of `window` seconds a retry is allowed while
+    `retries < min_retries + ratio * calls`. A budget may be shared between several policies.
+    """
+
+    __slots__ = ("ratio", "min_retries", "window", "timer", "_calls", "_retries", "_lock")
+
+    def __init__(
+            self,
+            ratio: float = 0.2,
+            min_retries: int = 10,
+            window: float = 10.0,
+            timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ratio < 0 or min_retries < 0 or window <= 0:
+            raise ValueError("ratio and min_retries must be non-negative and window positive")
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self.timer = timer
+        self._calls: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        for stamps in (self._calls, self._retries):
+            while stamps and stamps[0] <= cutoff:
+                stamps.popleft()
+
+    def record_call(self) -> None:
+        """Record a first attempt."""
+        now = self.timer()
+        with self._lock:
+            self._expire(now)
+            self._calls.append(now)
+
+    def try_retry(self) -> bool:
+        """Spend one retry if the budget allows it."""
+        now = self.timer()
+        with self._lock:
+            self._expire(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._calls):
+                return False
+            self._retries.append(now)
+            return True
+
+
+class Retry:
+    """
+    Retries a `Result`-returning call while it returns an `Err` of a matching type.
+
+    Compose it with `Catch` so exceptions become `Err`s first; an exception that escapes the call is
+    propagated as-is. Delays grow exponentially from `base_delay` by `multiplier` up to `max_delay`, with
+    full jitter (a uniform draw between zero and the delay) unless `jitter` is false.
+
+    Example:
+        >>> fetch = Retry(on=(TimeoutError,), attempts=4)(Catch(TimeoutError, OSError)(fetch))
+        >>> fetch(url)  # Ok(...) or the last Err
+        >>> Retry(on=(TimeoutError,)).call(Catch(TimeoutError)(fetch), url).attempts
+        2
+
+    Args:
+        on (tuple[type[BaseException], ...]): `Err` types that are retried. Other `Err`s are returned at once.
+        attempts (int): Maximum number of calls, including the first one.
+        base_delay (float): Delay before the first retry, in seconds.
+        multiplier (float): Factor applied to the delay after each retry.
+        max_delay (float): Upper bound of a single delay.
+        jitter (bool): Randomize each delay between zero and its nominal value.
+        budget (RetryBudget | None): Shared budget that retries are drawn from.
+        sleep (Callable[[float], None]): Blocking sleep used by synchronous calls.
+    """
+
+    __slots__ = ("on", "attempts", "base_delay", "multiplier", "max_delay", "jitter", "budget", "sleep")
+
+    def __init__(
+            self,
+            on: tuple[type[BaseException], ...] = (Exception,),
+            attempts: int = 3,
+            base_delay: float = 0.1,
+            multiplier: float = 2.0,
+            max_delay: float = 10.0,
+            jitter: bool = True,
+            budget: RetryBudget | None = None,
+            sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        if not all(isinstance(e, type) and issubclass(e, BaseException) for e in on):
+            raise TypeError("Retry requires exception types in `on`")
+        self.on = on
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.budget = budget
+        self.sleep = sleep
+
+    def delay(self, retry: int) -> float:
+        """The delay before the `retry`-th retry (counting from 1)."""
+        nominal = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        return random.uniform(0, nominal) if self.jitter else nominal
+
+    def _should_retry(self, result: Result[Any, Any], attempt: int) -> TypeGuard[Err[Any, Any]]:
+        if result.__class__ is Ok or not isinstance(result, Err):
+            return False
+        if attempt >= self.attempts or not isinstance(result.value, self.on):
+            return False
+        return self.budget is None or self.budget.try_retry()
+
+    def call(self, fn: Callable[..., Result[T, E]], *args: Any, **kwargs: Any) -> Attempts[T, E]:
+        """Run `fn(*args, **kwargs)` under the policy and return the final `Result` with its metadata."""
+        if self.budget is not None:
+            self.budget.record_call()
+        start = time.monotonic()
+        errors: list[E] = []
+        attempt = 1
+        result = fn(*args, **kwargs)
+        while self._should_retry(result, attempt):
+            errors.append(result.value)
+            self.sleep(self.delay(attempt))
+            attempt += 1
+            result = fn(*args, **kwargs)
+        if isinstance(result, Err):
+            errors.append(result.value)
+        return Attempts(result, attempt, tuple(errors), time.monotonic() - start)
+
+    async def call_async(
+            self, fn: Callable[..., Awaitable[Result[T, E]]], *args: Any, **kwargs: Any
+    ) -> Attempts[T, E]:
+        """Awaitable counterpart of `call` for coroutine functions. Sleeps with `asyncio.sleep`."""
+        if self.budget is not None:
+            self.budget.record_call()
+        start = time.monotonic()
+        errors: list[E] = []
+        attempt = 1
+        result = await fn(*args, **kwargs)
+        while self._should_retry(result, attempt):
+            errors.append(result.value)
+            await asyncio.sleep(self.delay(attempt))
+            attempt += 1
+            result = await fn(*args, **kwargs)
+        if isinstance(result, Err):
+            errors.append(result.value)
+        return Attempts(result, attempt, tuple(errors), time.monotonic() - start)
+
+    def __call__(self, fn: F) -> F:
+        """Decorate `fn` so that each call runs under the policy and returns the final `Result`."""
+        return _decorate(self, fn)
+
+
+class Hedge:
+    """
+    Starts a duplicate call when the previous one has not returned after `delay` seconds and takes the
+    first `Ok`.
+
+    Up to `max_attempts` calls run concurrently. An `Err` that finishes early launches the next attempt
+    straight away. If every attempt fails, the last `Err` to finish is returned. Synchronous calls run on
+    `executor` (a shared thread pool by default) and losers are left to finish in the background;
+    asynchronous losers are cancelled. Only hedge idempotent calls.
+
+    Args:
+        delay (float): Seconds to wait for an outstanding attempt before starting another.
+        max_attempts (int): Maximum number of calls, including the first one.
+        executor (ThreadPoolExecutor | None): Pool for synchronous attempts.
+    """
+
+    __slots__ = ("delay", "max_attempts", "executor")
+
+    def __init__(self, delay: float, max_attempts: int = 2, executor: ThreadPoolExecutor | None = None) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if delay < 0:
+            raise ValueError("delay must be non-negative")
+        self.delay = delay
+        self.max_attempts = max_attempts
+        self.executor = executor
+
+    def call(self, fn: Callable[..., Result[T, E]], *args: Any, **kwargs: Any) -> Attempts[T, E]:
+        """Run `fn(*args, **kwargs)` under the policy and return the first `Ok` with its metadata."""
+        pool = self.executor or shared_pool()
+        start = time.monotonic()
+        errors: list[E] = []
+        pending: set[Future[Result[T, E]]] = {pool.submit(fn, *args, **kwargs)}
+        launched = 1
+        while True:
+            can_hedge = launched < self.max_attempts
+            done, pending = wait(pending, timeout=self.delay if can_hedge else None, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result.__class__ is Ok or not isinstance(result, Err):
+                    return Attempts(result, launched, tuple(errors), time.monotonic() - start)
+                errors.append(result.value)
+            if can_hedge:
+                pending.add(pool.submit(fn, *args, **kwargs))
+                launched += 1
+            elif not pending:
+                return Attempts(result, launched, tuple(errors), time.monotonic() - start)
+
+    async def call_async(
+            self, fn: Callable[..., Awaitable[Result[T, E]]], *args: Any, **kwargs: Any
+    ) -> Attempts[T, E]:
+        """Awaitable counterpart of `call` for coroutine functions."""
+        start = time.monotonic()
+        errors: list[E] = []
+        pending: set[asyncio.Future[Result[T, E]]] = {asyncio.ensure_future(fn(*args, **kwargs))}
+        launched = 1
+        try:
+            while True:
+                can_hedge = launched < self.max_attempts
+                done, pending = await asyncio.wait(
+                    pending, timeout=self.delay if can_hedge else None, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    if result.__class__ is Ok or not isinstance(result, Err):
+                        return Attempts(result, launched, tuple(errors), time.monotonic() - start)
+                    errors.append(result.value)
+                if can_hedge:
+                    pending.add(asyncio.ensure_future(fn(*args, **kwargs)))
+                    launched += 1
+                elif not pending:
+                    return Attempts(result, launched, tuple(errors), time.monotonic() - start)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def __call__(self, fn: F) -> F:
+        """Decorate `fn` so that each call runs under the policy and returns the final `Result`."""
+        return _decorate(self, fn)
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    The `Err` value a `CircuitBreaker` returns for a call it rejects without running.
+
+    Attributes:
+        retry_after (float): Seconds until the breaker lets a probe call through, or 0 while probes are running.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"circuit open, retry in {retry_after:.3g}s")
+        self.retry_after = retry_after
+
+
+class CircuitStats(NamedTuple):
+    """
+    A point-in-time view of a `CircuitBreaker`, for metrics.
+
+    Attributes:
+        state (str): `"closed"`, `"open"` or `"half_open"`.
+        calls (int): Calls recorded in the current window (closed) or probes completed (half-open).
+        failures (int): Failed calls among them.
+        rejected (int): Calls rejected with `CircuitOpenError` since the breaker was created.
+        opened (int): Number of times the breaker has opened.
+    """
+    state: str
+    calls: int
+    failures: int
+    rejected: int
+    opened: int
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing dependency, returning `Err(CircuitOpenError)` at once instead.
+
+    While closed, calls run and their outcomes are kept for a sliding window of `window` seconds. Once the window
+    holds at least `min_calls` calls and the share of failures reaches `failure_ratio`, the breaker opens and
+    rejects every call for `reset_timeout` seconds. It then turns half-open and lets up to `half_open_calls`
+    probes through: if they all succeed it closes, and the first failure opens it again.
+
+    A call fails when it returns an `Err` whose value is an instance of `on`, or raises an exception (which is
+    propagated). Other `Err`s, such as "not found", count as successes. Compose with `Catch` so exceptions become
+    `Err`s first, and apply the breaker outside of `Retry` so retries of a rejected call are not attempted.
+
+    The state is guarded by a lock that is only held for bookkeeping, never across the call, so one breaker can
+    be shared between threads and coroutines. Outcomes of calls started before the last state change are ignored.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_ratio=0.5, min_calls=20, reset_timeout=30.0)
+        >>> @breaker
+        ... @Catch(TimeoutError, OSError)
+        ... def fetch(url: str) -> bytes: ...
+        >>> breaker.stats()
+        CircuitStats(state='closed', calls=0, failures=0, rejected=0, opened=0)
+
+    Args:
+        failure_ratio (float): Share of failed calls in the window that opens the breaker, between 0 and 1.
+        min_calls (int): Calls the window must hold before the ratio is checked.
+        window (float): Length of the sliding window, in seconds.
+        reset_timeout (float): Seconds to stay open before probing.
+        half_open_calls (int): Probe calls allowed, and required to succeed, while half-open.
+        on (tuple[type[BaseException], ...]): `Err` types counted as failures.
+        timer (Callable[[], float]): Monotonic clock.
+        on_state_change (Callable[[str, str], Any] | None): Called with the old and new state after each change,
+            outside of the lock.
+    """
+
+    __slots__ = (
+        "failure_ratio", "min_calls", "window", "reset_timeout", "half_open_calls", "on", "timer",
+        "on_state_change", "_lock", "_state", "_generation", "_outcomes", "_failures", "_probes", "_successes",
+        "_opened_at", "_rejected", "_opened",
+    )
+
+    def __init__(
+            self,
+            failure_ratio: float = 0.5,
+            min_calls: int = 20,
+            window: float = 10.0,
+            reset_timeout: float = 30.0,
+            half_open_calls: int = 1,
+            on: tuple[type[BaseException], ...] = (Exception,),
+            timer: Callable[[], float] = time.monotonic,
+            on_state_change: Callable[[str, str], Any] | None = None,
+    ) -> None:
+        if not 0 < failure_ratio <= 1:
+            raise ValueError("failure_ratio must be in (0, 1]")
+        if min_calls < 1 or half_open_calls < 1:
+            raise ValueError("min_calls and half_open_calls must be at least 1")
+        if window <= 0 or reset_timeout < 0:
+            raise ValueError("window must be positive and reset_timeout non-negative")
+        if not all(isinstance(e, type) and issubclass(e, BaseException) for e in on):
+            raise TypeError("CircuitBreaker requires exception types in `on`")
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self.on = on
+        self.timer = timer
+        self.on_state_change = on_state_change
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._generation = 0
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures = 0
+        self._probes = 0
+        self._successes = 0
+        self._opened_at = 0.0
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> str:
+        """The current state: `"closed"`, `"open"` or `"half_open"`."""
+        return self.stats().state
+
+    def stats(self) -> CircuitStats:
+        """The current state and counters."""
+        now = self.timer()
+        with self._lock:
+            before = self._state
+            self._advance(now)
+            if self._state == CLOSED:
+                self._expire(now)
+                stats = CircuitStats(CLOSED, len(self._outcomes), self._failures, self._rejected, self._opened)
+            else:
+                stats = CircuitStats(self._state, self._successes, 0, self._rejected, self._opened)
+        self._notify(before, stats.state)
+        return stats
+
+    def _notify(self, before: str, after: str) -> None:
+        if before != after and self.on_state_change is not None:
+            self.on_state_change(before, after)
+
+    def _transition(self, state: str, now: float) -> None:
+        self._state = state
+        self._generation += 1
+        self._outcomes.clear()
+        self._failures = self._probes = self._successes = 0
+        if state == OPEN:
+            self._opened_at = now
+            self._opened += 1
+
+    def _advance(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._transition(HALF_OPEN, now)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        outcomes = self._outcomes
+        while outcomes and outcomes[0][0] <= cutoff:
+            self._failures -= outcomes.popleft()[1]
+
+    def _admit(self) -> int | CircuitOpenError:
+        """Return the generation token for an admitted call, or the error for a rejected one."""
+        now = self.timer()
+        with self._lock:
+            before = self._state
+            self._advance(now)
+            state = self._state
+            if state == CLOSED:
+                token: int | CircuitOpenError = self._generation
+            elif state == HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                token = self._generation
+            else:
+                self._rejected += 1
+                token = CircuitOpenError(max(0.0, self._opened_at + self.reset_timeout - now))
+        self._notify(before, state)
+        return token
+
+    def _record(self, token: int, failed: bool) -> None:
+        now = self.timer()
+        with self._lock:
+            if token != self._generation:
+                return
+            before = self._state
+            if before == HALF_OPEN:
+                if failed:
+                    self._transition(OPEN, now)
+                else:
+                    self._successes += 1
+                    if self._successes >= self.half_open_calls:
+                        self._transition(CLOSED, now)
+            else:
+                self._expire(now)
+                self._outcomes.append((now, failed))
+                self._failures += failed
+                calls = len(self._outcomes)
+                if calls >= self.min_calls and self._failures >= self.failure_ratio * calls:
+                    self._transition(OPEN, now)
+            after = self._state
+        self._notify(before, after)
+
+    def _release(self, token: int) -> None:
+        # A probe that was cancelled or interrupted frees its slot without counting either way.
+        with self._lock:
+            if token == self._generation and self._state == HALF_OPEN:
+                self._probes -= 1
+
+    def _failed(self, result: Result[Any, Any]) -> bool:
+        return result.__class__ is not Ok and isinstance(result, Err) and isinstance(result.value, self.on)
+
+    def call(
+            self, fn: Callable[..., Result[T, E]], *args: Any, **kwargs: Any
+    ) -> Result[T, E] | Err[T, CircuitOpenError]:
+        """Run `fn(*args, **kwargs)` if the breaker admits it, otherwise return `Err(CircuitOpenError)`."""
+        token = self._admit()
+        if isinstance(token, CircuitOpenError):
+            return Err(token)
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self._record(token, True)
+            raise
+        except BaseException:
+            self._release(token)
+            raise
+        self._record(token, self._failed(result))
+        return result
+
+    async def call_async(
+            self, fn: Callable[..., Awaitable[Result[T, E]]], *args: Any, **kwargs: Any
+    ) -> Result[T, E] | Err[T, CircuitOpenError]:
+        """Awaitable counterpart of `call` for coroutine functions. A rejected call's coroutine is never created."""
+        token = self._admit()
+        if isinstance(token, CircuitOpenError):
+            return Err(token)
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception:
+            self._record(token, True)
+            raise
+        except BaseException:
+            self._release(token)
+            raise
+        self._record(token, self._failed(result))
+        return result
+
+    def __call__(self, fn: F) -> F:
+        """Decorate `fn` so that each call goes through the breaker."""
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await self.call_async(fn, *args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.call(fn, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(state={self.state!r}, failure_ratio={self.failure_ratio}, min_calls={self.min_calls})"
+
+
+def _decorate(policy: Retry | Hedge, fn: F) -> F:
+    if inspect.iscoroutinefunction(fn):
+        @wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            return (await policy.call_async(fn, *args, **kwargs)).result
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return policy.call(fn, *args, **kwargs).result
+
+    return wrapper  # type: ignore[return-value]
@@ -1,11 +1,16 @@
-import inspect
-from dataclasses import dataclass
-from typing import TypeVar, Generic, Optional, Callable, TYPE_CHECKING, ParamSpec, Union, overload
+from typing import (
+    Any, AsyncIterator, Awaitable, Coroutine, Iterable, Iterator, Literal, TypeVar, Generic, Optional, Callable, TYPE_CHECKING, ParamSpec, Union,
+    overload,
+)
 
 if TYPE_CHECKING:
-    from rusty_utils.option import Option
+    from weakref import WeakKeyDictionary
 
-from rusty_utils.common import UnwrapError
+    from rusty_utils.metrics import Sink
+
+from rusty_utils.common import (
+    UnwrapError, TracebackSummary, Handlers, reduce_exception, rebuild_exception, release_traceback, resolve_handler,
+)
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -13,18 +18,42 @@ E = TypeVar("E", bound=BaseException)
 F = TypeVar("F", bound=BaseException)
 P = ParamSpec("P")
 
+TracebackMode = Literal["keep", "drop", "summary"]
+
 
-@dataclass(frozen=True)
 class Ok(Generic[T, E]):
     """
     Represents a successful `Result` with an `Ok` value.
+
+    Instances are immutable and slotted. `Ok(None)`, `Ok(True)` and `Ok(False)` are shared
+    instances, so constructing them does not allocate.
     
     Attributes:
         value (T): The value held in a successful `Result`.
     """
 
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+
     value: T
 
+    def __new__(cls, value: T) -> "Ok[T, E]":
+        if value is None or value is True or value is False:
+            if cls is Ok:
+                return _OK_CACHE[value]  # type: ignore[return-value]
+        self = _new_object(cls)
+        _set_ok_value(self, value)
+        return self
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to field {name!r} of an immutable `Ok`")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r} of an immutable `Ok`")
+
+    def __reduce__(self) -> tuple[type["Ok[T, E]"], tuple[T]]:
+        return Ok, (self.value,)
+
     def is_ok(self) -> bool:
         """Checks if the `Result` is an `Ok` value."""
         return True
@@ -35,12 +64,10 @@ class Ok(Generic[T, E]):
 
     def ok(self) -> "Option[T]":
         """Retrieves the `Ok` value."""
-        from rusty_utils.option import Option
         return Option(self.value)
 
     def err(self) -> "Option[E]":
         """Retrieves the `Err` value, which in this case is `None` since it's an `Ok`."""
-        from rusty_utils.option import Option
         return Option(None)
 
     def map(self, f: Callable[[T], U]) -> "Result[U, E]":
@@ -57,7 +84,7 @@ class Ok(Generic[T, E]):
 
     def map_err(self, f: Callable[[E], F]) -> "Result[T, F]":
         """Passes through the `Ok` value without transforming the `Err`."""
-        return Ok(self.value)
+        return self  # type: ignore[return-value]
 
     def expect(self, msg: str) -> T:
         """
@@ -125,7 +152,35 @@ class Ok(Generic[T, E]):
         Returns:
             Result[T, F]: The current `Ok` value or the provided `Result`.
         """
-        return Ok(self.value)
+        return self  # type: ignore[return-value]
+
+    def and_then(self, f: Callable[[T], "Result[U, E]"]) -> "Result[U, E]":
+        """Calls `f` with the `Ok` value and returns its `Result`."""
+        return f(self.value)
+
+    def or_else(self, f: Callable[[E], "Result[T, F]"]) -> "Result[T, F]":
+        """Passes through the `Ok` value without calling `f`."""
+        return self  # type: ignore[return-value]
+
+    def match_err(self, handlers: "Handlers") -> "Result[T, Any]":
+        """Passes through the `Ok` value without dispatching."""
+        return self
+
+    def handle(self, handlers: "Handlers") -> T:
+        """Returns the `Ok` value without dispatching."""
+        return self.value
+
+    async def map_async(self, f: Callable[[T], Awaitable[U]]) -> "Result[U, E]":
+        """Awaits `f` on the `Ok` value and wraps the outcome in `Ok`."""
+        return Ok(await f(self.value))
+
+    async def and_then_async(self, f: Callable[[T], Awaitable["Result[U, E]"]]) -> "Result[U, E]":
+        """Awaits `f` on the `Ok` value and returns its `Result`."""
+        return await f(self.value)
+
+    async def map_err_async(self, f: Callable[[E], Awaitable[F]]) -> "Result[T, F]":
+        """Passes through the `Ok` value without awaiting `f`."""
+        return self  # type: ignore[return-value]
 
     def __repr__(self) -> str:
         return f"Ok({self.value})"
@@ -134,19 +189,51 @@ class Ok(Generic[T, E]):
         if not isinstance(other, Ok):
             return False
 
-        return bool(self.value == other.value)
+        return self.value is other.value or bool(self.value == other.value)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
 
 
-@dataclass(frozen=True)
 class Err(Generic[T, E]):
     """
     Represents a failed `Result` with an `Err` value.
+
+    Instances are immutable and slotted.
     
     Attributes:
         value (E): The error contained in the `Err`.
+        traceback (TracebackSummary | None): A frame-free summary of where `value` was raised, set by
+            `Catch(..., traceback="summary")`.
     """
 
+    __slots__ = ("value", "traceback", "_identity_cache")
+    __match_args__ = ("value",)
+
     value: E
+    traceback: TracebackSummary | None
+    _identity_cache: tuple[object, int] | None
+
+    def __new__(cls, value: E, traceback: TracebackSummary | None = None) -> "Err[T, E]":
+        self = _new_object(cls)
+        _set_err_value(self, value)
+        _set_err_traceback(self, traceback)
+        _set_err_identity(self, None)
+        return self
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to field {name!r} of an immutable `Err`")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r} of an immutable `Err`")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        value = self.value
+        if isinstance(value, BaseException):
+            # Pickle the exception as type + args + state, so types with a custom `__init__` round-trip.
+            summary = self.traceback
+            return _rebuild_err, (*reduce_exception(value), summary.frames if summary is not None else None)
+        return Err, (value,)
 
     def is_ok(self) -> bool:
         """Checks if the `Result` is an `Ok` value."""
@@ -158,17 +245,15 @@ class Err(Generic[T, E]):
 
     def ok(self) -> "Option[T]":
         """Retrieves the `Ok` value, which is `None` in this case."""
-        from rusty_utils.option import Option
         return Option(None)
 
     def err(self) -> "Option[E]":
         """Retrieves the `Err` value."""
-        from rusty_utils.option import Option
         return Option(self.value)
 
     def map(self, f: Callable[[T], U]) -> "Result[U, E]":
         """Passes through the `Err` value without transforming it."""
-        return Err(self.value)
+        return self  # type: ignore[return-value]
 
     def map_or(self, default: U, f: Callable[[T], U]) -> U:
         """Returns the default value as this is an `Err`."""
@@ -236,7 +321,7 @@ class Err(Generic[T, E]):
         Returns:
             Result[U, E]: The provided `Result` or the current `Err`.
         """
-        return Err(self.value)
+        return self  # type: ignore[return-value]
 
     def or_(self, other: "Result[T, F]") -> "Result[T, F]":
         """
@@ -250,65 +335,606 @@ class Err(Generic[T, E]):
         """
         return other
 
+    def and_then(self, f: Callable[[T], "Result[U, E]"]) -> "Result[U, E]":
+        """Passes through the `Err` value without calling `f`."""
+        return self  # type: ignore[return-value]
+
+    def or_else(self, f: Callable[[E], "Result[T, F]"]) -> "Result[T, F]":
+        """Calls `f` with the `Err` value and returns its `Result`."""
+        return f(self.value)
+
+    def match_err(self, handlers: "Handlers") -> "Result[T, Any]":
+        """
+        Dispatches the `Err` value to the handler registered for its type, like a typed `or_else`.
+
+        The handler is found through the error's MRO, so the most specific registered type wins.
+
+        Args:
+            handlers (ErrorDispatcher | Mapping[type, Callable[[E], Result]]): Handlers keyed by exception type.
+                A reusable `ErrorDispatcher` caches the lookup per concrete exception class.
+
+        Returns:
+            Result[T, Any]: The handler's `Result`, or this `Err` if no handler matches.
+        """
+        handler = resolve_handler(handlers, self.value.__class__)
+        return self if handler is None else handler(self.value)
+
+    def handle(self, handlers: "Handlers") -> T:
+        """
+        Dispatches the `Err` value to the handler registered for its type, like a typed `unwrap_or_else`.
+
+        Args:
+            handlers (ErrorDispatcher | Mapping[type, Callable[[E], T]]): Handlers keyed by exception type.
+
+        Returns:
+            T: The handler's return value. If no handler matches, the `Err` value is raised.
+        """
+        handler = resolve_handler(handlers, self.value.__class__)
+        if handler is None:
+            raise self.value
+        return handler(self.value)  # type: ignore[no-any-return]
+
+    async def map_async(self, f: Callable[[T], Awaitable[U]]) -> "Result[U, E]":
+        """Passes through the `Err` value without awaiting `f`."""
+        return self  # type: ignore[return-value]
+
+    async def and_then_async(self, f: Callable[[T], Awaitable["Result[U, E]"]]) -> "Result[U, E]":
+        """Passes through the `Err` value without awaiting `f`."""
+        return self  # type: ignore[return-value]
+
+    async def map_err_async(self, f: Callable[[E], Awaitable[F]]) -> "Result[T, F]":
+        """Awaits `f` on the `Err` value and wraps the outcome in `Err`."""
+        return Err(await f(self.value))
+
     def __repr__(self) -> str:
         return f"Err({self.value})"
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Err):
-            return False
+    def __eq__(self, other: Any) -> bool:
+        """
+        Two `Err`s are equal if their exceptions have the same type and `args`.
 
-        return str(self.value) == str(other.value)
+        Non-exception values are compared with `==`. The comparison key is computed once per `Err`.
+        """
+        if other.__class__ is not Err and not isinstance(other, Err):
+            return False
+        if self is other or self.value is other.value:
+            return True
+
+        mine = self._identity_cache or self._identity()
+        theirs = other._identity_cache or other._identity()
+        return mine[1] == theirs[1] and bool(mine[0] == theirs[0])
+
+    def __hash__(self) -> int:
+        return (self._identity_cache or self._identity())[1]
+
+    def _identity(self) -> tuple[object, int]:
+        """Returns the cached `(equality key, hash)` pair, computing it on first use."""
+        identity = self._identity_cache
+        if identity is None:
+            value = self.value
+            key: object = (value.__class__, value.args) if isinstance(value, BaseException) else value
+            try:
+                hashed = hash(key)
+            except TypeError:
+                # Unhashable args: fall back to the type, which equal keys always share.
+                hashed = hash(value.__class__)
+            identity = (key, hashed)
+            _set_err_identity(self, identity)
+        return identity
 
 
 Result = Union[Ok[T, E], Err[T, E]]
 
+# Slot setters bypass the immutable `__setattr__` without going through `object.__setattr__`. The member
+# descriptors are read from the class `__dict__`, since attribute access on the class is typed as the field.
+_SlotSetter = Callable[[Any, Any], None]
+_new_object = object.__new__
+_set_ok_value: _SlotSetter = Ok.__dict__["value"].__set__
+_set_err_value: _SlotSetter = Err.__dict__["value"].__set__
+_set_err_traceback: _SlotSetter = Err.__dict__["traceback"].__set__
+_set_err_identity: _SlotSetter = Err.__dict__["_identity_cache"].__set__
+
+
+def _make_cached_ok(value: T) -> "Ok[T, E]":
+    ok = _new_object(Ok)
+    _set_ok_value(ok, value)
+    return ok
+
+
+_OK_CACHE: dict[object, "Ok[object, BaseException]"] = {
+    None: _make_cached_ok(None),
+    True: _make_cached_ok(True),
+    False: _make_cached_ok(False),
+}
+
+
+
+def _rebuild_err(
+        cls: type[E],
+        args: tuple[Any, ...],
+        state: dict[str, Any] | None,
+        frames: tuple[tuple[str, int, str], ...] | None = None,
+) -> "Err[Any, E]":
+    exc = rebuild_exception(cls, args, state)
+    return Err(exc, TracebackSummary(exc, frames) if frames is not None else None)  # type: ignore[arg-type]
+
+
+def _err_dropping_traceback(exc: E) -> "Err[Any, E]":
+    release_traceback(exc)
+    return Err(exc)
+
+
+def _err_summarizing_traceback(exc: E) -> "Err[Any, E]":
+    summary = TracebackSummary.capture(exc)
+    release_traceback(exc)
+    return Err(exc, summary)
+
+
+# What `Catch(..., traceback=...)` builds from a caught exception.
+_ERR_FACTORIES: dict[str, Callable[[Any], "Err[Any, Any]"]] = {
+    "keep": Err,
+    "drop": _err_dropping_traceback,
+    "summary": _err_summarizing_traceback,
+}
+
 
-# Decorator
+def collect(results: Iterable["Result[T, E]"]) -> "Result[list[T], E]":
+    """
+    Collects the `Ok` values of an iterable into `Ok(list)`, or returns the first `Err`.
+
+    The iterable is consumed lazily and is not pulled from past the first `Err`.
+
+    Args:
+        results (Iterable[Result[T, E]]): The `Result`s to collect.
+
+    Returns:
+        Result[list[T], E]: All `Ok` values in order, or the first `Err` encountered.
+    """
+    values: list[T] = []
+    # The class tests below do not narrow `r`, so the appenders take the `value` of either variant as `Any`.
+    append: Callable[[Any], None] = values.append
+    for r in results:
+        # The exact-class test short-circuits the comparatively slow `isinstance` for plain `Ok`s.
+        if r.__class__ is not Ok and isinstance(r, Err):
+            return r  # type: ignore[return-value]
+        append(r.value)
+    return Ok(values)
+
+
+def partition(results: Iterable["Result[T, E]"]) -> tuple[list[T], list[E]]:
+    """
+    Splits an iterable of `Result`s into its `Ok` values and its `Err` values, both in order.
+
+    Args:
+        results (Iterable[Result[T, E]]): The `Result`s to split.
+
+    Returns:
+        tuple[list[T], list[E]]: The `Ok` values and the `Err` values.
+    """
+    oks: list[T] = []
+    errs: list[E] = []
+    ok_append: Callable[[Any], None] = oks.append
+    err_append: Callable[[Any], None] = errs.append
+    for r in results:
+        if r.__class__ is not Ok and isinstance(r, Err):
+            err_append(r.value)
+        else:
+            ok_append(r.value)
+    return oks, errs
+
+
+def filter_ok(results: Iterable["Result[T, E]"]) -> Iterator[T]:
+    """Lazily yields the `Ok` values of an iterable, skipping `Err`s."""
+    items: Iterable[Any] = results  # The class tests do not narrow, see `collect`.
+    return (r.value for r in items if r.__class__ is Ok or not isinstance(r, Err))
+
+
+def filter_err(results: Iterable["Result[T, E]"]) -> Iterator[E]:
+    """Lazily yields the `Err` values of an iterable, skipping `Ok`s."""
+    items: Iterable[Any] = results
+    return (r.value for r in items if r.__class__ is Err or (r.__class__ is not Ok and isinstance(r, Err)))
+
+
+class Catcher(Generic[E]):
+    """
+    What `Catch(E)` returns without `func`: a decorator, and a context manager for inline blocks.
+
+    As a context manager it is its own slot: `__enter__` returns it, and after the block `result` holds
+    `Ok(value)` (`value` is `None` unless the block assigned it) or the `Err` of a caught exception, which
+    is suppressed. Exceptions of other types propagate. Use a fresh `Catch(...)` per `with` statement;
+    a `Catcher` shared between threads or nested blocks would overwrite its own slot.
+
+    Example:
+        >>> with Catch(KeyError) as slot:
+        ...     slot.value = config["port"]
+        >>> port = slot.result.unwrap_or(8080)
+    """
+
+    __slots__ = ("err_type", "make_err", "metrics", "timeout", "value", "result")
+
+    def __init__(
+            self,
+            err_type: tuple[type[E], ...],
+            make_err: Callable[[Any], "Err[Any, E]"],
+            metrics: "Sink | None",
+            timeout: float | None = None,
+    ) -> None:
+        self.err_type = err_type
+        self.make_err = make_err
+        self.metrics = metrics
+        self.timeout = timeout
+        self.value: Any = None
+        self.result: "Result[Any, E] | None" = None
+
+    def __enter__(self) -> "Catcher[E]":
+        if self.timeout is not None:
+            raise TypeError("Catch(timeout=...) needs a function; a with block cannot be interrupted")
+        self.value = None
+        self.result = None
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: Any) -> bool:
+        if exc_type is None:
+            self.result = Ok(self.value)
+            return False
+        if issubclass(exc_type, self.err_type):
+            self.result = self.make_err(exc)
+            return True
+        return False
+
+    # The coroutine and async generator overloads overlap the plain one, whose `T` could be a coroutine or an
+    # async iterator; mypy picks the first match, which is the precise one.
+    @overload
+    def __call__(  # type: ignore[overload-overlap]
+            self, f: Callable[P, Coroutine[Any, Any, T]]
+    ) -> Callable[P, Coroutine[Any, Any, "Result[T, E]"]]: ...
+
+    @overload
+    def __call__(  # type: ignore[overload-overlap]
+            self, f: Callable[P, AsyncIterator[T]]
+    ) -> Callable[P, AsyncIterator["Result[T, E]"]]: ...
+
+    @overload
+    def __call__(self, f: Callable[P, T]) -> Callable[P, "Result[T, E]"]: ...
+
+    def __call__(self, f: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap `f` so that it returns a `Result` instead of raising one of the caught exceptions."""
+        return _decorate(self.err_type, self.make_err, self.metrics, self.timeout, f)
+
+    def __repr__(self) -> str:
+        names = ", ".join(e.__name__ for e in self.err_type)
+        return f"Catch({names})" if self.result is None else f"Catch({names}) -> {self.result!r}"
+
+
+# Decorator or context manager
 @overload
-def Catch(*err_type: type[E]) -> Callable[[Callable[P, T]], Callable[P, "Result[T, E]"]]: ...
+def Catch(
+        *err_type: type[E],
+        traceback: TracebackMode = "keep",
+        metrics: "Sink | None" = None,
+        timeout: float | None = None,
+) -> Catcher[E]: ...
 
 
-# Direct call
+# Direct call of a coroutine function. This and the next overload overlap the plain direct call, whose `T`
+# could be a coroutine or an async iterator; mypy picks the first match, which is the precise one.
+@overload
+def Catch(  # type: ignore[overload-overlap]
+        *err_type: type[E],
+        func: Callable[P, Coroutine[Any, Any, T]],
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        traceback: TracebackMode = "keep",
+        metrics: "Sink | None" = None,
+) -> Coroutine[Any, Any, "Result[T, E]"]: ...
+
+
+# Direct call of an async generator function
 @overload
-def Catch(*err_type: type[E], func: Callable[P, T]) -> "Result[T, E]": ...
+def Catch(  # type: ignore[overload-overlap]
+        *err_type: type[E],
+        func: Callable[P, AsyncIterator[T]],
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        traceback: TracebackMode = "keep",
+        metrics: "Sink | None" = None,
+) -> AsyncIterator["Result[T, E]"]: ...
 
 
-def Catch(*err_type: type[E], func: Optional[Callable[P, T]] = None) -> Union[
-    Callable[[Callable[P, T]], Callable[P, "Result[T, E]"]],
-    "Result[T, E]"
+# Direct call
+@overload
+def Catch(
+        *err_type: type[E],
+        func: Callable[P, T],
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        traceback: TracebackMode = "keep",
+        metrics: "Sink | None" = None,
+        timeout: float | None = None,
+) -> "Result[T, E]": ...
+
+
+def Catch(
+        *err_type: type[E],
+        func: Optional[Callable[..., Any]] = None,
+        args: tuple[Any, ...] = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        traceback: TracebackMode = "keep",
+        metrics: "Sink | None" = None,
+        timeout: float | None = None,
+) -> Union[
+    Catcher[E],
+    "Result[Any, E]",
+    Coroutine[Any, Any, "Result[Any, E]"],
+    AsyncIterator["Result[Any, E]"],
 ]:
     """
     A decorator that captures exceptions and returns a `Result`.
     
     If an exception occurs, it returns an `Err` containing the exception; 
     otherwise, it returns an `Ok` containing the function's result.
+
+    Coroutine functions are wrapped into coroutine functions whose awaitable resolves to a `Result`,
+    and async generator functions into async generators that yield `Ok(item)` per item and a final
+    `Err` if iteration raises.
+
+    Without `func`, the returned `Catcher` is also a context manager: `with Catch(E) as slot:` runs an
+    inline block without a closure or an extra frame and leaves its outcome in `slot.result`. With
+    `func`, the function is called at once with `args` and `kwargs`, and coroutine and async generator
+    functions are handled as by the decorator.
+
+    A caught exception keeps its `__traceback__` by default, which keeps every frame (and local variable)
+    of the failing call alive for as long as the `Err` does. `traceback="drop"` clears the traceback of the
+    exception and its chain; `traceback="summary"` does the same but first records a frame-free
+    `TracebackSummary` on `Err.traceback`.
+
+    With `metrics`, every call reports its outcome and duration to the sink (see `rusty_utils.metrics`);
+    an async generator reports once, when it is exhausted or yields its `Err`. Without it no timing code
+    is added to the wrapper. `with` blocks are not reported.
+
+    With `timeout`, a synchronous function runs on a shared worker pool and the call returns
+    `Err(TimeoutError)` after `timeout` seconds, or sooner if the caller's deadline (see
+    `rusty_utils.deadline`) is closer; nested timed calls share that budget. The abandoned call keeps
+    running in the background, holding a worker of the bounded pool (see `deadline.set_shared_pool`).
+    Coroutine functions and `with` blocks do not accept a timeout.
     
     Args:
         err_type (type[E]): One or more exception types to catch.
         func (Callable[P, T]): The function to execute.
+        args (tuple[Any, ...]): Positional arguments for `func`.
+        kwargs (dict[str, Any] | None): Keyword arguments for `func`.
+        traceback (TracebackMode): `"keep"`, `"drop"` or `"summary"`.
+        metrics (Sink | None): Where to report each call, e.g. a `rusty_utils.metrics.Metrics`.
+        timeout (float | None): Deadline for each call of a synchronous function, in seconds.
     
     Returns:
-        Either a `Result` containing `Ok` if the function executes without exception, or an `Err`.
+        A `Catcher` without `func`; otherwise a `Result` containing `Ok` if the function executes without
+        exception, or an `Err` (as an awaitable for coroutine functions, and as an async iterator of
+        `Result`s for async generator functions).
     """
-    from functools import wraps
-
-    if not err_type or not all(inspect.isclass(e) and issubclass(e, BaseException) for e in err_type):
+    # A plain loop rather than `all(...)`: `with Catch(E)` pays for this check on every block.
+    for e in err_type:
+        if not (isinstance(e, type) and issubclass(e, BaseException)):
+            raise TypeError("Catch decorator requires at least one exception type")
+    if not err_type:
         raise TypeError("Catch decorator requires at least one exception type")
+    try:
+        make_err = _ERR_FACTORIES[traceback]
+    except KeyError:
+        raise ValueError(f"traceback must be 'keep', 'drop' or 'summary', not {traceback!r}") from None
 
     if func is None:
-        def decorator(f: Callable[P, T]) -> Callable[P, "Result[T, E]"]:
-            @wraps(f)
-            def wrapper(*args: P.args, **kwargs: P.kwargs) -> "Result[T, E]":
-                try:
-                    return Ok(f(*args, **kwargs))
-                except err_type as e:
-                    return Err(e)
+        return Catcher(err_type, make_err, metrics, timeout)
+    if kwargs is None:
+        kwargs = {}
+    if timeout is not None:
+        return _decorate(err_type, make_err, metrics, timeout, func)(*args, **kwargs)  # type: ignore[no-any-return]
+    if metrics is not None:
+        # Direct calls are timed the same way; for a coroutine function this returns the awaitable.
+        return _instrument(err_type, make_err, metrics, func)(*args, **kwargs)  # type: ignore[no-any-return]
+
+    kind = _kind(func)
+    if kind == _COROUTINE:
+        return _catch_awaitable(err_type, make_err, func(*args, **kwargs))
+    if kind == _ASYNC_GEN:
+        return _catch_async_iter(err_type, make_err, func(*args, **kwargs))
+    try:
+        return Ok(func(*args, **kwargs))
+    except err_type as e:
+        return make_err(e)
+
+
+_SYNC = 0
+_COROUTINE = 1
+_ASYNC_GEN = 2
+
+
+_CO_COROUTINE = 0x80
+_CO_ASYNC_GENERATOR = 0x200
+
+# `_kind` of callables without a code object (partials, callable instances), created on first use.
+_kinds: "WeakKeyDictionary[Any, int] | None" = None
+
+
+def _kind(f: Callable[..., Any]) -> int:
+    """Whether `f` is a plain, coroutine or async generator function; every `Catch` path dispatches on this."""
+    # Functions and bound methods answer from their code flags, which is as cheap as the call it guards.
+    code = getattr(f, "__code__", None)
+    if code is not None and getattr(f, "_is_coroutine_marker", None) is None:
+        flags = code.co_flags
+        return _COROUTINE if flags & _CO_COROUTINE else _ASYNC_GEN if flags & _CO_ASYNC_GENERATOR else _SYNC
+
+    global _kinds
+    if _kinds is None:
+        from weakref import WeakKeyDictionary
+
+        _kinds = WeakKeyDictionary()
+    try:
+        return _kinds[f]
+    except (KeyError, TypeError):
+        pass
+    # Deferred so that importing the package does not pay for `inspect`.
+    import inspect
+
+    kind = _COROUTINE if inspect.iscoroutinefunction(f) else _ASYNC_GEN if inspect.isasyncgenfunction(f) else _SYNC
+    try:
+        _kinds[f] = kind
+    except TypeError:  # Not hashable or not weakly referenceable; such callables are resolved on every call.
+        pass
+    return kind
+
+
+def _decorate(
+        err_type: tuple[type[E], ...],
+        make_err: Callable[[Any], "Err[Any, E]"],
+        metrics: "Sink | None",
+        timeout: float | None,
+        f: Callable[..., Any],
+) -> Callable[..., Any]:
+    """Build the wrapper for `Catcher.__call__` and timed direct calls."""
+    caught: tuple[type[BaseException], ...] = err_type
+    if timeout is not None:
+        from rusty_utils.deadline import _DeadlineExpired
+
+        f = _with_timeout(timeout, f)
+        # Only the expired deadline becomes an `Err`; a `TimeoutError` raised by `f` itself is caught or not as
+        # `err_type` says.
+        caught = (*err_type, _DeadlineExpired)
+    if metrics is not None:
+        return _instrument(caught, make_err, metrics, f)
+    return _wrap(caught, make_err, f)
+
+
+def _with_timeout(timeout: float, f: Callable[P, T]) -> Callable[P, T]:
+    if _kind(f) != _SYNC:
+        raise TypeError("Catch(timeout=...) only supports synchronous functions; use asyncio.timeout for coroutines")
+    if timeout < 0:
+        raise ValueError("timeout must be non-negative")
+    from rusty_utils.deadline import with_timeout
+
+    return with_timeout(timeout, f)
+
+
+def _wrap(
+        err_type: tuple[type[E], ...], make_err: Callable[[Any], "Err[Any, E]"], f: Callable[P, T]
+) -> Callable[P, "Result[T, E]"]:
+    from functools import wraps
+
+    kind = _kind(f)
+    if kind == _COROUTINE:
+        @wraps(f)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> "Result[T, E]":
+            try:
+                return Ok(await f(*args, **kwargs))  # type: ignore[misc]
+            except err_type as e:
+                return make_err(e)
 
-            return wrapper
+        return async_wrapper  # type: ignore[return-value]
 
-        return decorator
+    if kind == _ASYNC_GEN:
+        @wraps(f)
+        def async_gen_wrapper(*args: P.args, **kwargs: P.kwargs) -> AsyncIterator["Result[T, E]"]:
+            return _catch_async_iter(err_type, make_err, f(*args, **kwargs))  # type: ignore[arg-type]
+
+        return async_gen_wrapper  # type: ignore[return-value]
+
+    @wraps(f)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> "Result[T, E]":
+        try:
+            return Ok(f(*args, **kwargs))
+        except err_type as e:
+            return make_err(e)
+
+    return wrapper
+
+
+async def _catch_awaitable(
+        err_type: tuple[type[E], ...], make_err: Callable[[Any], "Err[Any, Any]"], awaitable: Awaitable[T]
+) -> "Result[T, E]":
+    try:
+        return Ok(await awaitable)
+    except err_type as e:
+        return make_err(e)
+
+
+async def _catch_async_iter(
+        err_type: tuple[type[E], ...], make_err: Callable[[Any], "Err[Any, Any]"], iterator: AsyncIterator[T]
+) -> AsyncIterator["Result[T, E]"]:
+    # Pull items by hand so only the source's own exceptions are caught, never those thrown into this generator.
+    anext = iterator.__anext__
+    while True:
+        try:
+            item = await anext()
+        except StopAsyncIteration:
+            return
+        except err_type as e:
+            yield make_err(e)
+            return
+        yield Ok(item)
+
+
+def _instrument(
+        err_type: tuple[type[E], ...],
+        make_err: Callable[[Any], "Err[Any, Any]"],
+        metrics: "Sink",
+        f: Callable[..., Any],
+) -> Callable[..., Any]:
+    """The `Catch(..., metrics=...)` variants of the wrappers built by `_wrap`, timing each call."""
+    from functools import wraps
+    from time import perf_counter
+
+    record = metrics.record
+    # Callables such as `functools.partial` have no `__qualname__`; fall back to their repr.
+    qualname = getattr(f, "__qualname__", None)
+    module = getattr(f, "__module__", None)
+    if qualname is None:
+        name = repr(f)
     else:
+        name = qualname if module is None else f"{module}.{qualname}"
+
+    kind = _kind(f)
+    if kind == _COROUTINE:
+        @wraps(f)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> "Result[Any, Any]":
+            start = perf_counter()
+            try:
+                result: "Result[Any, Any]" = Ok(await f(*args, **kwargs))
+            except err_type as e:
+                record(name, e, perf_counter() - start)
+                return make_err(e)
+            record(name, None, perf_counter() - start)
+            return result
+
+        return async_wrapper
+
+    if kind == _ASYNC_GEN:
+        @wraps(f)
+        async def async_gen_wrapper(*args: Any, **kwargs: Any) -> AsyncIterator["Result[Any, Any]"]:
+            start = perf_counter()
+            async for result in _catch_async_iter(err_type, make_err, f(*args, **kwargs)):
+                if result.__class__ is not Ok:
+                    record(name, result.value, perf_counter() - start)
+                yield result
+                if result.__class__ is not Ok:
+                    return
+            record(name, None, perf_counter() - start)
+
+        return async_gen_wrapper
+
+    @wraps(f)
+    def wrapper(*args: Any, **kwargs: Any) -> "Result[Any, Any]":
+        start = perf_counter()
         try:
-            return Ok(func())
+            result: "Result[Any, Any]" = Ok(f(*args, **kwargs))
         except err_type as e:
-            return Err(e)
+            record(name, e, perf_counter() - start)
+            return make_err(e)
+        record(name, None, perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+# Imported last: `option` imports `Ok` and `Err` from this module, so whichever of the two is imported
+# first, both find the other's classes defined and `ok()`/`err()` use a plain global instead of an import.
+from rusty_utils.option import Option  # noqa: E402
@@ -0,0 +1,161 @@
+"""Compact binary encoding for `Ok`, `Err` and `Option`.
+
+The encoding is opt-in and independent of `pickle` support on the classes themselves. A batch is stored as
+one tag string plus one list of payloads, so no class reference or per-object opcode is written per item.
+Errors are stored as their `module:qualname`, `args`, instance state and, optionally, the formatted
+traceback. Types that cannot be imported where the data is decoded come back as `RemoteError`.
+
+Like `pickle`, decoding may import modules and construct arbitrary objects: never decode untrusted data.
+"""
+import pickle
+from importlib import import_module
+from typing import Any, Iterable
+
+from rusty_utils.common import RemoteError, rebuild_exception, reduce_exception
+from rusty_utils.option import Option, Some, Nothing
+from rusty_utils.result import Result, Ok, Err
+
+_OK = "o"
+_ERR = "e"
+_SOME = "s"
+_NONE = "n"
+
+_FORMAT = 1
+_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+_EncodedError = tuple[str, tuple[Any, ...], "dict[str, Any] | None", "str | None"]
+
+
+def encode_error(exc: BaseException, traceback: bool = False) -> _EncodedError:
+    """Encode an exception as `(type name, args, state, formatted traceback or None)`."""
+    cls, args, state = reduce_exception(exc)
+    tb_text = None
+    if traceback and exc.__traceback__ is not None:
+        from traceback import format_exception
+        tb_text = "".join(format_exception(exc))
+    return f"{cls.__module__}:{cls.__qualname__}", args, state, tb_text
+
+
+_TYPES: dict[str, type[BaseException] | None] = {}
+
+
+def _resolve_type(type_name: str) -> type[BaseException] | None:
+    """Import an exception type by `module:qualname`, caching the outcome (including failure) per name."""
+    try:
+        return _TYPES[type_name]
+    except KeyError:
+        pass
+    cls: Any = None
+    try:
+        module, _, qualname = type_name.partition(":")
+        cls = import_module(module)
+        for part in qualname.split("."):
+            cls = getattr(cls, part)
+    except Exception:
+        cls = None
+    resolved = cls if isinstance(cls, type) and issubclass(cls, BaseException) else None
+    _TYPES[type_name] = resolved
+    return resolved
+
+
+def decode_error(encoded: _EncodedError) -> BaseException:
+    """Inverse of `encode_error`. The remote traceback, if any, is attached as an exception note."""
+    type_name, args, state, tb_text = encoded
+    cls = _resolve_type(type_name)
+    if cls is None:
+        return RemoteError(type_name, args, tb_text)
+    try:
+        exc = rebuild_exception(cls, args, state)
+    except Exception:
+        return RemoteError(type_name, args, tb_text)
+    if tb_text is not None:
+        exc.add_note(f"Remote traceback:\n{tb_text}")
+    return exc
+
+
+def _split(obj: Result[Any, Any] | Option[Any], traceback: bool) -> tuple[str, Any]:
+    if isinstance(obj, Ok):
+        return _OK, obj.value
+    if isinstance(obj, Err):
+        value = obj.value
+        if isinstance(value, BaseException):
+            return _ERR, encode_error(value, traceback)
+        return _ERR, (None, value)
+    if isinstance(obj, Option):
+        if obj.__class__ is Nothing:
+            return _NONE, None
+        return _SOME, obj.value
+    raise TypeError(f"cannot encode {type(obj).__name__}; expected Ok, Err or Option")
+
+
+def _decode_err(payload: Any) -> Err[Any, Any]:
+    if payload[0] is None:
+        return Err(payload[1])
+    return Err(decode_error(payload))
+
+
+_DECODERS: dict[str, Any] = {
+    _OK: Ok,
+    _ERR: _decode_err,
+    _SOME: Some,
+    _NONE: lambda _: Nothing(),
+}
+
+
+def _sanitize(tag: str, payload: Any) -> Any:
+    """Replace an unpicklable error payload with one that only carries `repr`s."""
+    if tag != _ERR or payload[0] is None:
+        return payload
+    try:
+        pickle.dumps(payload, _PROTOCOL)
+    except Exception:
+        type_name, args, _, tb_text = payload
+        return type_name, tuple(repr(a) for a in args), None, tb_text
+    return payload
+
+
+def dumps_many(items: Iterable[Result[Any, Any] | Option[Any]], traceback: bool = False) -> bytes:
+    """
+    Encode a batch of `Ok`/`Err`/`Option` values.
+
+    Args:
+        items (Iterable[Result | Option]): The values to encode.
+        traceback (bool): Include the formatted traceback of each error.
+
+    Returns:
+        bytes: The encoded batch.
+    """
+    tags = []
+    payloads = []
+    for item in items:
+        tag, payload = _split(item, traceback)
+        tags.append(tag)
+        payloads.append(payload)
+    tag_string = "".join(tags)
+    try:
+        return pickle.dumps((_FORMAT, tag_string, payloads), _PROTOCOL)
+    except Exception:
+        payloads = [_sanitize(tag, payload) for tag, payload in zip(tag_string, payloads)]
+        return pickle.dumps((_FORMAT, tag_string, payloads), _PROTOCOL)
+
+
+def loads_many(data: bytes) -> list[Result[Any, Any] | Option[Any]]:
+    """Decode a batch produced by `dumps_many`."""
+    version, tags, payloads = pickle.loads(data)
+    if version != _FORMAT:
+        raise ValueError(f"unsupported wire format version {version}")
+    decoders = _DECODERS
+    try:
+        return [decoders[tag](payload) for tag, payload in zip(tags, payloads)]
+    except KeyError as e:
+        raise ValueError(f"unknown tag {e.args[0]!r}") from None
+
+
+def dumps(obj: Result[Any, Any] | Option[Any], traceback: bool = False) -> bytes:
+    """Encode a single `Ok`/`Err`/`Option`."""
+    return dumps_many((obj,), traceback)
+
+
+def loads(data: bytes) -> Result[Any, Any] | Option[Any]:
+    """Decode a single value produced by `dumps`."""
+    return loads_many(data)[0]
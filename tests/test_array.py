@@ -0,0 +1,109 @@
+from typing import Iterator
+
+import pytest
+
+from rusty_utils import Err, Nothing, Ok, Option, OptionArray, Result, ResultArray, Some
+from rusty_utils import array
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(array, "_numpy", None)
+    else:
+        monkeypatch.setattr(array, "_numpy", False)
+    yield request.param
+
+
+def results() -> list[Result[int, Exception]]:
+    return [Ok(1), Err(ValueError("a")), Ok(3), Err(KeyError("b")), Ok(5)]
+
+
+def test_result_array_round_trip(backend: str) -> None:
+    arr = ResultArray.from_results(results())
+    assert len(arr) == 5
+    assert arr.to_results() == results()
+    assert arr[2] == Ok(3)
+    assert type(arr[2].unwrap()) is int
+    assert isinstance(arr[1].unwrap_err(), ValueError)
+
+
+def test_result_array_counts_and_columns(backend: str) -> None:
+    arr = ResultArray.from_results(results())
+    assert arr.count_ok() == 3
+    assert arr.count_err() == 2
+    assert list(arr.oks()) == [1, 3, 5]
+    assert [type(e) for e in arr.errs()] == [ValueError, KeyError]
+    assert list(arr.unwrap_or(0)) == [1, 0, 3, 0, 5]
+
+
+def test_result_array_map_touches_ok_lanes_only(backend: str) -> None:
+    arr = ResultArray.from_results(results())
+    seen: list[int] = []
+
+    def times_ten(x: int) -> int:
+        seen.append(x)
+        return x * 10
+
+    mapped = arr.map(times_ten)
+    assert seen == [1, 3, 5]
+    assert list(mapped.unwrap_or(-1)) == [10, -1, 30, -1, 50]
+    assert mapped.errs() == arr.errs()
+
+    vectorized = arr.map(lambda column: [x + 1 for x in column] if isinstance(column, list) else column + 1,
+                         vectorized=True)
+    assert list(vectorized.oks()) == [2, 4, 6]
+
+    renamed = arr.map_err(lambda e: RuntimeError(str(e)))
+    assert all(isinstance(e, RuntimeError) for e in renamed.errs())
+
+
+def test_result_array_select(backend: str) -> None:
+    arr = ResultArray.from_results(results())
+    only_ok = arr.select(arr.mask)
+    assert only_ok.to_results() == [Ok(1), Ok(3), Ok(5)]
+
+
+def test_result_array_non_numeric_values(backend: str) -> None:
+    source: list[Result[str, ValueError]] = [Ok("a"), Err(ValueError("x")), Ok("c")]
+    arr = ResultArray.from_results(source)
+    assert isinstance(arr.values, list)
+    assert arr.map(str.upper).oks() == ["A", "C"]
+
+
+def test_result_array_keeps_mixed_numeric_types(backend: str) -> None:
+    source: list[Result[float, ValueError]] = [Ok(1), Ok(2.5), Ok(True)]
+    arr = ResultArray.from_results(source)
+    assert isinstance(arr.values, list)
+    restored = [r.unwrap() for r in arr]
+    assert restored == [1, 2.5, True]
+    assert [type(v) for v in restored] == [int, float, bool]
+
+
+def test_option_array(backend: str) -> None:
+    arr = OptionArray.from_options([Option(1), Option(), Option(3)])
+    assert arr.to_options() == [Option(1), Option(), Option(3)]
+    assert arr.count_some() == 2
+    assert arr.count_none() == 1
+    assert list(arr.somes()) == [1, 3]
+    assert list(arr.unwrap_or(0)) == [1, 0, 3]
+    assert list(arr.map(lambda x: x * 2).unwrap_or(0)) == [2, 0, 6]
+    assert arr[1] is Option()
+    assert type(arr[2].unwrap()) is int
+    assert OptionArray.from_optionals(["x", None]).to_options() == [Option("x"), Option()]
+
+
+def test_option_array_keeps_some_none(backend: str) -> None:
+    arr = OptionArray.from_options([Some(None), Nothing()])
+    assert arr.count_some() == 1
+    assert arr.to_options() == [Some(None), Nothing()]
+
+
+def test_numpy_storage() -> None:
+    np = pytest.importorskip("numpy")
+    arr = ResultArray.from_results(results())
+    assert isinstance(arr.values, np.ndarray)
+    assert arr.mask.dtype == bool
+    doubled = arr.map(lambda column: column * 2, vectorized=True)
+    assert doubled.oks().tolist() == [2, 6, 10]
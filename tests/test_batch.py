@@ -0,0 +1,133 @@
+import asyncio
+import threading
+
+import pytest
+
+from rusty_utils import Err, Ok, Result
+from rusty_utils.batch import BatchStats, batch_loader
+
+
+def test_async_calls_in_one_tick_share_a_batch() -> None:
+    seen = []
+
+    @batch_loader(max_batch_size=3)
+    async def load(keys: list[int]) -> dict[int, object]:
+        seen.append(keys)
+        return {k: ValueError(k) if k < 0 else k * 10 for k in keys if k != 99}
+
+    async def main() -> list[Result[object, BaseException]]:
+        return list(await asyncio.gather(load(1), load(-2), load(1), load(99), load(5)))
+
+    results = asyncio.run(main())
+    assert results[0] == Ok(10) and results[2] == Ok(10) and results[4] == Ok(50)
+    assert isinstance(results[1].value, ValueError)
+    assert isinstance(results[3].value, KeyError)
+    assert seen == [[1, -2, 99], [5]]
+    assert load.stats() == BatchStats(loads=5, keys=4, batches=2)
+
+
+def test_async_batch_failure() -> None:
+    @batch_loader(catch=(ConnectionError,))
+    async def down(keys: list[str]) -> dict[str, int]:
+        raise ConnectionError("db down")
+
+    @batch_loader(catch=(ConnectionError,))
+    async def broken(keys: list[str]) -> dict[str, int]:
+        raise RuntimeError("bug")
+
+    async def main() -> None:
+        a, b = await asyncio.gather(down("a"), down("b"))
+        assert a.value is b.value and isinstance(a.value, ConnectionError)
+        with pytest.raises(RuntimeError):
+            await broken("a")
+        assert await down.load_many(["x", "y"]) == [Err(a.value)] * 2
+
+    asyncio.run(main())
+
+
+def test_async_batch_with_a_bad_return_value_fails_every_caller() -> None:
+    @batch_loader()
+    async def load(keys: list[int]) -> dict[int, int]:
+        return None  # type: ignore[return-value]
+
+    async def main() -> list[object]:
+        return list(await asyncio.wait_for(asyncio.gather(load(1), load(2), return_exceptions=True), 5))
+
+    a, b = asyncio.run(main())
+    assert isinstance(a, TypeError) and a is b
+
+
+def test_threads_within_window_share_a_batch() -> None:
+    seen = []
+
+    @batch_loader(max_batch_size=100, window=0.2)
+    def load(keys: list[int]) -> dict[int, int]:
+        seen.append(sorted(keys))
+        return {k: k + 1 for k in keys}
+
+    barrier = threading.Barrier(8)
+    results = {}
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        results[i] = load(i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == {i: Ok(i + 1) for i in range(8)}
+    assert seen == [list(range(8))]
+
+
+def test_thread_batch_failure_reaches_every_caller() -> None:
+    @batch_loader(window=0.2, catch=(ConnectionError,))
+    def load(keys: list[int]) -> dict[int, int]:
+        raise LookupError("bug")
+
+    barrier = threading.Barrier(3)
+    raised: list[BaseException] = []
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        try:
+            load(i)
+        except BaseException as e:
+            raised.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    (original,) = [e for e in raised if isinstance(e, LookupError)]
+    followers = [e for e in raised if e is not original]
+    assert len(followers) == 2 and all(isinstance(e, RuntimeError) and e.__cause__ is original for e in followers)
+
+
+def test_unhashable_key_does_not_block_later_callers() -> None:
+    @batch_loader(window=0.01)
+    def load(keys: list[int]) -> dict[int, int]:
+        return {k: k for k in keys}
+
+    with pytest.raises(TypeError):
+        load([1])
+    assert load(1) == Ok(1)
+
+
+def test_full_thread_batch_is_sent_without_waiting() -> None:
+    @batch_loader(max_batch_size=1, window=10.0)
+    def load(keys: list[int]) -> dict[int, int]:
+        return {k: k for k in keys}
+
+    assert load(3) == Ok(3)
+    assert load.load_many([1, 2, 1]) == [Ok(1), Ok(2), Ok(1)]
+    assert load.stats() == BatchStats(loads=4, keys=3, batches=3)
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        batch_loader(max_batch_size=0)
+    with pytest.raises(TypeError):
+        batch_loader(catch=())
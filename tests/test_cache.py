@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from rusty_utils import Catch, Err, Ok, Result, cached
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_caches_ok_results_with_lru_eviction() -> None:
+    calls: list[int] = []
+
+    @cached(maxsize=2)
+    @Catch(ValueError)
+    def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    assert square(2) == Ok(4)
+    assert square(2) == Ok(4)
+    square(3)
+    square(4)  # evicts 2
+    square(2)
+    assert calls == [2, 3, 4, 2]
+    info = square.cache_info()  # type: ignore[attr-defined]
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 4, 2, 2)
+
+
+def test_ok_and_err_ttls() -> None:
+    clock = FakeClock()
+    calls: list[str] = []
+
+    @cached(ttl=10, err_ttl=1, timer=clock)
+    @Catch(KeyError)
+    def lookup(key: str) -> str:
+        calls.append(key)
+        if key.startswith("missing"):
+            raise KeyError(key)
+        return key.upper()
+
+    lookup("a")
+    lookup("missing")
+    clock.now = 0.5
+    lookup("a")
+    lookup("missing")
+    assert calls == ["a", "missing"]
+
+    clock.now = 2
+    lookup("a")
+    lookup("missing")
+    assert calls == ["a", "missing", "missing"]
+
+    clock.now = 11
+    lookup("a")
+    assert calls == ["a", "missing", "missing", "a"]
+    assert lookup.cache_info().expirations == 2  # type: ignore[attr-defined]
+
+
+def test_errs_are_not_cached_by_default_and_opt_out_per_type() -> None:
+    calls: list[int] = []
+
+    @cached(err_ttl=60, no_cache=(TimeoutError,))
+    @Catch(TimeoutError, ValueError)
+    def fetch(x: int) -> int:
+        calls.append(x)
+        raise TimeoutError() if x == 0 else ValueError()
+
+    fetch(0)
+    fetch(0)
+    fetch(1)
+    fetch(1)
+    assert calls == [0, 0, 1]
+
+    @cached()
+    @Catch(ValueError)
+    def failing() -> int:
+        calls.append(-1)
+        raise ValueError()
+
+    failing()
+    failing()
+    assert calls.count(-1) == 2
+
+
+def test_raised_exceptions_are_not_cached() -> None:
+    @cached()
+    def explode() -> int:
+        raise RuntimeError("boom")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            explode()
+    assert explode.cache_info().misses == 2  # type: ignore[attr-defined]
+
+
+def test_single_flight_threads() -> None:
+    calls = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    @cached()
+    @Catch(ValueError)
+    def slow(x: int) -> int:
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(5)
+        return x
+
+    results: list[object] = []
+    threads = [threading.Thread(target=lambda: results.append(slow(1))) for _ in range(5)]
+    threads[0].start()
+    started.wait(5)
+    for t in threads[1:]:
+        t.start()
+    while slow.cache_info().joins < 4:  # type: ignore[attr-defined]
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+    assert calls == 1
+    assert results == [Ok(1)] * 5
+
+
+def test_single_flight_threads_chain_the_leaders_exception() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    error = KeyError("boom")
+
+    @cached()
+    def explode() -> int:
+        started.set()
+        release.wait(5)
+        raise error
+
+    raised: list[BaseException] = []
+
+    def run() -> None:
+        try:
+            explode()
+        except BaseException as e:
+            raised.append(e)
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=run) for _ in range(3)]
+    for t in followers:
+        t.start()
+    while explode.cache_info().joins < 3:  # type: ignore[attr-defined]
+        time.sleep(0.001)
+    release.set()
+    for t in [leader, *followers]:
+        t.join()
+    assert raised.count(error) == 1
+    chained = [e for e in raised if e is not error]
+    assert len(chained) == 3 and len(set(map(id, chained))) == 3
+    assert all(isinstance(e, RuntimeError) and e.__cause__ is error for e in chained)
+
+
+def test_single_flight_async() -> None:
+    calls = 0
+
+    @cached()
+    @Catch(ValueError)
+    async def fetch(x: int) -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return x
+
+    async def main() -> list[Result[int, ValueError]]:
+        return list(await asyncio.gather(*(fetch(3) for _ in range(5))))
+
+    assert asyncio.run(main()) == [Ok(3)] * 5
+    assert calls == 1
+    info = fetch.cache_info()  # type: ignore[attr-defined]
+    assert (info.misses, info.joins) == (1, 4)
+
+
+def test_single_flight_async_survives_cancelled_leader() -> None:
+    calls = 0
+
+    @cached()
+    @Catch(ValueError)
+    async def fetch(x: int) -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return x
+
+    async def main() -> Result[int, ValueError]:
+        leader = asyncio.ensure_future(fetch(3))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(fetch(3))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(main()) == Ok(3)
+    assert calls == 1
+
+
+def test_cache_clear() -> None:
+    @cached()
+    def ident(x: int) -> Ok[int, Exception]:
+        return Ok(x)
+
+    ident(1)
+    ident.cache_clear()  # type: ignore[attr-defined]
+    assert ident.cache_info().currsize == 0  # type: ignore[attr-defined]
+    assert isinstance(ident(1), Ok) and not isinstance(ident(1), Err)
@@ -0,0 +1,141 @@
+import json
+import threading
+import time
+
+import pytest
+
+from rusty_utils import Catch, Err, Ok, Result
+from rusty_utils.deadletter import (
+    BatchCallbackSink, DeadLetter, DeadLetterRecord, ErrorBudgetExceeded, JsonLinesSink, RingSink,
+)
+
+
+@Catch(ValueError)
+def parse(s: str) -> int:
+    return int(s)
+
+
+def test_routes_oks_downstream_and_errs_to_the_sink() -> None:
+    sink = RingSink()
+    with DeadLetter(sink) as dead_letters:
+        values = list(dead_letters.route(map(parse, ["1", "x", "2", "y"])))
+    assert values == [1, 2]
+    assert [r.position for r in sink.records] == [1, 3]
+    assert all(isinstance(r.error, ValueError) for r in sink.records)
+    assert (dead_letters.seen, dead_letters.errors) == (4, 2)
+
+
+def test_ring_sink_is_bounded() -> None:
+    sink = RingSink(capacity=2)
+    with DeadLetter(sink) as dead_letters:
+        list(dead_letters.route(Err(ValueError(i)) for i in range(5)))
+    assert [r.position for r in sink.records] == [3, 4]
+
+
+def test_json_lines_sink(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    path = tmp_path / "rejects.jsonl"
+    rows: list[Result[int, ValueError]] = [Ok(1), Err(ValueError("bad row"))]
+    with DeadLetter(JsonLinesSink(path)) as dead_letters:
+        list(dead_letters.route(rows))
+    (line,) = path.read_text().splitlines()
+    record = json.loads(line)
+    assert record["position"] == 1
+    assert record["type"] == "builtins:ValueError"
+    assert record["message"] == "bad row"
+
+
+def test_batches_and_flush_interval() -> None:
+    batches: list[list[DeadLetterRecord]] = []
+    arrived = threading.Event()
+
+    def callback(batch: list[DeadLetterRecord]) -> None:
+        batches.append(batch)
+        arrived.set()
+
+    dead_letters = DeadLetter(BatchCallbackSink(callback), batch_size=3, flush_interval=0.05)
+    list(dead_letters.route(Err(ValueError()) for _ in range(7)))
+    assert arrived.wait(5)
+    deadline = time.monotonic() + 5
+    while sum(map(len, batches)) < 7 and time.monotonic() < deadline:
+        time.sleep(0.01)  # the partial batch is written by the flush interval, before close()
+    assert [len(b) for b in batches] == [3, 3, 1]
+    dead_letters.close()
+
+
+def test_bounded_buffer_applies_backpressure() -> None:
+    release = threading.Event()
+    sink = BatchCallbackSink(lambda batch: release.wait(5))
+    dead_letters = DeadLetter(sink, max_buffer=2, batch_size=1)
+    produced = 0
+
+    def produce() -> None:
+        nonlocal produced
+        for _ in dead_letters.route(Err(ValueError()) for _ in range(10)):
+            pass
+        produced = dead_letters.errors
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    time.sleep(0.1)
+    assert dead_letters.errors <= 4  # one being written, two queued, one blocked in put
+    release.set()
+    thread.join(5)
+    dead_letters.close()
+    assert produced == 10
+
+
+def test_error_budget() -> None:
+    sink = RingSink()
+    dead_letters = DeadLetter(sink, max_errors=2)
+    downstream = []
+    with pytest.raises(ErrorBudgetExceeded) as info:
+        for value in dead_letters.route(map(parse, ["1", "a", "b", "2", "c", "3"])):
+            downstream.append(value)
+    assert downstream == [1, 2]
+    assert (info.value.errors, info.value.seen) == (3, 5)
+    assert len(sink.records) == 3
+
+    dead_letters = DeadLetter(RingSink(), max_error_ratio=0.5, min_records=4)
+    with pytest.raises(ErrorBudgetExceeded):
+        list(dead_letters.route(map(parse, ["1", "x", "y", "z", "2"])))
+    assert dead_letters.seen == 4
+
+
+def test_writer_starts_with_the_first_dead_letter() -> None:
+    dead_letters = DeadLetter(RingSink())
+    assert list(dead_letters.route([Ok(1), Ok(2)])) == [1, 2]
+    assert dead_letters._writer is None
+    dead_letters.close()
+
+
+def test_sink_failure_is_raised_in_the_producer() -> None:
+    def fail(batch: list[DeadLetterRecord]) -> None:
+        raise OSError("disk full")
+
+    dead_letters = DeadLetter(BatchCallbackSink(fail), batch_size=1)
+    with pytest.raises(RuntimeError) as info:
+        list(dead_letters.route(Err(ValueError()) for _ in range(1000)))
+        dead_letters.close()
+    assert isinstance(info.value.__cause__, OSError)
+
+
+def test_sink_failure_on_the_final_flush_is_raised_by_close() -> None:
+    def fail(batch: list[DeadLetterRecord]) -> None:
+        raise OSError("disk full")
+
+    dead_letters = DeadLetter(BatchCallbackSink(fail), flush_interval=60)
+    assert list(dead_letters.route([Err(ValueError())])) == []
+    raised: list[BaseException] = []
+
+    def close() -> None:
+        try:
+            dead_letters.close()
+        except BaseException as e:
+            raised.append(e)
+
+    closer = threading.Thread(target=close, daemon=True)
+    closer.start()
+    closer.join(5)
+    assert not closer.is_alive()
+    assert len(raised) == 1 and isinstance(raised[0], RuntimeError)
+    assert isinstance(raised[0].__cause__, OSError)
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pytest
+
+from rusty_utils import Catch, Ok
+from rusty_utils.deadline import deadline, remaining
+
+
+def test_timeout_returns_err_and_leaves_call_running() -> None:
+    finished = threading.Event()
+
+    @Catch(ValueError, timeout=0.05)
+    def slow() -> int:
+        time.sleep(0.2)
+        finished.set()
+        return 1
+
+    start = time.monotonic()
+    result = slow()
+    assert time.monotonic() - start < 0.15
+    assert isinstance(result.value, TimeoutError)
+    assert finished.wait(1.0)
+
+
+def test_fast_calls_and_exceptions_pass_through() -> None:
+    assert Catch(ValueError, timeout=1.0, func=int, args=("7",)) == Ok(7)
+    assert isinstance(Catch(ValueError, timeout=1.0, func=int, args=("x",)).value, ValueError)
+    with pytest.raises(KeyError):
+        Catch(ValueError, timeout=1.0, func={}.__getitem__, args=("k",))
+
+
+def test_own_timeout_error_is_not_caught_as_the_deadline() -> None:
+    def socket_timeout() -> None:
+        raise TimeoutError("read timed out")
+
+    with pytest.raises(TimeoutError, match="read timed out"):
+        Catch(ValueError, timeout=1.0, func=socket_timeout)
+    assert Catch(TimeoutError, timeout=1.0, func=socket_timeout).unwrap_err().args == ("read timed out",)
+
+
+def test_set_shared_pool() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+    from rusty_utils.deadline import set_shared_pool, shared_pool
+
+    previous = shared_pool()
+    with ThreadPoolExecutor(thread_name_prefix="custom") as pool:
+        set_shared_pool(pool)
+        try:
+            assert Catch(ValueError, timeout=1.0, func=lambda: threading.current_thread().name).unwrap().startswith(
+                "custom"
+            )
+        finally:
+            set_shared_pool(previous)
+
+
+def test_nested_calls_share_the_budget() -> None:
+    seen = []
+
+    @Catch(Exception, timeout=10.0)
+    def inner() -> str:
+        seen.append((remaining(), threading.current_thread().name))
+        return threading.current_thread().name
+
+    @Catch(Exception, timeout=0.5)
+    def outer() -> str:
+        return inner().unwrap()
+
+    outer_thread = outer().unwrap()
+    budget, inner_thread = seen[0]
+    assert budget is not None and budget <= 0.5
+    assert inner_thread == outer_thread  # no tighter limit, so it ran inline on the same worker
+
+
+def test_caller_deadline_caps_timeout() -> None:
+    with deadline(0.05):
+        result = Catch(Exception, timeout=5.0, func=time.sleep, args=(0.5,))
+        assert isinstance(result.value, TimeoutError)
+        time.sleep(0.06)
+        start = time.monotonic()
+        assert isinstance(Catch(Exception, timeout=5.0, func=time.sleep, args=(0.5,)).value, TimeoutError)
+        assert time.monotonic() - start < 0.05
+    assert remaining() is None
+
+
+def test_timeout_rejects_with_blocks_and_coroutines() -> None:
+    with pytest.raises(TypeError):
+        with Catch(ValueError, timeout=1.0):
+            pass
+
+    async def coro() -> None:
+        pass
+
+    with pytest.raises(TypeError):
+        Catch(ValueError, timeout=1.0)(coro)
@@ -0,0 +1,73 @@
+import asyncio
+from typing import Any, Generator
+
+import pytest
+
+from rusty_utils import Err, Ok, Result
+from rusty_utils.do import do, do_async
+
+
+def parse(s: str) -> Result[int, ValueError]:
+    return Ok(int(s)) if s.isdigit() else Err(ValueError(s))
+
+
+def test_do_binds_ok_values() -> None:
+    @do
+    def add(a: str, b: str) -> Generator[Result[int, ValueError], int, int]:
+        x = yield parse(a)
+        y = yield parse(b)
+        return x + y
+
+    assert add("1", "2") == Ok(3)
+    assert add.__name__ == "add"
+
+
+def test_do_short_circuits_without_raising() -> None:
+    steps: list[str] = []
+
+    @do
+    def add(a: str, b: str) -> Generator[Result[int, ValueError], int, int]:
+        try:
+            x = yield parse(a)
+            steps.append("after a")
+            y = yield parse(b)
+            steps.append("after b")
+            return x + y
+        finally:
+            steps.append("finally")
+
+    result = add("1", "x")
+    assert isinstance(result, Err) and result.value.args == ("x",)
+    assert steps == ["after a", "finally"]
+
+
+def test_do_propagates_exceptions_and_rejects_plain_functions() -> None:
+    @do
+    def boom() -> Generator[Result[int, ValueError], int, int]:
+        yield Ok(1)
+        raise KeyError()
+
+    with pytest.raises(KeyError):
+        boom()
+    with pytest.raises(TypeError):
+        do(lambda: 1)  # type: ignore[arg-type, return-value]
+
+
+def test_do_async() -> None:
+    async def fetch(s: str) -> Result[int, ValueError]:
+        await asyncio.sleep(0)
+        return parse(s)
+
+    async def raw(x: int) -> int:
+        return x * 10
+
+    @do_async
+    def total(a: str, b: str) -> Generator[Any, Any, int]:
+        x = yield fetch(a)
+        y = yield parse(b)
+        z: int = yield raw(x + y)
+        return z
+
+    assert asyncio.run(total("1", "2")) == Ok(30)
+    result = asyncio.run(total("x", "2"))
+    assert isinstance(result, Err) and result.value.args == ("x",)
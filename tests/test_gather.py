@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from rusty_utils import Err, Ok, Result
+from rusty_utils.gather import gather_results, stream_results
+
+
+async def echo(x: int, delay: float = 0.0) -> int:
+    await asyncio.sleep(delay)
+    if x < 0:
+        raise ValueError(x)
+    return x
+
+
+def test_gather_in_input_order() -> None:
+    results = asyncio.run(gather_results([echo(1, 0.02), echo(-2), echo(3, 0.01)]))
+    assert results[0] == Ok(1) and results[2] == Ok(3)
+    assert isinstance(results[1], Err) and isinstance(results[1].value, ValueError)
+
+
+def test_gather_respects_limit() -> None:
+    running = peak = 0
+
+    async def tracked(x: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return x
+
+    results = asyncio.run(gather_results((tracked(i) for i in range(20)), limit=3))
+    assert results == [Ok(i) for i in range(20)]
+    assert peak == 3
+
+
+def test_gather_timeout_becomes_err() -> None:
+    results = asyncio.run(gather_results([echo(1), echo(2, 1.0)], timeout=0.05))
+    assert results[0] == Ok(1)
+    assert isinstance(results[1], Err) and isinstance(results[1].value, TimeoutError)
+
+
+def test_gather_fail_fast_cancels_the_rest() -> None:
+    cancelled = []
+
+    async def slow(x: int) -> int:
+        try:
+            await asyncio.sleep(1.0)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return x
+
+    async def main() -> list[Result[int, BaseException]]:
+        results = await gather_results([slow(0), echo(-1, 0.01), slow(2), slow(3)], limit=3, fail_fast=True)
+        assert sorted(cancelled) == [0, 2]  # already cancelled when gather_results returns
+        return results
+
+    results = asyncio.run(main())
+    assert isinstance(results[1].value, ValueError)
+    assert all(isinstance(r.value, asyncio.CancelledError) for r in (results[0], results[2], results[3]))
+
+
+def test_stream_yields_in_completion_order_and_stops() -> None:
+    async def collect(fail_fast: bool = False) -> list[Result[int, BaseException]]:
+        aws = [echo(1, 0.03), echo(2, 0.01), echo(-3, 0.02)]
+        return [r async for r in stream_results(aws, fail_fast=fail_fast)]
+
+    results = asyncio.run(collect())
+    assert results[0] == Ok(2) and isinstance(results[1].value, ValueError) and results[2] == Ok(1)
+    assert len(asyncio.run(collect(fail_fast=True))) == 2
+
+
+def test_uncaught_exceptions_propagate() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(gather_results([echo(-1)], catch=(KeyError,)))
+    with pytest.raises(ValueError):
+        gather_results([], limit=0).send(None)
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_ROOT = str(Path(__file__).resolve().parent.parent)
+
+# Cumulative microseconds `import rusty_utils` may take, as reported by `-X importtime`. Generous enough for
+# slow CI machines; eagerly importing `asyncio` or `concurrent.futures` again would blow through it.
+_BUDGET_US = int(os.environ.get("RUSTY_UTILS_IMPORT_BUDGET_US", 60_000))
+
+
+def _import_time() -> tuple[int, set[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import rusty_utils"],
+        cwd=_ROOT, capture_output=True, text=True, check=True,
+    )
+    total = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        modules.add(name.strip())
+        if name.strip() == "rusty_utils":
+            total = int(cumulative)
+    return total, modules
+
+
+def test_heavy_modules_are_not_imported() -> None:
+    _, modules = _import_time()
+    for heavy in ("inspect", "dataclasses", "asyncio", "concurrent.futures", "multiprocessing", "numpy"):
+        assert heavy not in modules
+
+
+@pytest.mark.skipif(sys.flags.dev_mode, reason="import timings are inflated in dev mode")
+def test_import_time_budget() -> None:
+    best = min(_import_time()[0] for _ in range(3))
+    assert 0 < best < _BUDGET_US
+
+
+def test_lazy_exports() -> None:
+    import rusty_utils
+
+    assert rusty_utils.Pipeline.__module__ == "rusty_utils.pipeline"
+    assert set(rusty_utils.__all__) <= set(dir(rusty_utils))
+    with pytest.raises(AttributeError):
+        rusty_utils.does_not_exist
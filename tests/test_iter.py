@@ -0,0 +1,66 @@
+from itertools import count
+from typing import Iterator
+
+import pytest
+
+from rusty_utils import Err, Iter, Nothing, Ok, Option, Some
+
+
+def parse(s: str) -> Option[int]:
+    return Some(int(s)) if s.isdigit() else Nothing()
+
+
+def test_fused_stages() -> None:
+    it = Iter(["1", "x", "2", "3"]).filter_map(parse).map(lambda x: x * 10).flat_map(lambda x: (x, x + 1))
+    assert it.collect() == [10, 11, 20, 21, 30, 31]
+    assert list(it) == [10, 11, 20, 21, 30, 31]  # re-iterable over a re-iterable source
+
+
+def test_filter_map_keeps_some_none() -> None:
+    assert Iter([1, 2]).filter_map(lambda x: Some(None) if x == 1 else Nothing()).collect() == [None]
+
+
+def test_take_while_inside_flat_map_stops_everything() -> None:
+    pulled: list[int] = []
+
+    def source() -> Iterator[int]:
+        for i in count():
+            pulled.append(i)
+            yield i
+
+    it = Iter(source()).flat_map(lambda x: [x, x]).take_while(lambda x: x < 2).map(str)
+    assert it.collect() == ["0", "0", "1", "1"]
+    assert pulled == [0, 1, 2]
+
+
+def test_chunks_stream_unbounded_sources() -> None:
+    chunks = iter(Iter(count()).map(lambda x: x * 2).chunks(3).map(sum))
+    assert [next(chunks) for _ in range(3)] == [6, 24, 42]
+    assert Iter(range(5)).chunks(2).collect() == [[0, 1], [2, 3], [4]]
+    with pytest.raises(ValueError):
+        Iter(range(5)).chunks(0)
+
+
+def test_try_fold() -> None:
+    def add_small(acc: int, x: int) -> Ok[int, ValueError] | Err[int, ValueError]:
+        return Ok(acc + x) if x < 10 else Err(ValueError(x))
+
+    assert Iter(range(5)).try_fold(0, add_small) == Ok(10)
+    pulled: list[int] = []
+
+    def pull(x: int) -> int:
+        pulled.append(x)
+        return x
+
+    result = Iter(count(8)).map(pull).try_fold(0, add_small)
+    assert result.is_err() and pulled == [8, 9, 10]
+
+
+def test_find_map() -> None:
+    assert Iter(count()).find_map(lambda x: Some(x) if x * x > 50 else Nothing()) == Some(8)
+    assert Iter(["a", "b"]).find_map(parse) is Nothing()
+
+
+def test_no_stages_and_repr() -> None:
+    assert Iter([1, 2]).collect() == [1, 2]
+    assert repr(Iter([1]).map(str).chunks(2)) == "Iter([1]).map(str).chunks(2)"
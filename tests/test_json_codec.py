@@ -0,0 +1,85 @@
+import io
+from typing import Any
+
+import pytest
+
+from rusty_utils import Err, Nothing, Ok, RemoteError, Some
+from rusty_utils import json_codec
+
+
+class CodeError(Exception):
+    def __init__(self, code: int, *, detail: str) -> None:
+        super().__init__(code)
+        self.detail = detail
+
+
+def test_tagged_schema() -> None:
+    missing: Any = "missing"
+    tree = {"user": Ok({"name": "ada", "nick": Nothing()}), "avatar": Err(missing), "ids": [Some(1), Some(None)]}
+    assert json_codec.dumps(tree) == (
+        '{"user":{"$ok":{"name":"ada","nick":{"$none":null}}},"avatar":{"$err":"missing"},'
+        '"ids":[{"$some":1},{"$some":null}]}'
+    )
+    assert json_codec.loads(json_codec.dumps(tree)) == tree
+    assert json_codec.dumps(Err(ValueError("bad", 3))) == (
+        '{"$err":{"$exception":{"type":"builtins:ValueError","message":"(\'bad\', 3)","args":["bad",3]}}}'
+    )
+
+
+def test_errors_decode_as_remote_error_unless_imported() -> None:
+    data = json_codec.dumps([Err(KeyError("k")), Err(CodeError(7, detail="x"))])
+    safe = json_codec.loads(data)
+    assert isinstance(safe[0].value, RemoteError) and safe[0].value.type_name == "builtins:KeyError"
+    imported = json_codec.loads(data.encode(), import_errors=True)
+    assert type(imported[0].value) is KeyError and imported[0].value.args == ("k",)
+    assert type(imported[1].value) is CodeError and imported[1].value.args == (7,)
+
+
+def test_default_is_used_for_other_objects() -> None:
+    assert json_codec.dumps(Ok({1, 2}), default=sorted) == '{"$ok":[1,2]}'
+    try:
+        json_codec.dumps(Ok({1}))
+    except TypeError as e:
+        assert "set" in str(e)
+    else:
+        raise AssertionError("expected TypeError")
+
+
+def test_dump_many_streams_in_chunks() -> None:
+    labels: list[Any] = [str(i) for i in range(10)]
+    items = [Ok(i) if i % 3 else Err(labels[i]) for i in range(10)]
+    text = io.StringIO()
+    json_codec.dump_many(iter(items), text, chunk_size=4)
+    assert json_codec.loads(text.getvalue()) == items
+    binary = io.BytesIO()
+    json_codec.dump_many([], binary)
+    assert binary.getvalue() == b"[]"
+    assert len(list(json_codec.iterencode_many(items, chunk_size=4))) == 4
+
+
+def test_circular_reference_is_a_value_error() -> None:
+    tree: list[Any] = [Ok(1)]
+    tree.append(Ok(tree))
+    with pytest.raises(ValueError, match="circular reference or nesting too deep"):
+        json_codec.dumps(tree)
+    with pytest.raises(ValueError, match="circular reference or nesting too deep"):
+        list(json_codec.iterencode_many([tree]))
+
+
+def test_deep_tree_is_a_value_error() -> None:
+    tree: list[Any] = []
+    for _ in range(100_000):
+        tree = [tree]
+    with pytest.raises(ValueError, match="nesting too deep"):
+        json_codec.dumps(Ok(tree))
+
+
+@pytest.mark.parametrize("document", [
+    '{"$exception": 5}', '{"$exception": {}}', '{"$exception": {"type": 1}}',
+    '{"$exception": {"type": "ValueError", "args": "x"}}',
+])
+def test_malformed_exception_payload_is_a_value_error(document: str) -> None:
+    with pytest.raises(ValueError, match="malformed"):
+        json_codec.loads(document)
+    with pytest.raises(ValueError, match="malformed"):
+        json_codec.loads(document, import_errors=True)
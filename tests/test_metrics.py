@@ -0,0 +1,104 @@
+import asyncio
+import functools
+import os
+import stat
+from typing import AsyncIterator
+
+from rusty_utils import Catch, Err, Ok
+from rusty_utils.metrics import CallbackSink, CallEvent, Metrics
+
+
+def test_counters_and_histogram() -> None:
+    metrics = Metrics(buckets=(0.5, 1.0))
+
+    @Catch(ValueError, KeyError, metrics=metrics)
+    def parse(x: str) -> int:
+        if x == "key":
+            raise KeyError(x)
+        return int(x)
+
+    assert parse("1") == Ok(1)
+    assert isinstance(parse("x"), Err)
+    parse("y")
+    parse("key")
+
+    stats = metrics.snapshot()[f"{__name__}.test_counters_and_histogram.<locals>.parse"]
+    assert (stats.ok, stats.err, stats.count) == (1, 3, 4)
+    assert stats.errors == {"ValueError": 2, "KeyError": 1}
+    assert stats.buckets == [4, 0, 0]
+
+
+def test_uncaught_exceptions_are_not_recorded() -> None:
+    metrics = Metrics()
+
+    @Catch(ValueError, metrics=metrics)
+    def boom() -> None:
+        raise RuntimeError()
+
+    try:
+        boom()
+    except RuntimeError:
+        pass
+    assert metrics.snapshot() == {}
+
+
+def test_callback_sink_and_direct_call() -> None:
+    events: list[CallEvent] = []
+    sink = CallbackSink(events.append)
+    assert Catch(ZeroDivisionError, func=lambda: 1 / 0, metrics=sink).is_err()
+    assert Catch(ZeroDivisionError, func=lambda: 1, metrics=sink) == Ok(1)
+    assert [e.ok for e in events] == [False, True]
+    assert isinstance(events[0].error, ZeroDivisionError) and events[0].seconds >= 0
+
+
+def test_partial_functions_are_named_by_repr() -> None:
+    metrics = Metrics()
+    fail = functools.partial(int, "x")
+    assert Catch(ValueError, func=fail, metrics=metrics).is_err()
+    assert Catch(ValueError, metrics=metrics)(fail)().is_err()
+    assert metrics.snapshot()[repr(fail)].err == 2
+
+
+def test_async_functions_and_generators() -> None:
+    metrics = Metrics()
+
+    @Catch(ValueError, metrics=metrics)
+    async def fetch(fail: bool) -> int:
+        if fail:
+            raise ValueError()
+        return 1
+
+    @Catch(ValueError, metrics=metrics)
+    async def stream() -> AsyncIterator[int]:
+        yield 1
+        raise ValueError()
+
+    async def main() -> list[object]:
+        items = [item async for item in stream()]
+        return [await fetch(False), await fetch(True), *items]
+
+    results = asyncio.run(main())
+    assert results[0] == Ok(1) and results[1].is_err()  # type: ignore[attr-defined]
+    assert results[2] == Ok(1) and results[3].is_err()  # type: ignore[attr-defined]
+    counts = {name.rsplit(".", 1)[-1]: (s.ok, s.err) for name, s in metrics.snapshot().items()}
+    assert counts == {"fetch": (1, 1), "stream": (0, 1)}
+
+
+def test_prometheus_export(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    metrics = Metrics(buckets=(0.1,), namespace="app")
+    metrics.record('mod."f"', None, 0.05)
+    metrics.record('mod."f"', ValueError(), 0.2)
+    text = metrics.to_prometheus()
+    assert '# TYPE app_catch_calls_total counter' in text
+    assert 'app_catch_calls_total{function="mod.\\"f\\"",outcome="ok"} 1' in text
+    assert 'app_catch_errors_total{function="mod.\\"f\\"",exception="ValueError"} 1' in text
+    assert 'app_catch_duration_seconds_bucket{function="mod.\\"f\\"",le="0.1"} 1' in text
+    assert 'app_catch_duration_seconds_bucket{function="mod.\\"f\\"",le="+Inf"} 2' in text
+    assert 'app_catch_duration_seconds_count{function="mod.\\"f\\""} 2' in text
+
+    path = tmp_path / "app.prom"
+    metrics.write_prometheus(path)
+    assert path.read_text() == text
+    if os.name == "posix":
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+    assert [p.name for p in tmp_path.iterdir()] == ["app.prom"]
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 import pytest
 
 from rusty_utils import Option, Result, UnwrapError, Err, Ok
@@ -99,3 +101,107 @@ def test_xor() -> None:
     assert Option().xor(Option(42)) == Option(42)
     assert Option(42).xor(Option(42)) == Option()
     assert Option().xor(Option()) == Option()
+
+
+def test_empty_option_is_shared() -> None:
+    assert Option() is Option(None)
+    assert Option(42).map(lambda _: None) is Option()
+    assert Option().map(lambda x: x * 2) is Option()
+
+
+def test_slotted_and_immutable() -> None:
+    import pickle
+
+    assert not hasattr(Option(42), "__dict__")
+    with pytest.raises(AttributeError):
+        Option(42).value = 0
+    assert pickle.loads(pickle.dumps(Option(42))) == Option(42)
+    assert pickle.loads(pickle.dumps(Option())) is Option()
+    assert hash(Option(42)) == hash(Option(42))
+
+
+def test_collect_options() -> None:
+    from rusty_utils import collect_options
+
+    pulled: list[int] = []
+
+    def source() -> Iterator[Option[int]]:
+        for i in range(5):
+            pulled.append(i)
+            yield Option(i) if i != 2 else Option()
+
+    assert collect_options(Option(i) for i in range(3)) == Option([0, 1, 2])
+    assert collect_options(source()) is Option()
+    assert pulled == [0, 1, 2]
+
+
+def test_filter_some() -> None:
+    from rusty_utils import filter_some
+
+    assert list(filter_some([Option(1), Option(), Option(0)])) == [1, 0]
+
+
+def test_option_hash_matches_equality() -> None:
+    assert {Option(1), Option(1), Option(), Option()} == {Option(1), Option()}
+
+
+def test_variants() -> None:
+    import pickle
+
+    from rusty_utils import Nothing, Some, collect_options, filter_some
+
+    assert type(Option(1)) is Some
+    assert Option() is Nothing() is Option(None)
+    assert isinstance(Some(1), Option) and isinstance(Nothing(), Option)
+    assert Some(None).is_some() and Some(None).unwrap() is None
+    assert Some(None) != Nothing()
+    assert Some(1) == Option(1)
+    assert repr(Some(None)) == "Some(None)"
+    assert pickle.loads(pickle.dumps(Some(None))) == Some(None)
+    assert pickle.loads(pickle.dumps(Nothing())) is Nothing()
+    assert list(filter_some([Some(None), Nothing()])) == [None]
+    present: list[Option[int | None]] = [Some(None), Some(1)]
+    assert collect_options(present) == Some([None, 1])
+
+
+def test_base_implementations_match_variants() -> None:
+    from rusty_utils import Nothing, Some
+
+    some: Option[int] = Some(2)
+    nothing: Option[int] = Nothing()
+    for o in (some, nothing):
+        assert Option.is_some(o) == o.is_some() and Option.is_none(o) == o.is_none()
+        assert Option.unwrap_or(o, 5) == o.unwrap_or(5)
+        assert Option.map(o, lambda x: x * 3) == o.map(lambda x: x * 3)
+        assert Option.map_or(o, "", str) == o.map_or("", str)
+        assert Option.and_then(o, lambda x: Some(x + 1)) == o.and_then(lambda x: Some(x + 1))
+        assert Option.or_(o, Some(9)) == o.or_(Some(9))
+        assert Option.ok_or(o, KeyError("k")) == o.ok_or(KeyError("k"))
+        for other in (some, nothing):
+            assert Option.xor(o, other) == o.xor(other)
+    with pytest.raises(UnwrapError):
+        Option.unwrap(nothing)
+
+
+def test_match() -> None:
+    from rusty_utils import Nothing, Some
+
+    def describe(o: Option[int]) -> str:
+        match o:
+            case Some(v):
+                return f"some {v}"
+            case Nothing():
+                return "nothing"
+        return "unreachable"
+
+    assert describe(Option(1)) == "some 1"
+    assert describe(Option()) == "nothing"
+    assert describe(Some(None)) == "some None"  # type: ignore[arg-type]
+
+
+def test_variant_xor() -> None:
+    empty: Option[int] = Option()
+    assert Option(1).xor(empty) == Option(1)
+    assert empty.xor(Option(2)) == Option(2)
+    assert Option(1).xor(Option(2)) is Option()
+    assert Option().xor(Option()) is Option()
@@ -0,0 +1,86 @@
+import os
+import pickle
+import threading
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+
+from rusty_utils import Ok, map_results
+
+
+def invert(x: int) -> float:
+    return 1 / x
+
+
+def crash(x: int) -> int:
+    if x == 3:
+        os._exit(1)
+    return x
+
+
+def make_lock(_: int) -> threading.Lock:
+    return threading.Lock()
+
+
+def test_ordered_results() -> None:
+    results = list(map_results(invert, [1, 0, 4], catch=(ZeroDivisionError,)))
+    assert results[0] == Ok(1.0)
+    assert isinstance(results[1].unwrap_err(), ZeroDivisionError)
+    assert results[2] == Ok(0.25)
+
+
+def test_unordered_results() -> None:
+    with ThreadPoolExecutor(4) as pool:
+        results = list(map_results(invert, range(1, 50), executor=pool, ordered=False, chunksize=7))
+    assert sorted(r.unwrap() for r in results) == sorted(1 / x for x in range(1, 50))
+
+
+def test_uncaught_exceptions_propagate() -> None:
+    with pytest.raises(ZeroDivisionError):
+        list(map_results(invert, [0], catch=(KeyError,)))
+
+
+def test_bounded_submission() -> None:
+    pulled = 0
+
+    def source() -> Iterator[int]:
+        nonlocal pulled
+        for i in range(1, 1_000):
+            pulled += 1
+            yield i
+
+    with ThreadPoolExecutor(2) as pool:
+        results = map_results(invert, source(), executor=pool, max_in_flight=3, chunksize=2)
+        next(results)
+        assert pulled <= (3 + 1) * 2
+        assert len(list(results)) == 998
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        map_results(invert, [], chunksize=0)
+    with pytest.raises(TypeError):
+        map_results(invert, [], catch=())
+
+
+def test_process_pool_pickling_failures_become_err() -> None:
+    with ProcessPoolExecutor(2) as pool:
+        results = list(map_results(make_lock, [1, 2], executor=pool))
+        assert all(isinstance(r.unwrap_err(), pickle.PicklingError) for r in results)
+
+        unpicklable_fn = list(map_results(lambda x: x, [1], executor=pool))
+        assert isinstance(unpicklable_fn[0].unwrap_err(), pickle.PicklingError)
+
+        mixed = list(map_results(repr, [1, threading.Lock(), 2], executor=pool, chunksize=3))
+        assert mixed[0] == Ok("1") and mixed[2] == Ok("2")
+        assert isinstance(mixed[1].unwrap_err(), pickle.PicklingError)
+
+        assert list(map_results(invert, [1, 2], executor=pool, chunksize=2)) == [Ok(1.0), Ok(0.5)]
+
+
+def test_process_pool_crash_becomes_err() -> None:
+    with ProcessPoolExecutor(1) as pool:
+        results = list(map_results(crash, range(6), executor=pool, max_in_flight=1))
+    assert results[:3] == [Ok(0), Ok(1), Ok(2)]
+    assert all(isinstance(r.unwrap_err(), BrokenExecutor) for r in results[3:])
@@ -0,0 +1,74 @@
+from typing import Any
+
+import pytest
+
+from rusty_utils import Err, Ok, Pipeline, Result
+
+
+def parse(s: str) -> Result[int, Exception]:
+    try:
+        return Ok(int(s))
+    except ValueError as e:
+        return Err(e)
+
+
+def to_key_error(e: Exception) -> Exception:
+    return KeyError(str(e))
+
+
+def test_builder_is_immutable() -> None:
+    base = Pipeline[str, str]().map(str.strip)
+    longer = base.map(str.upper)
+    assert len(base) == 1
+    assert len(longer) == 2
+
+
+def test_ok_path() -> None:
+    seen: list[int] = []
+    pipeline = Pipeline[str, str]().map(str.strip).and_then(parse).inspect(seen.append).map(lambda x: x * 2)
+    assert pipeline(Ok(" 21 ")) == Ok(42)
+    assert pipeline.apply(" 4") == Ok(8)
+    assert seen == [21, 4]
+
+
+def test_and_then_failure_runs_later_map_err_only() -> None:
+    calls: list[str] = []
+
+    def record(name: str, value: Any) -> Any:
+        calls.append(name)
+        return value
+
+    pipeline = (
+        Pipeline[str, str]()
+        .map_err(lambda e: record("early", e))
+        .and_then(parse)
+        .map(lambda x: record("map", x))
+        .map_err(to_key_error)
+    )
+    result = pipeline.apply("nope")
+    assert isinstance(result.unwrap_err(), KeyError)
+    assert calls == []
+
+
+def test_err_input() -> None:
+    pipeline = Pipeline[int, int]().map(lambda x: x + 1).map_err(to_key_error).map_err(lambda e: RuntimeError(e))
+    result = pipeline(Err(ValueError("bad")))
+    assert isinstance(result.unwrap_err(), RuntimeError)
+
+    passthrough: Result[int, Exception] = Err(ValueError("bad"))
+    assert Pipeline[int, int]().map(lambda x: x + 1)(passthrough) is passthrough
+
+
+def test_compile_is_cached_and_matches_method_chain() -> None:
+    pipeline = Pipeline[str, str]().map(str.strip).and_then(parse).map(abs).map_err(to_key_error)
+    run = pipeline.compile()
+    assert pipeline.compile() is run
+
+    inputs: list[Result[str, Exception]] = [Ok(" -3 "), Ok("x"), Err(ValueError("bad"))]
+    expected = [r.map(str.strip).and_then(parse).map(abs).map_err(to_key_error) for r in inputs]
+    assert list(pipeline.run_many(inputs)) == expected
+
+
+def test_stage_exceptions_propagate() -> None:
+    with pytest.raises(ZeroDivisionError):
+        Pipeline[int, int]().map(lambda x: x / 0).apply(1)
@@ -0,0 +1,221 @@
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from rusty_utils import Catch, Err, Ok
+from rusty_utils.policy import Attempts, CircuitBreaker, CircuitOpenError, Hedge, Retry, RetryBudget
+
+
+def flaky(failures: int, exc: type[Exception] = TimeoutError):  # type: ignore[no-untyped-def]
+    calls = []
+
+    @Catch(TimeoutError, ValueError)
+    def fn(x: int) -> int:
+        calls.append(x)
+        if len(calls) <= failures:
+            raise exc()
+        return x
+
+    return fn, calls
+
+
+def test_retry_until_ok() -> None:
+    fn, calls = flaky(2)
+    outcome = Retry(on=(TimeoutError,), attempts=3, base_delay=0).call(fn, 7)
+    assert outcome.result == Ok(7)
+    assert outcome.attempts == 3
+    assert [type(e) for e in outcome.errors] == [TimeoutError, TimeoutError]
+    assert len(calls) == 3
+
+
+def test_retry_gives_up_and_skips_other_types() -> None:
+    fn, calls = flaky(10)
+    outcome = Retry(on=(TimeoutError,), attempts=2, base_delay=0).call(fn, 1)
+    assert isinstance(outcome.result, Err) and outcome.attempts == 2 and len(outcome.errors) == 2
+
+    fn, calls = flaky(10, ValueError)
+    outcome = Retry(on=(TimeoutError,), attempts=5, base_delay=0).call(fn, 1)
+    assert outcome.attempts == 1 and len(calls) == 1
+
+
+def test_retry_backoff_delays() -> None:
+    slept: list[float] = []
+    fn, _ = flaky(10)
+    Retry(on=(TimeoutError,), attempts=5, base_delay=1, multiplier=2, max_delay=5, jitter=False,
+          sleep=slept.append).call(fn, 1)
+    assert slept == [1, 2, 4, 5]
+
+    policy = Retry(base_delay=1, multiplier=2, max_delay=5)
+    assert all(0 <= policy.delay(3) <= 4 for _ in range(100))
+
+
+def test_retry_budget() -> None:
+    budget = RetryBudget(ratio=0, min_retries=2, timer=lambda: 0.0)
+    policy = Retry(on=(TimeoutError,), attempts=10, base_delay=0, budget=budget)
+    fn, calls = flaky(100)
+    assert policy.call(fn, 1).attempts == 3
+    assert policy.call(fn, 1).attempts == 1
+
+
+def test_retry_decorator_sync_and_async() -> None:
+    fn, _ = flaky(1)
+    assert Retry(on=(TimeoutError,), base_delay=0)(fn)(3) == Ok(3)
+
+    calls = 0
+
+    @Retry(on=(TimeoutError,), base_delay=0)
+    @Catch(TimeoutError)
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise TimeoutError()
+        return "done"
+
+    assert asyncio.run(fetch()) == Ok("done")
+    assert calls == 2
+
+
+def test_hedge_takes_first_ok() -> None:
+    release = threading.Event()
+    calls = 0
+    lock = threading.Lock()
+
+    @Catch(TimeoutError)
+    def fn() -> int:
+        nonlocal calls
+        with lock:
+            calls += 1
+            n = calls
+        if n == 1:
+            release.wait(5)  # the slow primary
+        return n
+
+    outcome = Hedge(delay=0.01).call(fn)
+    release.set()
+    assert outcome.result == Ok(2)
+    assert outcome.attempts == 2
+
+
+def test_hedge_returns_last_err_when_all_fail() -> None:
+    fn, calls = flaky(10)
+    outcome = Hedge(delay=0, max_attempts=3).call(fn, 1)
+    assert isinstance(outcome.result, Err)
+    assert outcome.attempts == 3 and len(outcome.errors) == 3
+
+
+def test_hedge_async_cancels_losers() -> None:
+    cancelled = []
+
+    @Catch(TimeoutError)
+    async def fetch(delay: float) -> float:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return delay
+
+    delays = iter([1.0, 0.0])
+
+    async def call() -> Attempts[float, TimeoutError]:
+        outcome = await Hedge(delay=0.01).call_async(lambda: fetch(next(delays)))
+        await asyncio.sleep(0)
+        return outcome
+
+    outcome = asyncio.run(call())
+    assert outcome.result == Ok(0.0) and outcome.attempts == 2
+    assert cancelled == [True]
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        Retry(attempts=0)
+    with pytest.raises(TypeError):
+        Retry(on=(int,))  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        Hedge(delay=-1)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_breaker_opens_probes_and_closes() -> None:
+    clock = FakeClock()
+    changes = []
+    breaker = CircuitBreaker(failure_ratio=0.6, min_calls=4, window=10.0, reset_timeout=5.0, timer=clock,
+                             on_state_change=lambda old, new: changes.append(new))
+    fn, calls = flaky(2)
+    guarded = breaker(fn)
+    assert [guarded(1) for _ in range(3)][2] == Ok(1)
+    assert breaker.state == "closed"
+    guarded(1)
+    assert breaker.stats()[:3] == ("closed", 4, 2)
+
+    fn, calls = flaky(10)
+    guarded = breaker(fn)
+    assert isinstance(guarded(1), Err)  # 3 of 5
+    assert breaker.state == "open" and len(calls) == 1
+
+    rejected = guarded(1)
+    assert isinstance(rejected.value, CircuitOpenError) and rejected.value.retry_after == 5.0
+    assert len(calls) == 1 and breaker.stats().rejected == 1
+
+    clock.now = 5.0
+    assert breaker.state == "half_open"
+    assert isinstance(guarded(1).value, TimeoutError)
+    assert breaker.state == "open"
+
+    clock.now = 10.0
+    assert breaker(lambda: Ok("up"))() == Ok("up")
+    assert breaker.stats() == ("closed", 0, 0, 1, 2)
+    assert changes == ["open", "half_open", "open", "half_open", "closed"]
+
+
+def test_circuit_breaker_ignores_other_errs_and_stale_outcomes() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(min_calls=1, on=(TimeoutError,), reset_timeout=1.0, timer=clock)
+    assert breaker.call(lambda: Err(KeyError("missing"))).is_err()
+    assert breaker.state == "closed"
+
+    token = breaker._admit()
+    breaker.call(lambda: Err(TimeoutError()))
+    assert breaker.state == "open"
+    breaker._record(token, False)  # type: ignore[arg-type]
+    assert breaker.state == "open"
+
+    def boom() -> Ok[int, TimeoutError]:
+        raise RuntimeError("escaped")
+
+    clock.now = 1.0
+    with pytest.raises(RuntimeError):
+        breaker.call(boom)
+    assert breaker.state == "open" and breaker.stats().opened == 2
+
+
+def test_circuit_breaker_async_limits_probes() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(min_calls=1, reset_timeout=1.0, half_open_calls=1, timer=clock)
+    breaker.call(lambda: Err(ValueError()))
+    clock.now = 1.0
+    started = []
+
+    @breaker
+    async def probe() -> Ok[int, ValueError]:
+        started.append(True)
+        await asyncio.sleep(0.01)
+        return Ok(1)
+
+    async def main() -> list[Any]:
+        return list(await asyncio.gather(probe(), probe()))
+
+    first, second = asyncio.run(main())
+    assert first == Ok(1) and isinstance(second.value, CircuitOpenError)
+    assert len(started) == 1 and breaker.state == "closed"
@@ -1,6 +1,11 @@
+import gc
+import weakref
+from typing import Any, Callable, Iterator
+
 import pytest
 
-from rusty_utils import Result, UnwrapError, Ok, Err
+from rusty_utils import Catch, Result, UnwrapError, Ok, Err
+from rusty_utils.result import TracebackMode
 
 
 class TestException(Exception):
@@ -163,3 +168,327 @@ def test_catch() -> None:
             bad_result.unwrap_or_raise()
 
     process()
+
+
+def test_slotted_and_immutable() -> None:
+    result: ResT = Ok(42)
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(AttributeError):
+        result.value = 0
+    with pytest.raises(AttributeError):
+        Err(get_exception()).value = get_exception()
+
+
+def test_cached_ok_instances() -> None:
+    assert Ok(None) is Ok(None)
+    assert Ok(True) is Ok(True)
+    assert Ok(False) is Ok(False)
+    assert Ok(1) is not Ok(True)
+    assert Ok(1).value == 1 and type(Ok(1).value) is int
+
+
+def test_passthrough_does_not_allocate() -> None:
+    ok: ResT = Ok(42)
+    err: ResT = Err(get_exception())
+    assert ok.map_err(lambda e: e) is ok
+    assert ok.or_(Ok(0)) is ok
+    assert err.map(lambda x: x * 2) is err
+    assert err.and_(Ok(0)) is err
+
+
+def test_pickle_and_match() -> None:
+    import pickle
+
+    assert pickle.loads(pickle.dumps(Ok(42))) == Ok(42)
+    assert pickle.loads(pickle.dumps(Ok(None))) is Ok(None)
+    assert pickle.loads(pickle.dumps(Err(ValueError("x")))) == Err(ValueError("x"))
+
+    match Ok(42):
+        case Ok(value):
+            assert value == 42
+        case _:
+            pytest.fail("Ok did not match")
+
+
+def test_and_then_or_else() -> None:
+    ok: ResT = Ok(2)
+    err: ResT = Err(get_exception())
+    assert ok.and_then(lambda x: Ok(x * 2)) == Ok(4)
+    assert err.and_then(lambda x: Ok(x * 2)) is err
+    assert ok.or_else(lambda e: Ok(0)) is ok
+    assert err.or_else(lambda e: Ok(0)) == Ok(0)
+
+
+def test_catch_coroutine_function() -> None:
+    import asyncio
+    from rusty_utils import Catch
+
+    @Catch(ZeroDivisionError)
+    async def divide(a: int, b: int) -> float:
+        await asyncio.sleep(0)
+        return a / b
+
+    async def bad() -> float:
+        return 1 / 0
+
+    async def main() -> None:
+        assert await divide(4, 2) == Ok(2.0)
+        err = await divide(1, 0)
+        assert isinstance(err.unwrap_err(), ZeroDivisionError)
+        direct = await Catch(ZeroDivisionError, func=bad)
+        assert direct.is_err()
+
+    asyncio.run(main())
+
+
+def test_catch_async_generator() -> None:
+    import asyncio
+    from typing import AsyncIterator
+    from rusty_utils import Catch
+
+    @Catch(ValueError)
+    async def numbers() -> AsyncIterator[int]:
+        yield 1
+        yield 2
+        raise ValueError("stop")
+
+    async def main() -> list[Result[int, ValueError]]:
+        return [r async for r in numbers()]
+
+    results = asyncio.run(main())
+    assert results[:2] == [Ok(1), Ok(2)]
+    assert results[2].is_err() and len(results) == 3
+
+    async def raw() -> AsyncIterator[int]:
+        yield 1
+        raise ValueError("stop")
+
+    async def direct() -> list[Result[int, ValueError]]:
+        return [r async for r in Catch(ValueError, func=raw)]
+
+    direct_results = asyncio.run(direct())
+    assert direct_results[0] == Ok(1)
+    assert direct_results[1].is_err() and len(direct_results) == 2
+
+
+def test_async_combinators() -> None:
+    import asyncio
+
+    async def double(x: int) -> int:
+        return x * 2
+
+    async def check(x: int) -> ResT:
+        return Ok(x) if x < 10 else Err(get_exception("too big"))
+
+    async def rename(_: Exception) -> Exception:
+        return get_exception("renamed")
+
+    async def main() -> None:
+        ok: ResT = Ok(3)
+        err: ResT = Err(get_exception())
+        assert await ok.map_async(double) == Ok(6)
+        assert await err.map_async(double) is err
+        assert await ok.and_then_async(check) == Ok(3)
+        big: ResT = Ok(30)
+        assert (await big.and_then_async(check)).is_err()
+        assert await err.and_then_async(check) is err
+        assert await ok.map_err_async(rename) is ok
+        assert (await err.map_err_async(rename)).unwrap_err() == get_exception("renamed")
+
+    asyncio.run(main())
+
+
+def test_collect_stops_at_first_err() -> None:
+    from rusty_utils import collect
+
+    pulled: list[int] = []
+
+    def source() -> Iterator[ResT]:
+        for i in range(5):
+            pulled.append(i)
+            yield Ok(i) if i != 2 else Err(get_exception(str(i)))
+
+    assert collect(Ok(i) for i in range(3)) == Ok([0, 1, 2])
+    assert collect([]) == Ok([])
+    assert collect(source()).is_err()
+    assert pulled == [0, 1, 2]
+
+
+def test_partition_and_filters() -> None:
+    from rusty_utils import partition, filter_ok, filter_err
+
+    results: list[ResT] = [Ok(1), Err(get_exception("a")), Ok(2), Err(get_exception("b"))]
+    oks, errs = partition(iter(results))
+    assert oks == [1, 2]
+    assert [str(e) for e in errs] == ["a", "b"]
+    assert list(filter_ok(results)) == [1, 2]
+    assert [str(e) for e in filter_err(results)] == ["a", "b"]
+
+
+class Payload:
+    pass
+
+
+def _fail_holding(ref: list["weakref.ref[Payload]"]) -> int:
+    payload = Payload()
+    ref.append(weakref.ref(payload))
+    raise ValueError("failed while holding a payload")
+
+
+@pytest.mark.parametrize("mode, retained", [("keep", True), ("drop", False), ("summary", False)])
+def test_catch_traceback_retention(mode: TracebackMode, retained: bool) -> None:
+    from rusty_utils import Catch
+
+    refs: list[weakref.ref[Payload]] = []
+    result = Catch(ValueError, traceback=mode)(_fail_holding)(refs)
+    gc.collect()
+    assert result.is_err()
+    assert (refs[0]() is not None) is retained
+
+
+def test_catch_traceback_summary() -> None:
+    from rusty_utils import Catch
+
+    refs: list[weakref.ref[Payload]] = []
+    result = Catch(ValueError, func=lambda: _fail_holding(refs), traceback="summary")
+    assert isinstance(result, Err)
+    assert result.value.__traceback__ is None
+    summary = result.traceback
+    assert summary is not None
+    assert summary.frames[-1][2] == "_fail_holding"
+    text = summary.format()
+    assert "raise ValueError" in text
+    assert text.endswith("ValueError: failed while holding a payload\n")
+
+
+def test_catch_drops_chained_tracebacks() -> None:
+    from rusty_utils import Catch
+
+    def chained() -> None:
+        try:
+            raise KeyError("inner")
+        except KeyError as e:
+            raise ValueError("outer") from e
+
+    error = Catch(ValueError, func=chained, traceback="drop").unwrap_err()
+    assert error.__traceback__ is None
+    assert error.__cause__ is not None and error.__cause__.__traceback__ is None
+
+
+def test_catch_rejects_unknown_traceback_mode() -> None:
+    from rusty_utils import Catch
+
+    with pytest.raises(ValueError):
+        Catch(ValueError, traceback="sometimes")  # type: ignore[call-overload]
+
+
+def test_err_structural_equality() -> None:
+    assert Err(ValueError("x")) == Err(ValueError("x"))
+    assert Err(ValueError("x")) != Err(TypeError("x"))
+    assert Err(ValueError("x")) != Err(ValueError("x", 1))
+    assert Err(ValueError("x")) != Ok(ValueError("x"))
+    plain: Any = "plain"
+    assert Err(plain) == Err(plain)
+
+
+def test_err_hash_is_consistent_and_cached() -> None:
+    errors = [Err(ValueError("x")), Err(ValueError("x")), Err(KeyError("k")), Err(ValueError([1]))]
+    assert len(set(errors)) == 3
+    assert hash(Err(ValueError([1]))) == hash(Err(ValueError([1])))
+
+    err: Err[Any, ValueError] = Err(ValueError("cached"))
+    assert err._identity_cache is None
+    hash(err)
+    assert err._identity_cache is not None
+
+
+def test_results_as_dict_keys() -> None:
+    counts: dict[ResT, int] = {}
+    items: list[ResT] = [Ok(1), Ok(1), Err(get_exception("a")), Err(get_exception("a"))]
+    for r in items:
+        counts[r] = counts.get(r, 0) + 1
+    assert counts == {Ok(1): 2, Err(get_exception("a")): 2}
+
+
+def test_catch_context_manager() -> None:
+    with Catch(KeyError) as slot:
+        slot.value = {"a": 1}["a"]
+    assert slot.result == Ok(1)
+
+    with Catch(KeyError, ValueError) as either:
+        {}["missing"]  # type: ignore[index]
+    assert isinstance(either.result, Err) and isinstance(either.result.value, KeyError)
+
+    with Catch(KeyError) as slot:
+        pass
+    assert slot.result is Ok(None)
+
+    with pytest.raises(TypeError):
+        with Catch(KeyError):
+            raise TypeError()
+
+
+def test_catch_context_manager_traceback_mode() -> None:
+    with Catch(ValueError, traceback="drop") as slot:
+        raise ValueError()
+    assert slot.result is not None and slot.result.unwrap_err().__traceback__ is None
+
+
+def test_catch_direct_call_with_arguments() -> None:
+    def divide(a: int, b: int = 1) -> float:
+        return a / b
+
+    assert Catch(ZeroDivisionError, func=divide, args=(6,), kwargs={"b": 3}) == Ok(2.0)
+    assert Catch(ZeroDivisionError, func=divide, args=(6, 0)).is_err()
+
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    import asyncio
+    assert asyncio.run(Catch(ValueError, func=add, args=(1, 2))) == Ok(3)
+
+    from functools import partial
+    add_one = partial(add, 1)
+    assert asyncio.run(Catch(ValueError, func=add_one, args=(2,))) == Ok(3)
+    assert asyncio.run(Catch(ValueError, func=add_one, args=(3,))) == Ok(4)
+
+
+def test_match_err_and_handle_dispatch_through_the_mro() -> None:
+    from rusty_utils import ErrorDispatcher
+
+    handlers: dict[type[BaseException], Callable[[Any], Any]] = {
+        LookupError: lambda e: Ok("lookup"),
+        KeyError: lambda e: Ok("key"),
+        OSError: lambda e: Err(RuntimeError("wrapped")),
+    }
+    dispatcher = ErrorDispatcher(handlers)
+    for h in (handlers, dispatcher):
+        assert Err(KeyError()).match_err(h) == Ok("key")  # most specific wins
+        assert Err(IndexError()).match_err(h) == Ok("lookup")
+        assert Err(TimeoutError()).match_err(h).unwrap_err().args == ("wrapped",)
+        unmatched: Result[Any, ValueError] = Err(ValueError())
+        assert unmatched.match_err(h) is unmatched
+        assert Ok(1).match_err(h) == Ok(1)
+
+    on_error = ErrorDispatcher({KeyError: lambda e: -1})
+    assert Err(KeyError()).handle(on_error) == -1
+    assert Ok(5).handle(on_error) == 5
+    with pytest.raises(ValueError):
+        Err(ValueError()).handle(on_error)
+    with pytest.raises(ValueError):
+        on_error(ValueError())
+    assert on_error(KeyError()) == -1
+
+
+def test_error_dispatcher_caches_per_class() -> None:
+    from rusty_utils import ErrorDispatcher
+
+    class Custom(KeyError):
+        pass
+
+    dispatcher = ErrorDispatcher({LookupError: len})
+    assert dispatcher.resolve(Custom) is len
+    assert dispatcher.resolve(ValueError) is None
+    assert dispatcher._cache == {Custom: len, ValueError: None}
+    with pytest.raises(TypeError):
+        ErrorDispatcher({int: len})  # type: ignore[dict-item]
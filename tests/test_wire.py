@@ -0,0 +1,73 @@
+import pickle
+from typing import Any
+
+from rusty_utils import Err, Ok, Option, RemoteError, Result, Some
+from rusty_utils import wire
+
+
+class CodeError(Exception):
+    def __init__(self, code: int, *, detail: str) -> None:
+        super().__init__(f"{code}: {detail}")
+        self.code = code
+
+
+def test_round_trip_batch() -> None:
+    items: list[Result[Any, Exception] | Option[Any]] = [
+        Ok(1), Ok({"a": [1, 2]}), Err(ValueError("bad")), Option(3), Option(), Ok(None)
+    ]
+    decoded = wire.loads_many(wire.dumps_many(items))
+    assert decoded == items
+    assert decoded[4] is Option()
+    assert decoded[5] is Ok(None)
+
+
+def test_some_none_round_trips() -> None:
+    assert wire.loads(wire.dumps(Some(None))) == Some(None)
+
+
+def test_single_value() -> None:
+    assert wire.loads(wire.dumps(Ok("x"))) == Ok("x")
+    assert wire.loads(wire.dumps(Err("not an exception"))).unwrap_err() == "not an exception"  # type: ignore[union-attr]
+
+
+def test_error_with_custom_init_round_trips() -> None:
+    decoded = wire.loads(wire.dumps(Err(CodeError(7, detail="boom"))))
+    error = decoded.unwrap_err()  # type: ignore[union-attr]
+    assert type(error) is CodeError
+    assert error.code == 7
+    assert str(error) == "7: boom"
+
+
+def test_unknown_type_becomes_remote_error() -> None:
+    class LocalError(Exception):
+        pass
+
+    decoded = wire.loads(wire.dumps(Err(LocalError("gone"))))
+    error = decoded.unwrap_err()  # type: ignore[union-attr]
+    assert isinstance(error, RemoteError)
+    assert error.type_name.endswith("LocalError")
+    assert error.args == ("gone",)
+
+
+def test_traceback_is_optional() -> None:
+    try:
+        raise ValueError("with traceback")
+    except ValueError as e:
+        err: Result[int, ValueError] = Err(e)
+
+    plain = wire.loads(wire.dumps(err)).unwrap_err()  # type: ignore[union-attr]
+    assert not getattr(plain, "__notes__", None)
+
+    detailed = wire.loads(wire.dumps(err, traceback=True)).unwrap_err()  # type: ignore[union-attr]
+    assert "test_traceback_is_optional" in detailed.__notes__[0]
+
+
+def test_unpicklable_args_are_replaced_by_repr() -> None:
+    decoded = wire.loads(wire.dumps(Err(ValueError(lambda: None))))
+    assert isinstance(decoded.unwrap_err().args[0], str)  # type: ignore[union-attr]
+
+
+def test_err_pickle_uses_type_args_and_state() -> None:
+    restored = pickle.loads(pickle.dumps(Err(CodeError(3, detail="x"))))
+    assert restored.value.code == 3
+    assert str(restored.value) == "3: x"